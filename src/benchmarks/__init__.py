@@ -0,0 +1,5 @@
+"""
+Benchmarks for the pattern implementations.
+
+Run from the `src` directory, e.g. `python -m benchmarks.bench_singleton`.
+"""
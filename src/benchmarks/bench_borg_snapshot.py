@@ -0,0 +1,92 @@
+"""Read throughput of the Borg implementations under concurrent writes."""
+
+import threading
+import time
+from typing import Any, Callable, Tuple
+
+from patterns.singleton.singleton_borg import Borg
+from patterns.singleton.singleton_borg_snapshot import SnapshotBorg
+
+READS_PER_THREAD = 200_000
+READER_COUNTS = (1, 4, 16)
+
+
+def run(read: Callable[[], Tuple[Any, Any]], write: Callable[[int], None], readers: int) -> Tuple[float, int]:
+    """
+    Let `readers` threads read both values while one thread keeps writing.
+
+    Args:
+        read: Function returning the pair of values
+        write: Function updating both values to the given number
+        readers: Number of reader threads
+
+    Returns:
+        tuple: Reads per second and the number of torn reads (pair values differed)
+    """
+    stop = threading.Event()
+    torn = [0] * readers
+
+    def writer() -> None:
+        value = 0
+        while not stop.is_set():
+            value += 1
+            write(value)
+
+    def reader(index: int) -> None:
+        for _ in range(READS_PER_THREAD):
+            left, right = read()
+            if left != right:
+                torn[index] += 1
+
+    write_thread = threading.Thread(target=writer)
+    read_threads = [threading.Thread(target=reader, args=(index,)) for index in range(readers)]
+    write_thread.start()
+    start = time.perf_counter()
+    for thread in read_threads:
+        thread.start()
+    for thread in read_threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    stop.set()
+    write_thread.join()
+
+    return readers * READS_PER_THREAD / elapsed, sum(torn)
+
+
+def main() -> None:
+    """
+    Print read throughput and torn reads for the plain and the snapshot Borg.
+
+    Returns:
+        None
+    """
+    borg = Borg()
+    snapshot_borg = SnapshotBorg()
+    borg.left = borg.right = 0
+    snapshot_borg.update(left=0, right=0)
+
+    def borg_write(value: int) -> None:
+        borg.left = value
+        borg.right = value
+
+    def snapshot_read() -> Tuple[Any, Any]:
+        snapshot = snapshot_borg.snapshot()
+        return snapshot.left, snapshot.right  # pylint: disable=no-member
+
+    def snapshot_write(value: int) -> None:
+        snapshot_borg.update(left=value, right=value)
+
+    implementations = {
+        "Borg": (lambda: (borg.left, borg.right), borg_write),
+        "SnapshotBorg": (snapshot_read, snapshot_write),
+    }
+
+    print(f"{'readers':>8}{'implementation':>16}{'reads/s':>16}{'torn reads':>12}")
+    for readers in READER_COUNTS:
+        for name, (read, write) in implementations.items():
+            throughput, torn = run(read, write, readers)
+            print(f"{readers:>8}{name:>16}{throughput:>16,.0f}{torn:>12}")
+
+
+if __name__ == "__main__":
+    main()
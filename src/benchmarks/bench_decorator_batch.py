@@ -0,0 +1,82 @@
+"""Batch pricing of orders, directly and from their encoding, versus calling `get_cost()` per order."""
+
+import time
+from typing import Callable, List
+
+from patterns.decorator.decorator import (
+    BasicCoffee,
+    Coffee,
+    MilkDecorator,
+    SugarDecorator,
+)
+from patterns.decorator.decorator_batch import (
+    NUMPY_AVAILABLE,
+    encode_orders,
+    price_encoded,
+    price_orders,
+)
+
+ORDERS = 200_000
+MAX_ADDONS = 6
+
+
+def orders() -> List[Coffee]:
+    """
+    Build ORDERS coffees with 0 to MAX_ADDONS - 1 add-ons each.
+
+    Returns:
+        list: Decorated coffees
+    """
+    result: List[Coffee] = []
+    for index in range(ORDERS):
+        coffee: Coffee = BasicCoffee()
+        for addon in range(index % MAX_ADDONS):
+            coffee = MilkDecorator(coffee) if addon % 2 else SugarDecorator(coffee)
+        result.append(coffee)
+    return result
+
+
+def timed(price: Callable[[], List[float]]) -> float:
+    """
+    Measure one pricing run.
+
+    Args:
+        price: Function pricing all orders
+
+    Returns:
+        float: Milliseconds
+    """
+    start = time.perf_counter()
+    price()
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    """
+    Print the time needed to price all orders per approach.
+
+    Returns:
+        None
+    """
+    batch = orders()
+    # Encoding walks every decorator chain; it is paid once and repeated only when the orders change
+    start = time.perf_counter()
+    base_costs, kinds, counts = encode_orders(batch)
+    encode_time = (time.perf_counter() - start) * 1000
+    prices = [kind.addon_cost for kind in kinds]
+
+    approaches = {
+        "get_cost() per order": lambda: [order.get_cost() for order in batch],
+        "price_orders": lambda: price_orders(batch),
+        "price_encoded, array fallback": lambda: price_encoded(base_costs, prices, counts, use_numpy=False),
+    }
+    if NUMPY_AVAILABLE:
+        approaches["price_encoded, NumPy"] = lambda: price_encoded(base_costs, prices, counts, use_numpy=True)
+
+    print(f"{ORDERS:,} orders, encoded once in {encode_time:.1f} ms")
+    for name, price in approaches.items():
+        print(f"{name:>32}{timed(price):>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Cost of pricing a decorated coffee through the recursive chain versus the compiled one."""
+
+import timeit
+from typing import Callable
+
+from patterns.decorator.decorator import (
+    BasicCoffee,
+    Coffee,
+    MilkDecorator,
+    SugarDecorator,
+)
+from patterns.decorator.decorator_compiled import CompiledCoffee
+
+DEPTHS = (1, 10, 100, 1000)
+NUMBER = 1000
+
+
+def build(depth: int) -> Coffee:
+    """
+    Build a chain of `depth` alternating milk and sugar decorators.
+
+    Args:
+        depth: Number of decorators
+
+    Returns:
+        Coffee: The decorated coffee
+    """
+    coffee: Coffee = BasicCoffee()
+    for index in range(depth):
+        coffee = MilkDecorator(coffee) if index % 2 else SugarDecorator(coffee)
+    return coffee
+
+
+def per_call(coffee: Coffee) -> str:
+    """
+    Measure the time of one `get_cost()` plus `get_description()` call.
+
+    Args:
+        coffee: Coffee to price
+
+    Returns:
+        str: Microseconds per call, or the error raised
+    """
+    price: Callable[[], object] = lambda: (coffee.get_cost(), coffee.get_description())
+    try:
+        seconds = min(timeit.repeat(price, number=NUMBER, repeat=3)) / NUMBER
+    except RecursionError:
+        return "RecursionError"
+    return f"{seconds * 1e6:.2f} us"
+
+
+def main() -> None:
+    """
+    Print the time per call at each depth.
+
+    Returns:
+        None
+    """
+    print(f"{'depth':>6}{'chain':>18}{'compiled':>12}")
+    for depth in DEPTHS:
+        coffee = build(depth)
+        print(f"{depth:>6}{per_call(coffee):>18}{per_call(CompiledCoffee(coffee)):>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Cost of calling a stack of nested tag decorators versus the fused equivalent."""
+
+import timeit
+from typing import Any, Callable, List, Type
+
+from patterns.decorator.decorator_texts import TagDecorator, fuse_tags
+
+DEPTHS = (1, 3, 10, 30)
+NUMBER = 100_000
+
+
+def greet(name: str) -> str:
+    """
+    Function to decorate.
+
+    Args:
+        name: Name to greet
+
+    Returns:
+        str: The greeting
+    """
+    return f"Hello, {name}!"
+
+
+def tag_classes(depth: int) -> List[Type[TagDecorator]]:
+    """
+    Create `depth` distinct tag decorator classes.
+
+    Args:
+        depth: Number of classes
+
+    Returns:
+        list: Tag decorator classes
+    """
+    return [type(f"Tag{index}Decorator", (TagDecorator,), {"tag": f"t{index}"}) for index in range(depth)]
+
+
+def per_call(func: Callable[[str], Any]) -> float:
+    """
+    Measure the time of one call.
+
+    Args:
+        func: Decorated function
+
+    Returns:
+        float: Nanoseconds per call
+    """
+    return min(timeit.repeat(lambda: func("John"), number=NUMBER, repeat=3)) / NUMBER * 1e9
+
+
+def main() -> None:
+    """
+    Print the time per call at each depth.
+
+    Returns:
+        None
+    """
+    print(f"{'depth':>6}{'nested':>12}{'fused':>12}")
+    for depth in DEPTHS:
+        classes = tag_classes(depth)
+        nested: Callable[[str], Any] = greet
+        for decorator in reversed(classes):
+            nested = decorator(nested)
+        fused = fuse_tags(*classes)(greet)
+        if nested("John") != fused("John"):
+            raise RuntimeError(f"Fused tags differ from nested tags at depth {depth}")
+        print(f"{depth:>6}{per_call(nested):>9.0f} ns{per_call(fused):>9.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Overhead of the instrumentation decorator, enabled and disabled, over a bare function call."""
+
+import timeit
+from typing import Callable
+
+from patterns.decorator.decorator_instrument import disable, enable, export, instrument
+
+NUMBER = 200_000
+
+
+def add(value_a: int, value_b: int) -> int:
+    """
+    Function to instrument.
+
+    Args:
+        value_a: First number
+        value_b: Second number
+
+    Returns:
+        int: The sum
+    """
+    return value_a + value_b
+
+
+def per_call(func: Callable[[int, int], int]) -> float:
+    """
+    Measure the time of one call.
+
+    Args:
+        func: Function to call
+
+    Returns:
+        float: Nanoseconds per call
+    """
+    return min(timeit.repeat(lambda: func(1, 2), number=NUMBER, repeat=5)) / NUMBER * 1e9
+
+
+def main() -> None:
+    """
+    Print the time per call of the bare and the instrumented function.
+
+    Returns:
+        None
+    """
+    instrumented = instrument("add")(add)
+    print(f"{'bare':>10}{per_call(add):>9.0f} ns")
+    disable()
+    print(f"{'disabled':>10}{per_call(instrumented):>9.0f} ns")
+    enable()
+    print(f"{'enabled':>10}{per_call(instrumented):>9.0f} ns")
+    print(export()["add"])
+
+
+if __name__ == "__main__":
+    main()
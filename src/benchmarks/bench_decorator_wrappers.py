@@ -0,0 +1,135 @@
+"""Per-call overhead of the metadata-preserving wrappers versus the previous plain ones."""
+
+import timeit
+from typing import Any, Callable
+
+from patterns.decorator.decorator_multiply import multiply_decorator
+from patterns.decorator.decorator_texts import BoldDecorator
+
+NUMBER = 200_000
+
+
+def add(value_a: int, value_b: int) -> int:
+    """
+    Function to decorate.
+
+    Args:
+        value_a: First number
+        value_b: Second number
+
+    Returns:
+        int: The sum
+    """
+    return value_a + value_b
+
+
+def add_with_default(value_a: int, value_b: int = 0) -> int:
+    """
+    Function to decorate, the default makes `multiply_decorator` fall back to its `*args, **kwargs` wrapper.
+
+    Args:
+        value_a: First number
+        value_b: Second number
+
+    Returns:
+        int: The sum
+    """
+    return value_a + value_b
+
+
+def greet(name: str) -> str:
+    """
+    Function to decorate.
+
+    Args:
+        name: Name to greet
+
+    Returns:
+        str: The greeting
+    """
+    return f"Hello, {name}!"
+
+
+def previous_multiply(factor: int) -> Callable[[Callable[..., int]], Callable[..., int]]:
+    """
+    The previous `multiply_decorator`, a plain `*args` closure.
+
+    Args:
+        factor: Factor to multiply by
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: Callable[..., int]) -> Callable[..., int]:
+        def wrapper(*args: int) -> int:
+            return func(*args) * factor
+
+        return wrapper
+
+    return decorator
+
+
+class PreviousBoldDecorator:  # pylint: disable=too-few-public-methods
+    """
+    The previous `BoldDecorator`, without metadata or method binding.
+    """
+
+    def __init__(self, func: Callable[..., str]) -> None:
+        """
+        Initialize the decorator with the decorated function.
+
+        Args:
+            func: The decorated function.
+        """
+        self._func = func
+
+    def __call__(self, *args: str) -> str:
+        """
+        Call the decorated function and wrap its output in <b> tags.
+
+        Args:
+            *args: The decorated function's positional arguments.
+
+        Returns:
+            The decorated function's output wrapped in <b> tags.
+        """
+        return f"<b>{self._func(*args)}</b>"
+
+
+def per_call(call: Callable[[], Any]) -> str:
+    """
+    Measure the time of one call.
+
+    Args:
+        call: Call to measure
+
+    Returns:
+        str: Nanoseconds per call
+    """
+    return f"{min(timeit.repeat(call, number=NUMBER, repeat=5)) / NUMBER * 1e9:>9.0f} ns"
+
+
+def main() -> None:
+    """
+    Print the time per call of each wrapper.
+
+    Returns:
+        None
+    """
+    previous_add = previous_multiply(2)(add)
+    current_add = multiply_decorator(2)(add)
+    generic_add = multiply_decorator(2)(add_with_default)
+    previous_greet = PreviousBoldDecorator(greet)
+    current_greet = BoldDecorator(greet)
+    print(f"{'multiply, bare':<26}{per_call(lambda: add(1, 2))}")
+    print(f"{'multiply, previous':<26}{per_call(lambda: previous_add(1, 2))}")
+    print(f"{'multiply, current':<26}{per_call(lambda: current_add(1, 2))}")
+    print(f"{'multiply, generic':<26}{per_call(lambda: generic_add(1, 2))}")
+    print(f"{'bold, bare':<26}{per_call(lambda: greet('John'))}")
+    print(f"{'bold, previous':<26}{per_call(lambda: previous_greet('John'))}")
+    print(f"{'bold, current':<26}{per_call(lambda: current_greet('John'))}")
+
+
+if __name__ == "__main__":
+    main()
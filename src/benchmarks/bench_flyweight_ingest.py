@@ -0,0 +1,97 @@
+"""Bulk ingestion versus the per-character loop at 1M characters."""
+
+import time
+from typing import Callable, List, Tuple, Union
+
+from patterns.flyweight.flyweight import TextEditorClient
+from patterns.flyweight.flyweight_compact import CompactTextEditorClient
+
+SIZE = 1_000_000
+TEXT = "The quick brown fox jumps over the lazy dog. "
+FONTS = ("Arial", "Times New Roman", "Verdana")
+RUN_LENGTH = 1000
+
+Editor = Union[TextEditorClient, CompactTextEditorClient]
+
+
+def document() -> List[Tuple[str, str]]:
+    """
+    Build a document of SIZE characters as runs of text and font.
+
+    Returns:
+        list: Pairs of text and font
+    """
+    text = (TEXT * (SIZE // len(TEXT) + 1))[:SIZE]
+    return [
+        (text[start : start + RUN_LENGTH], FONTS[index % len(FONTS)])
+        for index, start in enumerate(range(0, SIZE, RUN_LENGTH))
+    ]
+
+
+def per_character(editor: Editor, runs: List[Tuple[str, str]]) -> None:
+    """
+    Add the document one character at a time.
+
+    Args:
+        editor: Editor to fill
+        runs: Pairs of text and font
+
+    Returns:
+        None
+    """
+    for text, font in runs:
+        for char in text:
+            editor.add_character(char, font)
+
+
+def bulk(editor: Editor, runs: List[Tuple[str, str]]) -> None:
+    """
+    Add the document with the bulk API.
+
+    Args:
+        editor: Editor to fill
+        runs: Pairs of text and font
+
+    Returns:
+        None
+    """
+    editor.extend(runs)
+
+
+def timed(factory: Callable[[], Editor], fill: Callable[[Editor, List[Tuple[str, str]]], None]) -> float:
+    """
+    Measure how long it takes to fill a new editor.
+
+    Args:
+        factory: Editor class to instantiate
+        fill: Ingestion function
+
+    Returns:
+        float: Seconds
+    """
+    runs = document()
+    editor = factory()
+    start = time.perf_counter()
+    fill(editor, runs)
+    elapsed = time.perf_counter() - start
+    if len(editor.characters if isinstance(editor, TextEditorClient) else editor) != SIZE:
+        raise RuntimeError(f"{type(editor).__name__} did not ingest all {SIZE} characters")
+    return elapsed
+
+
+def main() -> None:
+    """
+    Print ingestion times per editor and path.
+
+    Returns:
+        None
+    """
+    print(f"{'editor':>26}{'add_character':>16}{'extend':>12}{'speedup':>10}")
+    for factory in (TextEditorClient, CompactTextEditorClient):
+        slow = timed(factory, per_character)
+        fast = timed(factory, bulk)
+        print(f"{factory.__name__:>26}{slow * 1000:>13.0f} ms{fast * 1000:>9.1f} ms{slow / fast:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Memory benchmark of the flyweight text editors at 1M and 10M characters.
+
+Pass other sizes as arguments, e.g. `python -m benchmarks.bench_flyweight_memory 100000`.
+"""
+
+import sys
+import tracemalloc
+from typing import Callable, Sequence, Union
+
+from patterns.flyweight.flyweight import TextEditorClient
+from patterns.flyweight.flyweight_compact import CompactTextEditorClient
+
+SIZES = (1_000_000, 10_000_000)
+TEXT = "The quick brown fox jumps over the lazy dog. "
+FONTS = ("Arial", "Times New Roman", "Verdana")
+
+Editor = Union[TextEditorClient, CompactTextEditorClient]
+
+
+def measure(factory: Callable[[], Editor], size: int) -> int:
+    """
+    Build a document of `size` characters and return the memory it holds.
+
+    Args:
+        factory: Editor class to instantiate
+        size: Number of characters
+
+    Returns:
+        int: Bytes allocated for the document
+    """
+    tracemalloc.start()
+    editor = factory()
+    for index in range(size):
+        editor.add_character(TEXT[index % len(TEXT)], FONTS[index // 1000 % len(FONTS)])
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del editor
+    return used
+
+
+def main(sizes: Sequence[int]) -> None:
+    """
+    Print memory used per editor and size.
+
+    Args:
+        sizes: Document sizes in characters
+
+    Returns:
+        None
+    """
+    print(f"{'chars':>12}{'TextEditorClient':>20}{'Compact':>14}{'ratio':>8}{'bytes/char':>12}")
+    for size in sizes:
+        baseline = measure(TextEditorClient, size)
+        compact = measure(CompactTextEditorClient, size)
+        print(
+            f"{size:>12,}{baseline / 2**20:>17.1f} MB{compact / 2**20:>11.1f} MB"
+            f"{baseline / compact:>7.1f}x{compact / size:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or SIZES)
@@ -0,0 +1,89 @@
+"""Memory saved by interning a duplicate-heavy dataset with the FlyweightPool."""
+
+import random
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from patterns.flyweight.flyweight_pool import FlyweightPool
+
+RECORDS = 1_000_000
+COUNTRIES = ("DE", "FR", "IT", "ES", "NL", "PL", "SE", "AT")
+CITIES = ("Berlin", "Paris", "Rome", "Madrid", "Amsterdam", "Warsaw", "Stockholm", "Vienna")
+STATUSES = ("active", "inactive", "pending")
+CODES = (200, 301, 404, 500)
+
+Record = Tuple[str, str, str, int]
+
+
+def lines() -> List[str]:
+    """
+    Raw CSV lines, as they would arrive in an ingest path, with many repeated records.
+
+    Returns:
+        list: CSV lines
+    """
+    rng = random.Random(42)  # nosec B311
+    return [
+        f"{rng.choice(COUNTRIES)},{rng.choice(CITIES)},{rng.choice(STATUSES)},{rng.choice(CODES)}"
+        for _ in range(RECORDS)
+    ]
+
+
+def parse(line: str) -> Record:
+    """
+    Parse a CSV line into a new record tuple.
+
+    Args:
+        line: CSV line
+
+    Returns:
+        tuple: Parsed record
+    """
+    country, city, status, code = line.split(",")
+    return country, city, status, int(code)
+
+
+def measure(load: Callable[[List[str]], List[Record]]) -> Tuple[int, float]:
+    """
+    Measure memory held by and time needed for loading the dataset.
+
+    Args:
+        load: Function turning the CSV lines into records
+
+    Returns:
+        tuple: Bytes held by the records and seconds needed
+    """
+    raw = lines()
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = load(raw)
+    elapsed = time.perf_counter() - start
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return used, elapsed
+
+
+def main() -> None:
+    """
+    Print memory and time with and without interning.
+
+    Returns:
+        None
+    """
+    pool: FlyweightPool[Record] = FlyweightPool()
+
+    plain, plain_time = measure(lambda raw: [parse(line) for line in raw])
+    interned, interned_time = measure(lambda raw: [pool.intern(parse(line)) for line in raw])
+
+    print(f"{'records':>10}{'plain':>12}{'interned':>12}{'saved':>8}{'distinct':>10}")
+    print(
+        f"{RECORDS:>10,}{plain / 2**20:>9.1f} MB{interned / 2**20:>9.1f} MB"
+        f"{1 - interned / plain:>8.0%}{len(pool):>10,}"
+    )
+    print(f"load time: plain {plain_time:.2f} s, interned {interned_time:.2f} s, stats {pool.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Render throughput of the per-character `print()` path versus the buffered `render_to()`."""
+
+import io
+import time
+from contextlib import redirect_stdout
+from typing import Callable
+
+from benchmarks.bench_flyweight_ingest import SIZE, Editor, document
+from patterns.flyweight.flyweight import TextEditorClient
+from patterns.flyweight.flyweight_compact import CompactTextEditorClient
+
+
+def timed(render: Callable[[io.StringIO], None]) -> float:
+    """
+    Measure how long rendering into a fresh buffer takes.
+
+    Args:
+        render: Function rendering into the given buffer
+
+    Returns:
+        float: Seconds
+    """
+    buffer = io.StringIO()
+    start = time.perf_counter()
+    render(buffer)
+    return time.perf_counter() - start
+
+
+def print_path(editor: Editor) -> Callable[[io.StringIO], None]:
+    """
+    Render with `render()`, i.e. one `print()` per character, redirected into the buffer.
+
+    Args:
+        editor: Editor to render
+
+    Returns:
+        Callable: Rendering function
+    """
+
+    def render(buffer: io.StringIO) -> None:
+        with redirect_stdout(buffer):
+            editor.render()
+
+    return render
+
+
+def main() -> None:
+    """
+    Print render throughput in characters per second for both paths.
+
+    Returns:
+        None
+    """
+    print(f"{'editor':>26}{'render()':>16}{'render_to()':>16}{'speedup':>10}")
+    for factory in (TextEditorClient, CompactTextEditorClient):
+        editor = factory()
+        editor.extend(document())
+        slow = timed(print_path(editor))
+        fast = timed(editor.render_to)
+        print(f"{factory.__name__:>26}{SIZE / slow:>12,.0f} c/s{SIZE / fast:>12,.0f} c/s{slow / fast:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Per-call overhead of the Proxy versus the ProtectionProxy, with access logging filtered out and enabled."""
+
+import logging
+import os
+import timeit
+from typing import Callable
+
+from patterns.proxy.proxy import Proxy, RealSubject
+from patterns.proxy.proxy_protection import (
+    ACCESS_LOGGER,
+    AccessPolicy,
+    ProtectionProxy,
+    defer_logging,
+)
+
+NUMBER = 50_000
+
+
+def per_call(call: Callable[[], object]) -> str:
+    """
+    Measure the time of one call.
+
+    Args:
+        call: Call to measure
+
+    Returns:
+        str: Microseconds per call
+    """
+    return f"{min(timeit.repeat(call, number=NUMBER, repeat=3)) / NUMBER * 1e6:>8.2f} us"
+
+
+def main() -> None:
+    """
+    Print the time per call of both proxies, with access logging filtered out and written to a file.
+
+    Returns:
+        None
+    """
+    subject = RealSubject()
+    proxy = Proxy(subject)
+    protection = ProtectionProxy(subject, AccessPolicy(lambda principal, operation: principal == "admin"), "admin")
+
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        # The root logger gets a handler up front, otherwise logging.info() would install one on stderr
+        handler = logging.StreamHandler(devnull)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+        root = logging.getLogger()
+        root.addHandler(handler)
+        deferred = defer_logging(ACCESS_LOGGER, handler)
+        try:
+            print(f"{'logging':<10}{'Proxy':>12}{'ProtectionProxy':>18}")
+            for level in (logging.WARNING, logging.INFO):
+                root.setLevel(level)
+                ACCESS_LOGGER.setLevel(level)
+                name = logging.getLevelName(level).lower()
+                print(f"{name:<10}{per_call(proxy.do_action):>12}{per_call(protection.do_action):>18}")
+        finally:
+            deferred.stop()
+            root.removeHandler(handler)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Calls per second of an in-process subject versus a remote proxy, sequential, pipelined and pooled."""
+
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from patterns.proxy.proxy import Proxy, RealSubject
+from patterns.proxy.proxy_remote import RemoteProxy, SubjectServer
+
+CALLS = 20_000
+PIPELINE = 100
+THREADS = 4
+
+
+def serve(path: str, ready: "multiprocessing.synchronize.Event") -> None:
+    """
+    Serve a RealSubject until the process is terminated.
+
+    Args:
+        path: Path of the socket
+        ready: Set once the server listens
+
+    Returns:
+        None
+    """
+    with SubjectServer(RealSubject(), path) as server:
+        ready.set()
+        server.serve_forever()
+
+
+def calls_per_second(run: Callable[[], object]) -> float:
+    """
+    Measure the throughput of a run of CALLS calls.
+
+    Args:
+        run: Makes CALLS calls
+
+    Returns:
+        float: Calls per second
+    """
+    start = time.perf_counter()
+    run()
+    return CALLS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """
+    Print the calls per second of each way of calling the subject.
+
+    Returns:
+        None
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "subject.sock")
+        context = multiprocessing.get_context("fork")
+        ready = context.Event()
+        server = context.Process(target=serve, args=(path, ready), daemon=True)
+        server.start()
+        ready.wait()
+        try:
+            proxy = Proxy(RealSubject())
+            remote = RemoteProxy(path, pool_size=THREADS)
+            batch = [()] * PIPELINE
+
+            def pooled() -> None:
+                with ThreadPoolExecutor(max_workers=THREADS) as executor:
+                    for _ in executor.map(lambda _: remote.do_action(), range(CALLS)):
+                        pass
+
+            results = {
+                "in-process Proxy": calls_per_second(lambda: [proxy.do_action() for _ in range(CALLS)]),
+                "remote, sequential": calls_per_second(lambda: [remote.do_action() for _ in range(CALLS)]),
+                f"remote, pipelined x{PIPELINE}": calls_per_second(
+                    lambda: [remote.do_actions(batch) for _ in range(CALLS // PIPELINE)]
+                ),
+                f"remote, {THREADS} threads": calls_per_second(pooled),
+            }
+            remote.close()
+        finally:
+            server.terminate()
+            server.join()
+
+    for name, rate in results.items():
+        print(f"{name:<24}{rate:>12,.0f} calls/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Startup time of eagerly constructed subjects versus virtual proxies, and the cost of the first request."""
+
+import time
+from typing import Callable, List
+
+from patterns.proxy.proxy import Proxy, RealSubject, Subject
+from patterns.proxy.proxy_virtual import VirtualProxy
+
+SUBJECTS = 20
+CONSTRUCTION_SECONDS = 0.02
+
+
+# pylint: disable=too-few-public-methods
+class ExpensiveSubject(RealSubject):
+    """RealSubject that takes a while to construct, e.g. loading a model or opening connections."""
+
+    def __init__(self) -> None:
+        """
+        Simulate an expensive construction.
+        """
+        time.sleep(CONSTRUCTION_SECONDS)
+
+
+def elapsed(action: Callable[[], object]) -> float:
+    """
+    Measure the wall time of an action.
+
+    Args:
+        action: Action to measure
+
+    Returns:
+        float: Milliseconds
+    """
+    start = time.perf_counter()
+    action()
+    return (time.perf_counter() - start) * 1e3
+
+
+def main() -> None:
+    """
+    Print startup and first-request times of eager proxies, virtual proxies and pre-warmed virtual proxies.
+
+    Returns:
+        None
+    """
+    eager: List[Subject] = []
+    virtual: List[VirtualProxy] = []
+    prewarmed: List[VirtualProxy] = []
+
+    def prewarm() -> None:
+        for proxy in (VirtualProxy(ExpensiveSubject) for _ in range(SUBJECTS)):
+            proxy.prewarm()
+            prewarmed.append(proxy)
+
+    startups = [
+        elapsed(lambda: eager.extend(Proxy(ExpensiveSubject()) for _ in range(SUBJECTS))),
+        elapsed(lambda: virtual.extend(VirtualProxy(ExpensiveSubject) for _ in range(SUBJECTS))),
+        elapsed(prewarm),
+    ]
+    time.sleep(2 * CONSTRUCTION_SECONDS)
+    first_requests = [elapsed(lambda proxy=proxy: proxy.do_action()) for proxy in (eager[0], virtual[0], prewarmed[0])]
+
+    print(f"{SUBJECTS} subjects, {CONSTRUCTION_SECONDS * 1e3:.0f} ms construction each")
+    print(f"{'':>10}{'startup':>12}{'first request':>16}")
+    for name, startup, first_request in zip(("eager", "virtual", "prewarmed"), startups, first_requests):
+        print(f"{name:>10}{startup:>9.2f} ms{first_request:>13.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
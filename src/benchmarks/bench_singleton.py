@@ -0,0 +1,65 @@
+"""Contention benchmark for the Singleton implementations at 1 to 64 threads."""
+
+import threading
+import time
+from typing import Callable, Dict
+
+from patterns.singleton.singleton import Singleton
+from patterns.singleton.singleton_simple import SingletonSimple
+from patterns.singleton.singleton_thread_safe import SingletonThreadSafe
+
+CALLS_PER_THREAD = 20_000
+THREAD_COUNTS = (1, 2, 4, 8, 16, 32, 64)
+
+
+def run(lookup: Callable[[], object], threads: int) -> float:
+    """
+    Let `threads` threads call `lookup` concurrently and measure the throughput.
+
+    Args:
+        lookup: Function returning the singleton instance
+        threads: Number of concurrent threads
+
+    Returns:
+        float: Lookups per second
+    """
+    barrier = threading.Barrier(threads + 1)
+
+    def worker() -> None:
+        barrier.wait()
+        for _ in range(CALLS_PER_THREAD):
+            lookup()
+
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    return threads * CALLS_PER_THREAD / elapsed
+
+
+def main() -> None:
+    """
+    Print lookups per second for every implementation and thread count.
+
+    Returns:
+        None
+    """
+    implementations: Dict[str, Callable[[], object]] = {
+        "Singleton": Singleton.get_instance,
+        "SingletonSimple": SingletonSimple,
+        "SingletonThreadSafe": SingletonThreadSafe.get_instance,
+    }
+
+    print(f"{'threads':>8}" + "".join(f"{name:>22}" for name in implementations))
+    for threads in THREAD_COUNTS:
+        results = [run(lookup, threads) for lookup in implementations.values()]
+        print(f"{threads:>8}" + "".join(f"{result:>18,.0f} /s" for result in results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+"""Helpers shared by the decorators that support coroutine functions."""
+
+import inspect
+from typing import Any, Callable
+
+
+def is_async(func: Callable[..., Any]) -> bool:
+    """
+    Check whether calling `func` returns an awaitable, including async-wrapping decorator instances.
+
+    Args:
+        func: Function or decorator instance
+
+    Returns:
+        bool: True for coroutine functions and decorators wrapping one
+    """
+    return inspect.iscoroutinefunction(func) or getattr(func, "is_async", False) is True
@@ -1,6 +1,8 @@
 """Class realizing the Decorator design pattern."""
 
-from abc import ABC, abstractmethod
+import itertools
+from abc import ABC, ABCMeta, abstractmethod
+from typing import Any, Dict, List, Tuple, cast
 
 
 class Coffee(ABC):
@@ -8,6 +10,9 @@ class Coffee(ABC):
     Abstract class representing a coffee.
     """
 
+    # Decorator chain wrapping the coffee, 0 if it is not decorated (see `CoffeeDecorator.chain_kinds`)
+    chain_id = 0
+
     @abstractmethod
     def get_cost(self) -> float:
         """
@@ -51,11 +56,45 @@ class BasicCoffee(Coffee):
         return "Basic Coffee"
 
 
-class CoffeeDecorator(Coffee):
+class _AddonMeta(ABCMeta):
+    """Metaclass keeping the declared add-on of a decorator class constant."""
+
+    def __setattr__(cls, key: str, value: Any) -> None:
+        """
+        Reject reassigning `addon_cost` or `addon_name` after the class has been created.
+
+        Args:
+            key: Attribute name
+            value: Attribute value
+
+        Returns:
+            None
+        """
+        if key in ("addon_cost", "addon_name"):
+            raise AttributeError(f"{cls.__name__}.{key} is constant")
+        super().__setattr__(key, value)
+
+
+class CoffeeDecorator(Coffee, metaclass=_AddonMeta):
     """
     Abstract class representing a decorator for a coffee.
+
+    Decorators adding a fixed price and name declare them as `addon_cost` and `addon_name`,
+    which allows flattening a chain of them (see `decorator_compiled`). Decorators and their
+    declared add-ons are immutable, so a flattened chain can never become stale.
     """
 
+    addon_cost: float
+    addon_name: str
+    undecorated: Coffee
+    _coffee: Coffee
+
+    # Every distinct sequence of decorator classes gets an id, built from the id of the inner chain and
+    # the outermost class. A decorator knows its chain and its undecorated coffee without walking it.
+    _chain_ids: Dict[Tuple[int, type], int] = {}
+    _chain_links: Dict[int, Tuple[int, type]] = {}
+    _next_chain_id = itertools.count(1)
+
     def __init__(self, coffee: Coffee):
         """
         Initialize the decorator with a coffee.
@@ -63,7 +102,68 @@ class CoffeeDecorator(Coffee):
         Args:
             coffee (Coffee): Coffee to decorate
         """
-        self._coffee = coffee
+        object.__setattr__(self, "_coffee", coffee)
+        inner_chain = coffee.chain_id
+        link = (inner_chain, type(self))
+        chain_id = CoffeeDecorator._chain_ids.get(link)
+        if chain_id is None:
+            chain_id = CoffeeDecorator._chain_ids.setdefault(link, next(CoffeeDecorator._next_chain_id))
+            CoffeeDecorator._chain_links[chain_id] = link
+        object.__setattr__(self, "chain_id", chain_id)
+        undecorated = cast(CoffeeDecorator, coffee).undecorated if inner_chain else coffee
+        object.__setattr__(self, "undecorated", undecorated)
+
+    @staticmethod
+    def chain_kinds(chain_id: int) -> Tuple[type, ...]:
+        """
+        Decorator classes of a chain.
+
+        Args:
+            chain_id: The `chain_id` of a coffee
+
+        Returns:
+            tuple: Decorator classes, outermost first
+        """
+        kinds: List[type] = []
+        while chain_id:
+            chain_id, kind = CoffeeDecorator._chain_links[chain_id]
+            kinds.append(kind)
+        return tuple(kinds)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        """
+        Decorators are immutable after construction.
+
+        Args:
+            key: Attribute name
+            value: Attribute value
+
+        Returns:
+            None
+        """
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, key: str) -> None:
+        """
+        Decorators are immutable after construction.
+
+        Args:
+            key: Attribute name
+
+        Returns:
+            None
+        """
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @property
+    def coffee(self) -> Coffee:
+        """
+        Get the decorated coffee.
+
+        Returns:
+            Coffee: Decorated coffee
+        """
+        return self._coffee
 
     @abstractmethod
     def get_cost(self) -> float:
@@ -89,6 +189,9 @@ class MilkDecorator(CoffeeDecorator):
     Concrete implementation of the coffee decorator class adding milk to a coffee.
     """
 
+    addon_cost = 0.5
+    addon_name = "Milk"
+
     def get_cost(self) -> float:
         """
         Adjust the cost of the coffee by adding the cost of milk.
@@ -96,7 +199,7 @@ class MilkDecorator(CoffeeDecorator):
         Returns:
             float: Cost of the coffee
         """
-        return self._coffee.get_cost() + 0.5
+        return self._coffee.get_cost() + self.addon_cost
 
     def get_description(self) -> str:
         """
@@ -105,7 +208,7 @@ class MilkDecorator(CoffeeDecorator):
         Returns:
             str: Description of the coffee
         """
-        return self._coffee.get_description() + ", Milk"
+        return self._coffee.get_description() + ", " + self.addon_name
 
 
 class SugarDecorator(CoffeeDecorator):
@@ -113,6 +216,9 @@ class SugarDecorator(CoffeeDecorator):
     Concrete implementation of the coffee decorator class adding sugar to a coffee.
     """
 
+    addon_cost = 0.25
+    addon_name = "Sugar"
+
     def get_cost(self) -> float:
         """
         Adjust the cost of the coffee by adding the cost of sugar.
@@ -120,7 +226,7 @@ class SugarDecorator(CoffeeDecorator):
         Returns:
             float: Cost of the coffee
         """
-        return self._coffee.get_cost() + 0.25
+        return self._coffee.get_cost() + self.addon_cost
 
     def get_description(self) -> str:
         """
@@ -129,4 +235,4 @@ class SugarDecorator(CoffeeDecorator):
         Returns:
             str: Description of the coffee
         """
-        return self._coffee.get_description() + ", Sugar"
+        return self._coffee.get_description() + ", " + self.addon_name
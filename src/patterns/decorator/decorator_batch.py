@@ -0,0 +1,150 @@
+"""Batch pricing of many decorated coffees against a table of add-on prices."""
+
+from array import array
+from collections import Counter
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast
+
+from patterns.decorator.decorator import Coffee, CoffeeDecorator
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - NumPy is optional
+    NUMPY_AVAILABLE = False
+else:
+    NUMPY_AVAILABLE = True
+
+
+def _undecorated(order: Coffee) -> Coffee:
+    """
+    Return the coffee at the bottom of an order's decorator chain.
+
+    Args:
+        order: Possibly decorated coffee
+
+    Returns:
+        Coffee: The undecorated coffee
+    """
+    return cast(CoffeeDecorator, order).undecorated if order.chain_id else order
+
+
+def _walk_orders(orders: Sequence[Coffee]) -> Tuple["array[float]", List[int]]:
+    """
+    Look up the base cost and the decorator chain of every order.
+
+    Decorators know their chain and undecorated coffee, so no chain is walked.
+
+    Args:
+        orders: Decorated coffees
+
+    Returns:
+        tuple: Base cost per order and the chain id of each order
+    """
+    base_costs = array("d", [_undecorated(order).get_cost() for order in orders])
+    return base_costs, [order.chain_id for order in orders]
+
+
+def encode_orders(orders: Sequence[Coffee]) -> Tuple["array[float]", List[type], "array[int]"]:
+    """
+    Encode orders as base costs plus a matrix counting each kind of add-on per order.
+
+    The encoding only depends on the structure of the orders, so it can be priced again
+    after the price table changed without walking the decorator chains again.
+
+    Args:
+        orders: Decorated coffees
+
+    Returns:
+        tuple: Base cost per order, decorator class per add-on column, and the row-major count matrix
+            of shape (number of orders, number of add-on columns)
+    """
+    base_costs, chains = _walk_orders(orders)
+
+    # Orders in a batch mostly share a few structures, so each distinct one is encoded only once
+    rows = {chain: Counter(CoffeeDecorator.chain_kinds(chain)) for chain in dict.fromkeys(chains)}
+    columns: Dict[type, int] = {}
+    for row in rows.values():
+        for kind in row:
+            columns.setdefault(kind, len(columns))
+
+    encoded: Dict[int, bytes] = {}
+    for chain, row in rows.items():
+        vector = array("q", bytes(8 * len(columns)))
+        for kind, count in row.items():
+            vector[columns[kind]] = count
+        encoded[chain] = vector.tobytes()
+    counts = array("q", b"".join(map(encoded.__getitem__, chains)))
+    return base_costs, list(columns), counts
+
+
+def price_encoded(
+    base_costs: "array[float]", prices: Sequence[float], counts: "array[int]", use_numpy: Optional[bool] = None
+) -> List[float]:
+    """
+    Compute the cost of encoded orders.
+
+    With NumPy installed the totals are a single matrix-vector product, otherwise the count matrix
+    is applied column by column. Add-ons are summed as `count * price` per column instead of one by
+    one in chain order, so a total may differ from `get_cost()` in its last bits when prices are not
+    exactly representable: the relative difference stays below the number of add-ons times 2**-52.
+
+    Args:
+        base_costs: Base cost per order
+        prices: Price per add-on column
+        counts: Row-major count matrix of shape (number of orders, number of add-on columns)
+        use_numpy: Force (True) or disable (False) NumPy, by default it is used if installed
+
+    Returns:
+        list: Cost per order
+    """
+    if use_numpy is None:
+        use_numpy = NUMPY_AVAILABLE
+    if use_numpy:
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is not installed")
+        matrix: Any = numpy.frombuffer(counts, dtype=numpy.int64).reshape(len(base_costs), len(prices))
+        totals = numpy.frombuffer(base_costs, dtype=numpy.float64) + matrix @ numpy.array(prices, dtype=numpy.float64)
+        return list(totals.tolist())
+
+    costs = array("d", base_costs)
+    width = len(prices)
+    for column, price in enumerate(prices):
+        for index, count in enumerate(counts[column::width]):
+            if count:
+                costs[index] += count * price
+    return list(costs)
+
+
+def price_orders(orders: Sequence[Coffee]) -> List[float]:
+    """
+    Compute the cost of many orders at once, using the `addon_cost` of each decorator class.
+
+    Each distinct pair of base cost and decorator chain is summed once, in chain order like
+    `get_cost()`, so the results are identical to it. The remaining orders cost a dict lookup each,
+    which beats calling `get_cost()` through their decorator chains.
+
+    Args:
+        orders: Decorated coffees
+
+    Returns:
+        list: Cost per order
+
+    Raises:
+        TypeError: If a decorator does not declare `addon_cost`
+    """
+    totals: Dict[Tuple[float, int], float] = {}
+    lookup = totals.get
+    costs: List[float] = []
+    append = costs.append
+    for order in orders:
+        chain = order.chain_id
+        base_cost = (cast(CoffeeDecorator, order).undecorated if chain else order).get_cost()
+        cost = lookup((base_cost, chain))
+        if cost is None:
+            cost = base_cost
+            for kind in reversed(CoffeeDecorator.chain_kinds(chain)):
+                if not hasattr(kind, "addon_cost"):
+                    raise TypeError(f"{kind.__name__} does not declare addon_cost")
+                cost += kind.addon_cost
+            totals[base_cost, chain] = cost
+        append(cost)
+    return costs
@@ -0,0 +1,85 @@
+"""Flattening a chain of coffee decorators into a single, cached object."""
+
+from typing import List, Tuple
+
+from patterns.decorator.decorator import Coffee, CoffeeDecorator
+
+
+def unwrap_coffee(coffee: Coffee) -> Tuple[Coffee, List[CoffeeDecorator]]:
+    """
+    Walk a decorator chain iteratively, so arbitrarily deep chains do not hit the recursion limit.
+
+    Args:
+        coffee (Coffee): Possibly decorated coffee
+
+    Returns:
+        tuple: The undecorated base coffee and the decorators in the order they were applied
+    """
+    layers: List[CoffeeDecorator] = []
+    while isinstance(coffee, CoffeeDecorator):
+        layers.append(coffee)
+        coffee = coffee.coffee
+    layers.reverse()
+    return coffee, layers
+
+
+class CompiledCoffee(Coffee):
+    """
+    Flat representation of a decorated coffee with pre-computed cost and description.
+
+    Instead of one recursive call per decorator and repeated string concatenation on every call,
+    the chain is walked once. Decorators are immutable, so the result never has to be recomputed;
+    the undecorated base coffee is expected not to change its cost or description either.
+    """
+
+    def __init__(self, coffee: Coffee) -> None:
+        """
+        Compile a decorated coffee.
+
+        Args:
+            coffee (Coffee): Coffee to compile
+
+        Raises:
+            TypeError: If a decorator in the chain does not declare `addon_cost` and `addon_name`
+        """
+        self._coffee = coffee
+        self._cost = 0.0
+        self._description = ""
+        self._compile()
+
+    def _compile(self) -> None:
+        """
+        Sum the costs and join the descriptions of the chain.
+
+        Returns:
+            None
+        """
+        base, layers = unwrap_coffee(self._coffee)
+        cost = base.get_cost()
+        names = [base.get_description()]
+        for layer in layers:
+            if not hasattr(layer, "addon_cost") or not hasattr(layer, "addon_name"):
+                raise TypeError(f"{type(layer).__name__} does not declare addon_cost and addon_name")
+            # Same order of additions as the recursive get_cost(), so the result is identical
+            cost += layer.addon_cost
+            names.append(layer.addon_name)
+        self._cost = cost
+        self._description = ", ".join(names)
+
+    def get_cost(self) -> float:
+        """
+        Get the cost of the coffee.
+
+        Returns:
+            float: Cost of the coffee
+        """
+        return self._cost
+
+    def get_description(self) -> str:
+        """
+        Get the description of the coffee.
+
+        Returns:
+            str: Description of the coffee
+        """
+        return self._description
@@ -0,0 +1,275 @@
+"""Decorator recording call counts and latency histograms of the decorated functions."""
+
+import functools
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from patterns.decorator._asyncutil import is_async
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Each power of two is split into 2**SUB_BITS buckets, so a bucket is at most 1/8 wide relative to its value
+SUB_BITS = 3
+SUB_BUCKETS = 1 << SUB_BITS
+BUCKETS = (64 - SUB_BITS + 1) * SUB_BUCKETS
+
+_ENABLED = True
+_registry: Dict[str, "LatencyHistogram"] = {}
+_registry_lock = threading.Lock()
+
+
+def bucket_index(value: int) -> int:
+    """
+    Histogram bucket of a latency; values below 2 * SUB_BUCKETS get a bucket each.
+
+    Args:
+        value: Latency in nanoseconds
+
+    Returns:
+        int: Bucket index
+    """
+    if value < 2 * SUB_BUCKETS:
+        return max(value, 0)
+    shift = value.bit_length() - SUB_BITS - 1
+    return min((shift + 1) * SUB_BUCKETS + (value >> shift) - SUB_BUCKETS, BUCKETS - 1)
+
+
+def bucket_bounds(index: int) -> Tuple[int, int]:
+    """
+    Range of latencies counted in a bucket.
+
+    Args:
+        index: Bucket index
+
+    Returns:
+        tuple: Smallest latency of the bucket and the smallest latency of the next one
+    """
+    if index < 2 * SUB_BUCKETS:
+        return index, index + 1
+    shift = index // SUB_BUCKETS - 1
+    mantissa = index % SUB_BUCKETS + SUB_BUCKETS
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+class LatencyHistogram:
+    """
+    Log-linear histogram of latencies in nanoseconds.
+
+    All buckets are allocated up front, so recording a call is an index computation and a few
+    integer increments. Percentiles are estimated from the bucket midpoints.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty histogram.
+        """
+        self._lock = threading.Lock()
+        self._buckets = [0] * BUCKETS
+        # count, total, minimum and maximum, kept in a list to keep record() cheap
+        self._totals = [0, 0, 0, 0]
+
+    def record(self, value: int) -> None:
+        """
+        Record one latency.
+
+        Args:
+            value: Latency in nanoseconds
+
+        Returns:
+            None
+        """
+        # bucket_index() inlined, latencies never reach 2**64 ns
+        if value < 2 * SUB_BUCKETS:
+            index = max(value, 0)
+        else:
+            shift = value.bit_length() - SUB_BITS - 1
+            index = (shift + 1) * SUB_BUCKETS + (value >> shift) - SUB_BUCKETS
+        with self._lock:
+            self._buckets[index] += 1
+            totals = self._totals
+            if not totals[0] or value < totals[2]:
+                totals[2] = value
+            if value > totals[3]:
+                totals[3] = value
+            totals[0] += 1
+            totals[1] += value
+
+    def percentile(self, fraction: float) -> int:
+        """
+        Estimate a latency percentile.
+
+        Args:
+            fraction: Percentile as a fraction, e.g. 0.99 for p99
+
+        Returns:
+            int: Latency in nanoseconds, 0 if nothing was recorded
+        """
+        with self._lock:
+            count, _, minimum, maximum = self._totals
+            if not count:
+                return 0
+            rank = max(1, round(fraction * count))
+            index = 0
+            seen = self._buckets[0]
+            while seen < rank:
+                index += 1
+                seen += self._buckets[index]
+        low, high = bucket_bounds(index)
+        return min(max((low + high - 1) // 2, minimum), maximum)
+
+    def reset(self) -> None:
+        """
+        Forget all recorded latencies.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._buckets = [0] * BUCKETS
+            self._totals = [0, 0, 0, 0]
+
+    def as_dict(self) -> Dict[str, int]:
+        """
+        Summary of the recorded latencies.
+
+        Returns:
+            dict: Call count, total, minimum, p50, p99 and maximum latency in nanoseconds
+        """
+        p50 = self.percentile(0.5)
+        p99 = self.percentile(0.99)
+        with self._lock:
+            count, total, minimum, maximum = self._totals
+        return {"count": count, "total_ns": total, "min_ns": minimum, "p50_ns": p50, "p99_ns": p99, "max_ns": maximum}
+
+
+def enable() -> None:
+    """
+    Start recording calls of instrumented functions.
+
+    Returns:
+        None
+    """
+    global _ENABLED  # pylint: disable=global-statement
+    _ENABLED = True
+
+
+def disable() -> None:
+    """
+    Stop recording; instrumented functions then only pay for one flag check per call.
+
+    Returns:
+        None
+    """
+    global _ENABLED  # pylint: disable=global-statement
+    _ENABLED = False
+
+
+def is_enabled() -> bool:
+    """
+    Check whether calls are recorded.
+
+    Returns:
+        bool: True if calls are recorded
+    """
+    return _ENABLED
+
+
+def histogram(name: str) -> LatencyHistogram:
+    """
+    Histogram registered under a name, created on first use.
+
+    Args:
+        name: Name of the instrumented function
+
+    Returns:
+        LatencyHistogram: The histogram
+    """
+    with _registry_lock:
+        return _registry.setdefault(name, LatencyHistogram())
+
+
+def instrument(name: Optional[str] = None) -> Callable[[F], F]:
+    """
+    Decorator recording the call count and latency of the decorated function.
+
+    Calls that raise are recorded as well. Coroutine functions, and tag decorators wrapping one, get
+    a native async wrapper, which measures until the result is available.
+
+    Args:
+        name: Name to record under, by default the function's module and qualified name.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: F) -> F:
+        record = histogram(name or f"{func.__module__}.{func.__qualname__}").record
+        clock = time.perf_counter_ns
+
+        if is_async(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not _ENABLED:
+                    return await func(*args, **kwargs)
+                start = clock()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    record(clock() - start)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _ENABLED:
+                return func(*args, **kwargs)
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(clock() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def export() -> Dict[str, Dict[str, int]]:
+    """
+    Summaries of all instrumented functions.
+
+    Returns:
+        dict: Summary per function name, see `LatencyHistogram.as_dict`
+    """
+    with _registry_lock:
+        histograms = dict(_registry)
+    return {name: histograms[name].as_dict() for name in sorted(histograms)}
+
+
+def export_json(indent: Optional[int] = None) -> str:
+    """
+    Summaries of all instrumented functions as JSON.
+
+    Args:
+        indent: JSON indentation, None for a single line
+
+    Returns:
+        str: The JSON document
+    """
+    return json.dumps(export(), indent=indent)
+
+
+def reset() -> None:
+    """
+    Forget the recorded latencies of all instrumented functions.
+
+    Returns:
+        None
+    """
+    with _registry_lock:
+        histograms = list(_registry.values())
+    for entry in histograms:
+        entry.reset()
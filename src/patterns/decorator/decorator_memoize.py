@@ -0,0 +1,205 @@
+"""Memoizing decorator with LRU eviction, time-to-live and statistics."""
+
+import functools
+import threading
+import time
+import types
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+from patterns.decorator._asyncutil import is_async
+
+R = TypeVar("R")
+
+# Separates positional from keyword arguments in cache keys, so f(1, ("a", 2)) and f(1, a=2) differ
+_KWARGS_MARK = object()
+_MISSING: Any = object()
+
+
+# pylint: disable=too-many-instance-attributes
+class Memoized(Generic[R]):
+    """
+    Decorator caching the results of a pure function by its arguments.
+
+    The least recently used entry is evicted once `maxsize` entries are cached, entries older than
+    `ttl` seconds are recomputed. All arguments must be hashable. The cache is guarded by a lock;
+    the function itself runs outside the lock, so concurrent misses for one key may compute twice.
+
+    Decorated methods are keyed by their instance too, which the cache keeps alive. For coroutine
+    functions the awaited result is cached, so every call returns a new awaitable.
+    """
+
+    def __init__(
+        self,
+        func: Callable[..., R],
+        maxsize: Optional[int] = 128,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize the decorator with the decorated function.
+
+        Args:
+            func: The decorated function.
+            maxsize: Maximum number of cached results, None for no limit.
+            ttl: Seconds a result stays valid, None for no expiry.
+            clock: Monotonic time source in seconds.
+        """
+        functools.update_wrapper(self, func)
+        self._func = func
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        self._cache: OrderedDict[Hashable, Tuple[float, R]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        self.is_async = is_async(func)
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        """
+        Bind the decorator to an instance when it decorates a method.
+
+        Args:
+            instance: Instance the method is looked up on, None for a lookup on the class
+            owner: Class the method is looked up on
+
+        Returns:
+            The bound method, or the decorator itself for a lookup on the class
+        """
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
+
+    @staticmethod
+    def _make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+        """
+        Build the cache key; keyword order does not matter.
+
+        Args:
+            args: Positional arguments
+            kwargs: Keyword arguments
+
+        Returns:
+            Hashable: Cache key
+        """
+        if not kwargs:
+            return args
+        return args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+
+    def __call__(self, *args: Any, **kwargs: Any) -> R:
+        """
+        Return the cached result or call the decorated function and cache its result.
+
+        Args:
+            *args: The decorated function's positional arguments.
+            **kwargs: The decorated function's keyword arguments.
+
+        Returns:
+            The decorated function's (cached) output.
+        """
+        key = self._make_key(args, kwargs)
+        if self.is_async:
+            return self._call_async(key, args, kwargs)  # type: ignore[return-value]
+        result = self._lookup(key)
+        if result is _MISSING:
+            result = self._func(*args, **kwargs)
+            self._store(key, result)
+        return result  # type: ignore[no-any-return]
+
+    async def _call_async(self, key: Hashable, args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+        """
+        Return the cached result or await the decorated coroutine function and cache its result.
+
+        Args:
+            key: Cache key
+            args: The decorated function's positional arguments.
+            kwargs: The decorated function's keyword arguments.
+
+        Returns:
+            The decorated function's (cached) awaited output.
+        """
+        result = self._lookup(key)
+        if result is _MISSING:
+            result = await self._func(*args, **kwargs)  # type: ignore[misc]
+            self._store(key, result)
+        return result
+
+    def _lookup(self, key: Hashable) -> Any:
+        """
+        Return a valid cached result and count the hit or miss.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached result, _MISSING if there is none
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                if self._ttl is None or self._clock() < entry[0]:
+                    self._cache.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return entry[1]
+                del self._cache[key]
+                self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+        return _MISSING
+
+    def _store(self, key: Hashable, result: Any) -> None:
+        """
+        Cache a result, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            result: Result to cache
+
+        Returns:
+            None
+        """
+        expires = float("inf") if self._ttl is None else self._clock() + self._ttl
+        with self._lock:
+            self._cache[key] = (expires, result)
+            self._cache.move_to_end(key)
+            if self._maxsize is not None and len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Statistics of this function's cache.
+
+        Returns:
+            dict: Hits, misses, evictions, expirations and the current size
+        """
+        with self._lock:
+            return dict(self._stats, size=len(self._cache))
+
+    def cache_clear(self) -> None:
+        """
+        Remove all cached results and reset the statistics.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._cache.clear()
+            self._stats = dict.fromkeys(self._stats, 0)
+
+
+def memoize(maxsize: Optional[int] = 128, ttl: Optional[float] = None) -> Callable[[Callable[..., R]], Memoized[R]]:
+    """
+    Decorator caching the decorated function's results, see `Memoized`.
+
+    Args:
+        maxsize: Maximum number of cached results, None for no limit.
+        ttl: Seconds a result stays valid, None for no expiry.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: Callable[..., R]) -> Memoized[R]:
+        return Memoized(func, maxsize=maxsize, ttl=ttl)
+
+    return decorator
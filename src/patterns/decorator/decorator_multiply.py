@@ -1,12 +1,78 @@
 """Decorator example with a parameter."""
 
-from typing import Callable
+import functools
+import inspect
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
 
+from patterns.decorator._asyncutil import is_async
 
-def multiply_decorator(factor: int) -> Callable[[Callable[[int, int], int]], Callable[[int, int], int]]:
+F = TypeVar("F", bound=Callable[..., Any])
+
+_POSITIONAL = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+
+def _fixed_parameters(func: Callable[..., Any]) -> Optional[Tuple[List[str], int]]:
+    """
+    Parameters of a function taking a fixed number of arguments without defaults.
+
+    Args:
+        func: Function to inspect
+
+    Returns:
+        tuple: The parameter names and how many of them are positional-only, or None if the function
+            has defaults, variadic or keyword-only parameters
+    """
+    try:
+        parameters = list(inspect.signature(func).parameters.values())
+    except (TypeError, ValueError):
+        return None
+    if any(parameter.kind not in _POSITIONAL or parameter.default is not parameter.empty for parameter in parameters):
+        return None
+    names = [parameter.name for parameter in parameters]
+    if {"_func", "_factor"} & set(names):
+        return None
+    return names, sum(parameter.kind is inspect.Parameter.POSITIONAL_ONLY for parameter in parameters)
+
+
+def _fixed_wrapper(func: Callable[..., Any], factor: int, names: List[str], positional_only: int) -> Callable[..., Any]:
+    """
+    Compile a wrapper with the same parameters as the decorated function.
+
+    Spelling out the parameters avoids packing and unpacking `*args` and `**kwargs` on every call, the
+    same way `dataclasses` generates `__init__`. `benchmarks/bench_decorator_wrappers.py` measures about
+    30 ns of overhead per call for this wrapper against about 135 ns for the generic one.
+
+    Args:
+        func: The decorated function.
+        factor: Factor to multiply the decorated function's output by.
+        names: The decorated function's parameter names.
+        positional_only: Number of positional-only parameters.
+
+    Returns:
+        The wrapper.
+    """
+    arguments = ", ".join(names)
+    parameters = ", ".join(names[:positional_only] + ["/"] + names[positional_only:]) if positional_only else arguments
+    if is_async(func):
+        source = f"async def wrapper({parameters}):\n    return (await _func({arguments})) * _factor\n"
+    else:
+        source = f"def wrapper({parameters}):\n    return _func({arguments}) * _factor\n"
+    namespace: Dict[str, Any] = {"_func": func, "_factor": factor}
+    # The source is built only from the decorated function's own parameter names, which are identifiers
+    exec(source, namespace)  # nosec B102  # pylint: disable=exec-used
+    wrapper: Callable[..., Any] = namespace["wrapper"]
+    return wrapper
+
+
+def multiply_decorator(factor: int) -> Callable[[F], F]:
     """
     Decorator that multiplies the decorated function's output by a factor.
 
+    Coroutine functions, and tag decorators wrapping one, get a native async wrapper, which awaits
+    the result before multiplying it.
+    The wrapper keeps the decorated function's name, docstring and signature. For functions with a
+    fixed number of arguments it is compiled with the same parameters, avoiding `*args` overhead.
+
     Args:
         factor: Factor to multiply the decorated function's output by.
 
@@ -14,11 +80,25 @@ def multiply_decorator(factor: int) -> Callable[[Callable[[int, int], int]], Cal
         The decorated function's output multiplied by a factor.
     """
 
-    def decorator(func: Callable[[int, int], int]) -> Callable[[int, int], int]:
-        def wrapper(*args: int) -> int:
-            result = func(*args)
+    def decorator(func: F) -> F:
+        parameters = _fixed_parameters(func)
+        if parameters is not None:
+            return functools.wraps(func)(_fixed_wrapper(func, factor, *parameters))  # type: ignore[return-value]
+
+        if is_async(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                result = await func(*args, **kwargs)
+                return result * factor
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            result = func(*args, **kwargs)
             return result * factor
 
-        return wrapper
+        return wrapper  # type: ignore[return-value]
 
     return decorator
@@ -1,61 +1,289 @@
 """
 Decorators for text formatting.
-Skipping the abstract base class for simplicity.
+Bold and italic only differ in their tag, so they share the small TagDecorator base class.
+Stacks of tag decorators can be fused into a single FusedTagDecorator with `fuse_tags` or `fuse`.
+The streaming variants wrap functions returning an iterable of chunks instead of a whole string.
 """
 
-from typing import Callable
+import functools
+import inspect
+import types
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, Tuple, Type
+
+from patterns.decorator._asyncutil import is_async
 
 
 # pylint: disable=too-few-public-methods
-class BoldDecorator:
+class TagDecorator:
     """
-    Decorator that wraps the decorated function's output in <b> tags.
+    Decorator that wraps the decorated function's output in an HTML tag.
+
+    The decorator keeps the decorated function's name, docstring and signature, and binds like a
+    function when it decorates a method. Arguments are forwarded positionally, which keeps a call as
+    cheap as the plain positional wrapper it replaces. Decorating a coroutine function (or a decorator
+    wrapping one) returns an AsyncTagDecorator adding the same tags instead, so the sync path never
+    checks whether it has to await.
     """
 
-    def __init__(self, func: Callable[[str], str]) -> None:
+    tag = ""
+    __name__: str
+    __wrapped__: Callable[..., Any]
+
+    def __new__(cls, func: Callable[..., Any], tags: Optional[Sequence[str]] = None) -> "TagDecorator":
+        """
+        Create the decorator, or an AsyncTagDecorator with the same tags for coroutine functions.
+
+        Args:
+            func: The decorated function.
+            tags: The tags, outermost first, by default the tag of the class.
+
+        Returns:
+            TagDecorator: The new decorator
+        """
+        # Subclasses with their own __call__ (e.g. streaming decorators) keep it
+        if cls.__call__ is TagDecorator.__call__ and is_async(func):
+            return AsyncTagDecorator(func, (cls.tag,) if tags is None else tags)
+        return super().__new__(cls)
+
+    def __init__(self, func: Callable[..., Any], tags: Optional[Sequence[str]] = None) -> None:
         """
         Initialize the decorator with the decorated function.
 
         Args:
             func: The decorated function.
+            tags: The tags, outermost first, by default the tag of the class.
         """
         self._func = func
+        self._tags = (self.tag,) if tags is None else tuple(tags)
+        self._prefix = "".join(f"<{tag}>" for tag in self._tags)
+        self._suffix = "".join(f"</{tag}>" for tag in reversed(self._tags))
+        self.is_async = is_async(func)
+        # Only the metadata is copied, the attributes of a wrapped decorator must not leak into this one
+        functools.update_wrapper(self, func, updated=())
 
-    def __call__(self, *args: str) -> str:
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
         """
-        Call the decorated function and wrap its output in <b> tags.
+        Bind the decorator to an instance when it decorates a method.
 
         Args:
-            *args: The decorated function's positional arguments.
+            instance: Instance the method is looked up on, None for lookups on the class.
+            owner: Class the method is looked up on.
 
         Returns:
-            The decorated function's output wrapped in <b> tags.
+            The decorator bound to the instance, or the decorator itself for lookups on the class.
         """
-        return f"<b>{self._func(*args)}</b>"
+        if instance is None:
+            return self
+        return types.MethodType(self, instance)
 
+    def __call__(self, *args: Any) -> Any:
+        """
+        Call the decorated function and wrap its output in the tag.
 
-class ItalicDecorator:
+        Args:
+            *args: The decorated function's arguments.
+
+        Returns:
+            The decorated function's output wrapped in the tag.
+        """
+        return f"{self._prefix}{self._func(*args)}{self._suffix}"
+
+    @property
+    def tags(self) -> Tuple[str, ...]:
+        """
+        Tags this decorator adds, outermost first.
+
+        Returns:
+            tuple: The tags
+        """
+        return self._tags
+
+
+class AsyncTagDecorator(TagDecorator):
     """
-    Decorator that wraps the decorated function's output in <i> tags.
+    Decorator that awaits the decorated coroutine function and wraps its output in HTML tags.
+
+    Tag decorators return it for coroutine functions, so it can be awaited and stacked without
+    blocking the event loop.
     """
 
-    def __init__(self, func: Callable[[str], str]) -> None:
+    def __init__(self, func: Callable[..., Any], tags: Optional[Sequence[str]] = None) -> None:
         """
-        Initialize the decorator with the decorated function.
+        Initialize the decorator with the decorated coroutine function.
 
         Args:
             func: The decorated function.
+            tags: The tags, outermost first, by default the tag of the class.
         """
-        self._func = func
+        super().__init__(func, tags)
+        if hasattr(inspect, "markcoroutinefunction"):  # Python 3.12+
+            inspect.markcoroutinefunction(self)  # pylint: disable=no-member
 
-    def __call__(self, *args: str) -> str:
+    async def __call__(self, *args: Any) -> str:  # pylint: disable=invalid-overridden-method
         """
-        Call the decorated function and wrap its output in <i> tags.
+        Await the decorated coroutine function and wrap its output in the tag.
+
+        Args:
+            *args: The decorated function's arguments.
+
+        Returns:
+            The decorated function's output wrapped in the tag.
+        """
+        return f"{self._prefix}{await self._func(*args)}{self._suffix}"
+
+
+class BoldDecorator(TagDecorator):
+    """
+    Decorator that wraps the decorated function's output in <b> tags.
+    """
+
+    tag = "b"
+
+
+class ItalicDecorator(TagDecorator):
+    """
+    Decorator that wraps the decorated function's output in <i> tags.
+    """
+
+    tag = "i"
+
+
+class StreamingTagDecorator(TagDecorator):
+    """
+    Decorator that wraps the chunks produced by the decorated function in an HTML tag.
+
+    The decorated function returns an iterable of string chunks; the decorator returns an iterator
+    yielding the opening tag, the chunks as they are produced, and the closing tag. Nothing is
+    joined, so only one chunk is held at a time and streaming decorators can be stacked.
+    """
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Iterator[str]:
+        """
+        Call the decorated function and wrap its chunks in the tag.
 
         Args:
             *args: The decorated function's positional arguments.
+            **kwargs: The decorated function's keyword arguments.
+
+        Returns:
+            Iterator over the tags and the decorated function's chunks.
+        """
+        return self._stream(self._func(*args, **kwargs))
+
+    def _stream(self, chunks: Iterable[str]) -> Iterator[str]:
+        """
+        Yield the chunks between the opening and the closing tag.
+
+        Args:
+            chunks: The decorated function's chunks.
 
         Returns:
-            The decorated function's output wrapped in <i> tags.
+            Iterator over the tags and the chunks.
+        """
+        yield self._prefix
+        yield from chunks
+        yield self._suffix
+
+
+class StreamingBoldDecorator(StreamingTagDecorator):
+    """
+    Decorator that wraps the chunks produced by the decorated function in <b> tags.
+    """
+
+    tag = "b"
+
+
+class StreamingItalicDecorator(StreamingTagDecorator):
+    """
+    Decorator that wraps the chunks produced by the decorated function in <i> tags.
+    """
+
+    tag = "i"
+
+
+class FusedTagDecorator(TagDecorator):
+    """
+    Decorator that wraps the decorated function's output in several HTML tags at once.
+
+    Equivalent to stacking one tag decorator per tag, but the opening and closing tags are joined
+    up front, so a call costs one function call and one string build whatever the number of tags.
+    """
+
+    def __init__(self, func: Callable[..., Any], tags: Sequence[str]) -> None:
+        """
+        Initialize the decorator with the decorated function and its tags.
+
+        Args:
+            func: The decorated function.
+            tags: The tags, outermost first.
         """
-        return f"<i>{self._func(*args)}</i>"
+        super().__init__(func, tags)
+
+
+class FusedStreamingTagDecorator(FusedTagDecorator, StreamingTagDecorator):
+    """
+    Decorator that wraps the chunks produced by the decorated function in several HTML tags at once.
+    """
+
+
+def _fused_class(decorators: Sequence[Type[TagDecorator]]) -> Type[TagDecorator]:
+    """
+    Choose the fused decorator class matching the decorators to fuse.
+
+    Args:
+        decorators: Tag decorator classes
+
+    Returns:
+        type: FusedStreamingTagDecorator for streaming decorators, FusedTagDecorator otherwise
+
+    Raises:
+        TypeError: If streaming and non-streaming decorators are mixed
+    """
+    streaming = {issubclass(decorator, StreamingTagDecorator) for decorator in decorators}
+    if len(streaming) > 1:
+        raise TypeError("Cannot fuse streaming and non-streaming tag decorators")
+    return FusedStreamingTagDecorator if streaming == {True} else FusedTagDecorator
+
+
+def fuse_tags(*decorators: Type[TagDecorator]) -> Callable[[Callable[..., Any]], TagDecorator]:
+    """
+    Decorator applying several tag decorators as one fused wrapper.
+
+    `fuse_tags(BoldDecorator, ItalicDecorator)(func)` formats like `BoldDecorator(ItalicDecorator(func))`.
+
+    Args:
+        *decorators: Tag decorator classes, outermost first.
+
+    Returns:
+        The decorator.
+    """
+    tags = [decorator.tag for decorator in decorators]
+    fused_class = _fused_class(decorators)
+
+    def decorator(func: Callable[..., Any]) -> TagDecorator:
+        return fused_class(func, tags)
+
+    return decorator
+
+
+def fuse(decorated: TagDecorator) -> TagDecorator:
+    """
+    Fuse an already built stack of tag decorators into a single wrapper.
+
+    Args:
+        decorated: The outermost tag decorator of the stack.
+
+    Returns:
+        TagDecorator: Fused wrapper of the innermost function adding all tags of the stack
+
+    Raises:
+        TypeError: If the stack mixes streaming and non-streaming decorators
+    """
+    tags: Tuple[str, ...] = ()
+    kinds = []
+    func: Callable[..., Any] = decorated
+    while isinstance(func, TagDecorator):
+        tags += func.tags
+        kinds.append(type(func))
+        func = func.__wrapped__
+    return _fused_class(kinds)(func, tags)
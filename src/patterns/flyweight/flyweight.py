@@ -1,7 +1,13 @@
 """Flyweight module."""
 
+import threading
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple
+from itertools import groupby, repeat
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, TextIO, Tuple
+
+if TYPE_CHECKING:
+    from patterns.flyweight.flyweight_cache import BoundedCharacterFactory
 
 # pylint: disable=too-few-public-methods
 
@@ -9,6 +15,9 @@ from typing import Dict, List, Tuple
 class CharacterFlyweight(ABC):
     """Abstract class representing a character."""
 
+    # Intrinsic state shared by all occurrences of the character
+    char: str
+
     @abstractmethod
     def display(self, font: str) -> None:
         """
@@ -39,21 +48,77 @@ class ConcreteCharacter(CharacterFlyweight):
 
 
 class CharacterFactory:
-    """Flyweight Factory: Manages shared character instances."""
+    """
+    Flyweight Factory: Manages shared character instances.
+
+    By default every flyweight is kept for the lifetime of the process. Install a
+    `BoundedCharacterFactory` with `use_cache` to bound the flyweights of all editors by its policy.
+    """
 
     characters: Dict[str, CharacterFlyweight] = {}
+    bounded: Optional["BoundedCharacterFactory"] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def use_cache(cls, bounded: Optional["BoundedCharacterFactory"]) -> None:
+        """
+        Serve flyweights from a bounded factory, or from the unbounded dictionary again with None.
+
+        Args:
+            bounded: Factory whose cache policy decides which flyweights are kept
+
+        Returns:
+            None
+        """
+        with cls._lock:
+            cls.bounded = bounded
+            cls.characters.clear()
 
     @classmethod
     def get_character(cls, char: str) -> CharacterFlyweight:
         """
         Return an existing flyweight or create a new one.
 
+        Existing flyweights are returned without locking. Only a miss takes the lock and checks again,
+        so concurrent callers never create two flyweights for the same character. With a bounded
+        factory installed, the request is forwarded to it.
+
         Returns:
             CharacterFlyweight: share instance
         """
-        if char not in cls.characters:
-            cls.characters[char] = ConcreteCharacter(char)
-        return cls.characters[char]
+        bounded = cls.bounded
+        if bounded is not None:
+            return bounded.get_character(char)
+        flyweight = cls.characters.get(char)
+        if flyweight is None:
+            with cls._lock:
+                flyweight = cls.characters.get(char)
+                if flyweight is None:
+                    flyweight = ConcreteCharacter(char)
+                    cls.characters[char] = flyweight
+        return flyweight
+
+
+def render_runs(runs: Iterable[Tuple[str, str]], stream: TextIO, chunk_size: int = 8192) -> None:
+    """
+    Write runs of text in the output format of `ConcreteCharacter.display`, in large chunks.
+
+    The lines of a run only differ in their character, so each chunk is built with a single
+    `str.join` and written with a single call instead of one `print()` per character.
+
+    Args:
+        runs: Pairs of text and font
+        stream: Writable text stream, e.g. an open file or `io.StringIO`
+        chunk_size: Maximum number of characters per write
+
+    Returns:
+        None
+    """
+    for text, font in runs:
+        suffix = f"' displayed in font: {font}\n"
+        separator = suffix + "Character '"
+        for start in range(0, len(text), chunk_size):
+            stream.write("Character '" + separator.join(text[start : start + chunk_size]) + suffix)
 
 
 class TextEditorClient:
@@ -79,6 +144,35 @@ class TextEditorClient:
         flyweight = CharacterFactory.get_character(char)
         self.characters.append((flyweight, font))
 
+    def add_text(self, text: str, font: str) -> None:
+        """
+        Add a whole text in one font.
+
+        Flyweights are resolved once per distinct character, the characters are appended in bulk.
+
+        Args:
+            text: Text to add
+            font: Font to use for the text
+
+        Returns:
+            None
+        """
+        flyweights = {char: CharacterFactory.get_character(char) for char in set(text)}
+        self.characters.extend(zip(map(flyweights.__getitem__, text), repeat(font)))
+
+    def extend(self, texts: Iterable[Tuple[str, str]]) -> None:
+        """
+        Add several texts, each in its own font.
+
+        Args:
+            texts: Pairs of text and font
+
+        Returns:
+            None
+        """
+        for text, font in texts:
+            self.add_text(text, font)
+
     def render(self) -> None:
         """
         Display all characters with their respective fonts.
@@ -89,6 +183,23 @@ class TextEditorClient:
         for flyweight, font in self.characters:
             flyweight.display(font)
 
+    def render_to(self, stream: TextIO, chunk_size: int = 8192) -> None:
+        """
+        Write the same output as `render()` to a stream, grouping consecutive characters by font.
+
+        Args:
+            stream: Writable text stream
+            chunk_size: Maximum number of characters per write
+
+        Returns:
+            None
+        """
+        runs = (
+            ("".join(flyweight.char for flyweight, _ in group), font)
+            for font, group in groupby(self.characters, key=itemgetter(1))
+        )
+        render_runs(runs, stream, chunk_size)
+
 
 # Example Usage
 editor = TextEditorClient()
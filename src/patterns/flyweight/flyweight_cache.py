@@ -0,0 +1,334 @@
+"""Flyweight factory with a bounded, pluggable cache policy and hit/miss metrics."""
+
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from patterns.flyweight.flyweight import CharacterFlyweight, ConcreteCharacter
+
+
+class CachePolicy(ABC):
+    """Abstract cache policy deciding which flyweights are kept."""
+
+    def __init__(self) -> None:
+        """
+        Number of entries removed by the policy so far.
+        """
+        self.evictions = 0
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CharacterFlyweight]:
+        """
+        Return the cached flyweight for a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CharacterFlyweight: Cached flyweight, None if not cached
+        """
+
+    @abstractmethod
+    def put(self, key: str, value: CharacterFlyweight) -> None:
+        """
+        Store a flyweight, evicting other entries if needed.
+
+        Args:
+            key: Cache key
+            value: Flyweight to store
+
+        Returns:
+            None
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        Number of cached flyweights.
+
+        Returns:
+            int: Number of entries
+        """
+
+
+class LRUPolicy(CachePolicy):
+    """Keep at most `capacity` flyweights, evicting the least recently used one."""
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the policy with its capacity.
+
+        Args:
+            capacity: Maximum number of entries, at least 1
+
+        Raises:
+            ValueError: If the capacity is less than 1
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        super().__init__()
+        self.capacity = capacity
+        self._entries: OrderedDict[str, CharacterFlyweight] = OrderedDict()
+
+    def get(self, key: str) -> Optional[CharacterFlyweight]:
+        """
+        Return the cached flyweight and mark it as most recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CharacterFlyweight: Cached flyweight, None if not cached
+        """
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: CharacterFlyweight) -> None:
+        """
+        Store a flyweight, evicting the least recently used entry when full.
+
+        Args:
+            key: Cache key
+            value: Flyweight to store
+
+        Returns:
+            None
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        """
+        Number of cached flyweights.
+
+        Returns:
+            int: Number of entries
+        """
+        return len(self._entries)
+
+
+class LFUPolicy(CachePolicy):
+    """
+    Keep at most `capacity` flyweights, evicting the least frequently used one.
+
+    Entries are grouped by use count, so lookups and evictions are O(1).
+    Ties are broken by evicting the least recently used entry of the lowest count.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the policy with its capacity.
+
+        Args:
+            capacity: Maximum number of entries, at least 1
+
+        Raises:
+            ValueError: If the capacity is less than 1
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        super().__init__()
+        self.capacity = capacity
+        self._entries: Dict[str, CharacterFlyweight] = {}
+        self._counts: Dict[str, int] = {}
+        self._buckets: Dict[int, OrderedDict[str, None]] = {}
+        self._min_count = 0
+
+    def _touch(self, key: str) -> None:
+        """
+        Move a key to the bucket of its next use count.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            None
+        """
+        count = self._counts[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count = count + 1
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def get(self, key: str) -> Optional[CharacterFlyweight]:
+        """
+        Return the cached flyweight and increase its use count.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CharacterFlyweight: Cached flyweight, None if not cached
+        """
+        value = self._entries.get(key)
+        if value is not None:
+            self._touch(key)
+        return value
+
+    def put(self, key: str, value: CharacterFlyweight) -> None:
+        """
+        Store a flyweight, evicting the least frequently used entry when full.
+
+        Args:
+            key: Cache key
+            value: Flyweight to store
+
+        Returns:
+            None
+        """
+        if key in self._entries:
+            self._entries[key] = value
+            self._touch(key)
+            return
+        if len(self._entries) >= self.capacity:
+            bucket = self._buckets[self._min_count]
+            evicted, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._min_count]
+            del self._entries[evicted]
+            del self._counts[evicted]
+            self.evictions += 1
+        self._entries[key] = value
+        self._counts[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_count = 1
+
+    def __len__(self) -> int:
+        """
+        Number of cached flyweights.
+
+        Returns:
+            int: Number of entries
+        """
+        return len(self._entries)
+
+
+class WeakValuePolicy(CachePolicy):
+    """
+    Keep flyweights only as long as somebody else references them.
+
+    Collected flyweights are removed by weak reference callbacks, which run in whichever thread
+    triggers the garbage collection, also while the factory lock is held. The policy therefore
+    guards its entries with its own reentrant lock.
+    """
+
+    def __init__(self) -> None:
+        """
+        Weak references to the flyweights by key.
+        """
+        super().__init__()
+        self._refs: Dict[str, "weakref.ref[CharacterFlyweight]"] = {}
+        self._lock = threading.RLock()
+
+    def _on_collected(self, key: str, ref: "weakref.ref[CharacterFlyweight]") -> None:
+        """
+        Drop the entry of a flyweight that has been garbage collected.
+
+        Args:
+            key: Cache key
+            ref: The dead weak reference
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._refs.get(key) is ref:
+                del self._refs[key]
+                self.evictions += 1
+
+    def get(self, key: str) -> Optional[CharacterFlyweight]:
+        """
+        Return the flyweight if it is still alive.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CharacterFlyweight: Cached flyweight, None if not cached
+        """
+        with self._lock:
+            ref = self._refs.get(key)
+        return None if ref is None else ref()
+
+    def put(self, key: str, value: CharacterFlyweight) -> None:
+        """
+        Store a weak reference to the flyweight.
+
+        Args:
+            key: Cache key
+            value: Flyweight to store
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._refs[key] = weakref.ref(value, lambda ref: self._on_collected(key, ref))
+
+    def __len__(self) -> int:
+        """
+        Number of cached flyweights.
+
+        Returns:
+            int: Number of entries
+        """
+        with self._lock:
+            return len(self._refs)
+
+
+class BoundedCharacterFactory:
+    """Flyweight Factory: Manages shared character instances within the limits of a cache policy."""
+
+    def __init__(self, policy: Optional[CachePolicy] = None) -> None:
+        """
+        Initialize the factory with a cache policy, a LRU cache of 1024 entries by default.
+
+        Args:
+            policy: Cache policy deciding which flyweights are kept
+        """
+        self.policy = policy if policy is not None else LRUPolicy(1024)
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get_character(self, char: str) -> CharacterFlyweight:
+        """
+        Return a cached flyweight or create a new one.
+
+        Returns:
+            CharacterFlyweight: shared instance
+        """
+        with self._lock:
+            flyweight = self.policy.get(char)
+            if flyweight is None:
+                self.misses += 1
+                flyweight = ConcreteCharacter(char)
+                self.policy.put(char, flyweight)
+            else:
+                self.hits += 1
+            return flyweight
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters to be scraped by a metrics system.
+
+        Returns:
+            dict: Hits, misses, evictions and current size
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.policy.evictions,
+                "size": len(self.policy),
+            }
@@ -0,0 +1,264 @@
+"""Flyweight module with a compact, array-backed text storage."""
+
+import sys
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterable, Iterator, List, TextIO, Tuple
+
+from patterns.flyweight.flyweight import (
+    CharacterFactory,
+    CharacterFlyweight,
+    render_runs,
+)
+
+# Encoding producing the native layout of array("I"), so text can be appended with a single copy
+CODE_POINT_ENCODING = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+
+class FontTable:
+    """Interned font names, each identified by a small integer id."""
+
+    def __init__(self) -> None:
+        """
+        Font names in id order plus the reverse lookup.
+        """
+        self._fonts: List[str] = []
+        self._ids: Dict[str, int] = {}
+
+    def intern(self, font: str) -> int:
+        """
+        Return the id of a font, registering it on first use.
+
+        Args:
+            font: Font name
+
+        Returns:
+            int: Font id
+        """
+        font_id = self._ids.get(font)
+        if font_id is None:
+            font_id = len(self._fonts)
+            self._fonts.append(font)
+            self._ids[font] = font_id
+        return font_id
+
+    def __getitem__(self, font_id: int) -> str:
+        """
+        Return the font name for an id.
+
+        Args:
+            font_id: Font id
+
+        Returns:
+            str: Font name
+        """
+        return self._fonts[font_id]
+
+    def __len__(self) -> int:
+        """
+        Number of distinct fonts.
+
+        Returns:
+            int: Number of fonts
+        """
+        return len(self._fonts)
+
+
+class FontRuns:
+    """
+    Run-length encoded fonts: consecutive characters in the same font share one run.
+
+    Runs are stored as their start positions and font ids; a run ends where the next one starts.
+    """
+
+    def __init__(self) -> None:
+        """
+        Start positions and font ids of the runs, plus the total number of characters covered.
+        """
+        self.starts = array("Q")
+        self.font_ids = array("H")
+        self._length = 0
+
+    def append(self, font_id: int, count: int = 1) -> None:
+        """
+        Append `count` characters in the given font, extending the last run if the font matches.
+
+        Args:
+            font_id: Font id of the characters
+            count: Number of characters
+
+        Returns:
+            None
+        """
+        if not self.font_ids or self.font_ids[-1] != font_id:
+            self.starts.append(self._length)
+            self.font_ids.append(font_id)
+        self._length += count
+
+    def font_id_at(self, position: int) -> int:
+        """
+        Return the font id at a position with a binary search over the runs, O(log n).
+
+        Args:
+            position: Position in the text
+
+        Returns:
+            int: Font id
+        """
+        if not 0 <= position < self._length:
+            raise IndexError("position out of range")
+        return self.font_ids[bisect_right(self.starts, position) - 1]
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        """
+        Iterate over the runs.
+
+        Returns:
+            Iterator: `(start, stop, font_id)` per run
+        """
+        stops = self.starts[1:]
+        stops.append(self._length)
+        return zip(self.starts, stops, self.font_ids)
+
+    def __len__(self) -> int:
+        """
+        Number of runs.
+
+        Returns:
+            int: Number of runs
+        """
+        return len(self.starts)
+
+
+class CompactTextEditorClient:
+    """
+    Text editor storing its text as packed code points and run-length encoded fonts.
+
+    A character costs 4 bytes for its code point, fonts only cost one entry per run, instead of a list
+    slot plus a `(CharacterFlyweight, str)` tuple per character. The flyweights are looked up from the
+    `CharacterFactory` when the text is rendered.
+    """
+
+    def __init__(self) -> None:
+        """
+        Code points, font runs and the interned font table.
+        """
+        self.code_points = array("I")
+        self.runs = FontRuns()
+        self.fonts = FontTable()
+
+    def add_character(self, char: str, font: str) -> None:
+        """
+        Add a new character to the text and set its font.
+
+        Args:
+            char: Char to add
+            font: Font to use for the character
+
+        Returns:
+            None
+        """
+        CharacterFactory.get_character(char)
+        self.code_points.append(ord(char))
+        self.runs.append(self.fonts.intern(font))
+
+    def add_text(self, text: str, font: str) -> None:
+        """
+        Add a whole text in one font.
+
+        Flyweights are resolved once per distinct character and the code points are copied into
+        the array in a single step, without a Python-level loop over the characters.
+
+        Args:
+            text: Text to add
+            font: Font to use for the text
+
+        Returns:
+            None
+        """
+        if not text:
+            return
+        for char in set(text):
+            CharacterFactory.get_character(char)
+        self.code_points.frombytes(text.encode(CODE_POINT_ENCODING))
+        self.runs.append(self.fonts.intern(font), len(text))
+
+    def extend(self, texts: Iterable[Tuple[str, str]]) -> None:
+        """
+        Add several texts, each in its own font.
+
+        Args:
+            texts: Pairs of text and font
+
+        Returns:
+            None
+        """
+        for text, font in texts:
+            self.add_text(text, font)
+
+    def __len__(self) -> int:
+        """
+        Number of characters in the text.
+
+        Returns:
+            int: Number of characters
+        """
+        return len(self.code_points)
+
+    def __getitem__(self, index: int) -> Tuple[CharacterFlyweight, str]:
+        """
+        Return a character the way `TextEditorClient.characters` stores it.
+
+        Args:
+            index: Position in the text
+
+        Returns:
+            tuple: Flyweight and font of the character
+        """
+        if index < 0:
+            index += len(self.code_points)
+        return CharacterFactory.get_character(chr(self.code_points[index])), self.font_at(index)
+
+    def font_at(self, position: int) -> str:
+        """
+        Return the font of the character at a position.
+
+        Args:
+            position: Position in the text
+
+        Returns:
+            str: Font name
+        """
+        return self.fonts[self.runs.font_id_at(position)]
+
+    def render(self) -> None:
+        """
+        Display all characters with their respective fonts, resolving the font once per run.
+
+        Returns:
+            None
+        """
+        code_points = memoryview(self.code_points)
+        for start, stop, font_id in self.runs:
+            font = self.fonts[font_id]
+            for code_point in code_points[start:stop]:
+                CharacterFactory.get_character(chr(code_point)).display(font)
+
+    def render_to(self, stream: TextIO, chunk_size: int = 8192) -> None:
+        """
+        Write the same output as `render()` to a stream, decoding at most `chunk_size` characters at a time.
+
+        Args:
+            stream: Writable text stream
+            chunk_size: Maximum number of characters per write
+
+        Returns:
+            None
+        """
+        code_points = memoryview(self.code_points)
+        chunks = (
+            (code_points[offset : min(offset + chunk_size, stop)].tobytes().decode(CODE_POINT_ENCODING), font)
+            for start, stop, font in ((start, stop, self.fonts[font_id]) for start, stop, font_id in self.runs)
+            for offset in range(start, stop, chunk_size)
+        )
+        render_runs(chunks, stream, chunk_size)
@@ -0,0 +1,295 @@
+"""
+Binary, memory-mappable document format for the compact flyweight editor.
+
+Layout (native byte order, every section aligned to 8 bytes):
+    header      magic, version, byte order mark, font count, char count, run count
+    font table  per font: uint16 length + UTF-8 name
+    code points uint32 per character
+    run starts  uint64 per font run
+    run fonts   uint16 font id per font run
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from bisect import bisect_right
+from types import TracebackType
+from typing import BinaryIO, Iterator, List, Optional, TextIO, Tuple, Type
+
+from patterns.flyweight.flyweight import (
+    CharacterFactory,
+    CharacterFlyweight,
+    render_runs,
+)
+from patterns.flyweight.flyweight_compact import (
+    CODE_POINT_ENCODING,
+    CompactTextEditorClient,
+)
+
+MAGIC = b"FLYW"
+VERSION = 1
+BYTE_ORDER_MARK = 0xFEFF
+HEADER = struct.Struct("=4sHHIQQ")
+FONT_LENGTH = struct.Struct("=H")
+ALIGNMENT = 8
+
+
+def _aligned(offset: int) -> int:
+    """
+    Round an offset up to the section alignment.
+
+    Args:
+        offset: Offset in bytes
+
+    Returns:
+        int: Aligned offset
+    """
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+def _pad(file: BinaryIO) -> None:
+    """
+    Write zero bytes up to the next aligned offset.
+
+    Args:
+        file: File opened for binary writing
+
+    Returns:
+        None
+    """
+    position = file.tell()
+    file.write(b"\0" * (_aligned(position) - position))
+
+
+def save_document(editor: CompactTextEditorClient, path: str) -> None:
+    """
+    Save the text and fonts of an editor in the binary document format.
+
+    Args:
+        editor: Editor to save
+        path: Target file
+
+    Returns:
+        None
+    """
+    fonts = [editor.fonts[font_id].encode("utf-8") for font_id in range(len(editor.fonts))]
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, BYTE_ORDER_MARK, len(fonts), len(editor), len(editor.runs)))
+        _pad(file)
+        for font in fonts:
+            file.write(FONT_LENGTH.pack(len(font)) + font)
+        _pad(file)
+        editor.code_points.tofile(file)
+        _pad(file)
+        editor.runs.starts.tofile(file)
+        editor.runs.font_ids.tofile(file)
+
+
+def _read_fonts(data: mmap.mmap, count: int, path: str) -> Tuple[List[str], int]:
+    """
+    Read the font table following the header.
+
+    Args:
+        data: Mapped document
+        count: Number of fonts
+        path: Document file, for error messages
+
+    Returns:
+        tuple: Font names and the offset after the table
+
+    Raises:
+        ValueError: If the table is cut off
+    """
+    fonts = []
+    offset = _aligned(HEADER.size)
+    for _ in range(count):
+        if offset + FONT_LENGTH.size > len(data):
+            raise ValueError(f"{path} is truncated")
+        (length,) = FONT_LENGTH.unpack_from(data, offset)
+        offset += FONT_LENGTH.size
+        if offset + length > len(data):
+            raise ValueError(f"{path} is truncated")
+        fonts.append(data[offset : offset + length].decode("utf-8"))
+        offset += length
+    return fonts, offset
+
+
+class MappedDocument:
+    """
+    Read-only document mapped into memory.
+
+    Opening is independent of the document size: characters and runs are accessed in place in
+    the mapped file, and only the slices that are read or rendered are paged in and decoded.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        Map the file and locate its sections.
+
+        Args:
+            path: Document file written by `save_document`
+        """
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        views: List[memoryview] = []
+        try:
+            if len(self._mmap) < HEADER.size:
+                raise ValueError(f"{path} is truncated inside its header")
+            magic, version, byte_order_mark, font_count, char_count, run_count = HEADER.unpack_from(self._mmap)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a flyweight document of version {VERSION}")
+            if byte_order_mark != BYTE_ORDER_MARK:
+                raise ValueError(f"{path} was written with a different byte order")
+
+            self.fonts, offset = _read_fonts(self._mmap, font_count, path)
+            text_offset = _aligned(offset)
+            starts_offset = _aligned(text_offset + 4 * char_count)
+            font_ids_offset = starts_offset + 8 * run_count
+            if font_ids_offset + 2 * run_count > len(self._mmap):
+                raise ValueError(f"{path} is truncated")
+
+            views.append(memoryview(self._mmap))
+            self._text = views[0][text_offset : text_offset + 4 * char_count]
+            views.append(self._text)
+            self.code_points = self._text.cast("I")
+            views.append(self.code_points)
+            self.run_starts = views[0][starts_offset:font_ids_offset].cast("Q")
+            views.append(self.run_starts)
+            self.run_font_ids = views[0][font_ids_offset : font_ids_offset + 2 * run_count].cast("H")
+            views[0].release()
+        except Exception:
+            # Views export the mapping, it can only be closed once they are released
+            for view in reversed(views):
+                view.release()
+            self._mmap.close()
+            raise
+
+    def __len__(self) -> int:
+        """
+        Number of characters in the document.
+
+        Returns:
+            int: Number of characters
+        """
+        return len(self.code_points)
+
+    def __getitem__(self, index: int) -> Tuple[CharacterFlyweight, str]:
+        """
+        Return a character the way `TextEditorClient.characters` stores it.
+
+        Args:
+            index: Position in the text
+
+        Returns:
+            tuple: Flyweight and font of the character
+        """
+        if index < 0:
+            index += len(self)
+        return CharacterFactory.get_character(chr(self.code_points[index])), self.font_at(index)
+
+    def font_at(self, position: int) -> str:
+        """
+        Return the font at a position with a binary search over the runs.
+
+        Args:
+            position: Position in the text
+
+        Returns:
+            str: Font name
+        """
+        if not 0 <= position < len(self):
+            raise IndexError("position out of range")
+        return self.fonts[self.run_font_ids[bisect_right(self.run_starts, position) - 1]]
+
+    def text(self, start: int = 0, stop: Optional[int] = None) -> str:
+        """
+        Decode a slice of the text.
+
+        Args:
+            start: First position
+            stop: Position after the last one, end of the document by default
+
+        Returns:
+            str: The text of the slice
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        return self._text[4 * start : 4 * max(start, stop)].tobytes().decode(CODE_POINT_ENCODING)
+
+    def runs(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Tuple[int, int, str]]:
+        """
+        Iterate over the font runs overlapping a slice, clipped to the slice.
+
+        Args:
+            start: First position
+            stop: Position after the last one, end of the document by default
+
+        Returns:
+            Iterator: `(start, stop, font)` per run
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        index = bisect_right(self.run_starts, start) - 1
+        while start < stop:
+            run_stop = self.run_starts[index + 1] if index + 1 < len(self.run_starts) else len(self)
+            yield start, min(run_stop, stop), self.fonts[self.run_font_ids[index]]
+            start = run_stop
+            index += 1
+
+    def render_to(self, stream: TextIO, start: int = 0, stop: Optional[int] = None, chunk_size: int = 8192) -> None:
+        """
+        Write a slice in the output format of `TextEditorClient.render()`.
+
+        Args:
+            stream: Writable text stream
+            start: First position
+            stop: Position after the last one, end of the document by default
+            chunk_size: Maximum number of characters per write
+
+        Returns:
+            None
+        """
+        chunks = (
+            (self.text(offset, min(offset + chunk_size, run_stop)), font)
+            for run_start, run_stop, font in self.runs(start, stop)
+            for offset in range(run_start, run_stop, chunk_size)
+        )
+        render_runs(chunks, stream, chunk_size)
+
+    def close(self) -> None:
+        """
+        Release the views and unmap the file.
+
+        Returns:
+            None
+        """
+        for view in (self.code_points, self._text, self.run_starts, self.run_font_ids):
+            view.release()
+        self._mmap.close()
+
+    def __enter__(self) -> MappedDocument:
+        """
+        Use the document as a context manager.
+
+        Returns:
+            MappedDocument: The document itself
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """
+        Close the document when leaving the context.
+
+        Args:
+            exc_type: Type of a raised exception
+            exc_value: Raised exception
+            traceback: Traceback of a raised exception
+
+        Returns:
+            None
+        """
+        self.close()
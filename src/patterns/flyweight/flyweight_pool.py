@@ -0,0 +1,150 @@
+"""General-purpose flyweight pool interning arbitrary hashable, immutable values."""
+
+import threading
+import weakref
+from typing import Any, Dict, Generic, Hashable, List, Tuple, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+_MISSING: Any = object()
+
+
+def _typed_key(value: Any) -> Hashable:
+    """
+    Key telling apart equal values of different types, e.g. `(True, "a")` and `(1.0, "a")`.
+
+    Tuples and frozensets are keyed by the types of their items too, other values by their own type.
+
+    Args:
+        value: Hashable value
+
+    Returns:
+        Hashable: Key equal only for values of the same types
+    """
+    value_type = type(value)
+    if value_type is tuple:
+        item_types: Tuple[Hashable, ...] = tuple(map(type, value))
+        if tuple in item_types or frozenset in item_types:
+            item_types = tuple(map(_typed_key, value))
+        return value, item_types
+    if value_type is frozenset:
+        return value, frozenset(map(_typed_key, value))
+    return value_type, value
+
+
+# pylint: disable=too-few-public-methods
+class _Shard(Generic[T]):
+    """Part of the pool with its own lock, so threads interning different values rarely contend."""
+
+    def __init__(self) -> None:
+        """
+        Canonical values held strongly or weakly, plus the shard's counters.
+        """
+        self.lock = threading.Lock()
+        self.strong: Dict[Hashable, T] = {}
+        self.weak: "Dict[type, weakref.WeakKeyDictionary[T, weakref.ref[T]]]" = {}
+        self.hits = 0
+        self.misses = 0
+
+
+class FlyweightPool(Generic[T]):
+    """
+    Pool returning one canonical instance per distinct value.
+
+    Works for any hashable value that is treated as immutable, e.g. tuples, bytes or frozen
+    dataclasses. With `weak=True`, values supporting weak references are dropped from the pool
+    once nothing else uses them; values without weak reference support (tuples, bytes, str, int)
+    are always kept.
+
+    With `typed=True`, values that are equal but of different types stay distinct, also inside
+    tuples and frozensets, so `(1, "a")` is not replaced by `(1.0, "a")`. Turn it off to intern
+    faster when values of one type are pooled.
+    """
+
+    def __init__(self, shards: int = 16, weak: bool = True, typed: bool = True) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            shards: Number of independently locked shards
+            weak: Hold values by weak reference where possible
+            typed: Keep equal values of different types apart
+        """
+        self.weak = weak
+        self.typed = typed
+        self._shards: List[_Shard[T]] = [_Shard() for _ in range(shards)]
+
+    def intern(self, value: T) -> T:
+        """
+        Return the canonical instance equal to `value`, registering `value` if there is none.
+
+        Args:
+            value: Hashable, immutable value
+
+        Returns:
+            T: The canonical instance
+        """
+        key = _typed_key(value) if self.typed else value
+        shard = self._shards[hash(key) % len(self._shards)]
+        value_type = type(value)
+        weakable = self.weak and value_type.__weakrefoffset__ != 0
+        # Weakly held values are keyed by the value itself, so they are kept apart by their type only
+        bucket = value_type if self.typed else object
+        with shard.lock:
+            existing = _MISSING
+            if weakable:
+                values = shard.weak.get(bucket)
+                ref = None if values is None else values.get(value)
+                alive = None if ref is None else ref()
+                if alive is not None:
+                    existing = alive
+            else:
+                existing = shard.strong.get(key, _MISSING)
+            if existing is not _MISSING:
+                shard.hits += 1
+                return existing  # type: ignore[no-any-return]
+
+            shard.misses += 1
+            if weakable:
+                if values is None:
+                    values = shard.weak[bucket] = weakref.WeakKeyDictionary()
+                values[value] = weakref.ref(value)
+            else:
+                shard.strong[key] = value
+            return value
+
+    def __len__(self) -> int:
+        """
+        Number of canonical values in the pool.
+
+        Returns:
+            int: Number of values
+        """
+        return sum(len(shard.strong) + sum(map(len, shard.weak.values())) for shard in self._shards)
+
+    def clear(self) -> None:
+        """
+        Remove all values and reset the counters.
+
+        Returns:
+            None
+        """
+        for shard in self._shards:
+            with shard.lock:
+                shard.strong.clear()
+                shard.weak.clear()
+                shard.hits = shard.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters summed over all shards.
+
+        Returns:
+            dict: Hits, misses and the number of strongly and weakly held values
+        """
+        return {
+            "hits": sum(shard.hits for shard in self._shards),
+            "misses": sum(shard.misses for shard in self._shards),
+            "strong": sum(len(shard.strong) for shard in self._shards),
+            "weak": sum(len(values) for shard in self._shards for values in shard.weak.values()),
+        }
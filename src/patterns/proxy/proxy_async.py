@@ -0,0 +1,175 @@
+"""Module realizing an asyncio Proxy that coalesces identical requests and batches distinct ones."""
+
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from patterns.proxy.proxy import Subject
+
+BatchFunction = Callable[[List[Tuple[Hashable, ...]]], Awaitable[Sequence[Union[str, Exception]]]]
+
+
+# pylint: disable=too-many-instance-attributes
+class AsyncBatchingProxy:
+    """
+    The AsyncBatchingProxy collects concurrent requests and answers them with one backend call.
+
+    Requests are queued until `max_batch_size` distinct requests are waiting or `max_delay` seconds
+    passed since the first one, then the batch function is awaited once with all their arguments.
+    A request identical to one that is queued or in flight shares its result instead of being
+    queued again. Results are not kept after a batch completed; combine with a cache for that.
+
+    The batch function returns one result per request, in order. An exception in that list fails
+    only its own request, an exception raised by the batch function fails the whole batch.
+    A proxy must only be used from one event loop.
+    """
+
+    def __init__(self, batch_function: BatchFunction, max_batch_size: int = 100, max_delay: float = 0.001) -> None:
+        """
+        Initialize the proxy with its backend.
+
+        Args:
+            batch_function: Coroutine function answering a list of request arguments
+            max_batch_size: Maximum number of distinct requests per backend call
+            max_delay: Seconds to wait for more requests after the first one of a batch
+
+        Returns:
+            None
+        """
+        self._batch_function = batch_function
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._queue: Dict[Tuple[Hashable, ...], "asyncio.Future[str]"] = {}
+        self._pending: Dict[Tuple[Hashable, ...], "asyncio.Future[str]"] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._stats = {"requests": 0, "coalesced": 0, "batches": 0, "backend_requests": 0}
+
+    @classmethod
+    def from_subject(
+        cls, subject: Subject, max_batch_size: int = 100, max_delay: float = 0.001
+    ) -> "AsyncBatchingProxy":
+        """
+        Create a proxy for a synchronous subject, answering each batch in one worker thread.
+
+        Args:
+            subject: Subject answering the requests
+            max_batch_size: Maximum number of distinct requests per backend call
+            max_delay: Seconds to wait for more requests after the first one of a batch
+
+        Returns:
+            AsyncBatchingProxy
+        """
+
+        def answer(keys: List[Tuple[Hashable, ...]]) -> List[Union[str, Exception]]:
+            results: List[Union[str, Exception]] = []
+            for key in keys:
+                try:
+                    results.append(subject.do_action(*key))
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    results.append(error)
+            return results
+
+        async def batch_function(keys: List[Tuple[Hashable, ...]]) -> List[Union[str, Exception]]:
+            return await asyncio.to_thread(answer, keys)
+
+        return cls(batch_function, max_batch_size, max_delay)
+
+    async def do_action(self, *args: Hashable) -> str:
+        """
+        Work done via the Proxy: queue the request, or join an identical one, and await its result.
+
+        Args:
+            *args: Request arguments, passed on to the batch function and used to coalesce requests
+
+        Returns:
+            String
+        """
+        self._stats["requests"] += 1
+        future = self._pending.get(args)
+        if future is not None:
+            self._stats["coalesced"] += 1
+        else:
+            future = self._pending[args] = asyncio.get_running_loop().create_future()
+            self._queue[args] = future
+            if len(self._queue) >= self._max_batch_size:
+                self.flush()
+            elif self._timer is None:
+                self._timer = asyncio.get_running_loop().call_later(self._max_delay, self.flush)
+        # A cancelled caller must not cancel the request for the others waiting on it
+        return await asyncio.shield(future)
+
+    def flush(self) -> None:
+        """
+        Send the queued requests to the backend now.
+
+        Returns:
+            None
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._queue:
+            return
+        batch, self._queue = self._queue, {}
+        task = asyncio.get_running_loop().create_task(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch: Dict[Tuple[Hashable, ...], "asyncio.Future[str]"]) -> None:
+        """
+        Await the batch function and hand each result to its request.
+
+        Args:
+            batch: Futures of the batched requests by arguments
+
+        Returns:
+            None
+        """
+        self._stats["batches"] += 1
+        self._stats["backend_requests"] += len(batch)
+        keys = list(batch)
+        results: Optional[Sequence[Union[str, Exception]]] = None
+        try:
+            results = await self._batch_function(keys)
+            if len(results) != len(keys):
+                raise ValueError(f"Batch function returned {len(results)} results for {len(keys)} requests")
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            results = [error] * len(keys)
+        finally:
+            # Also runs when the dispatch is cancelled, so no request is left pending forever
+            for index, key in enumerate(keys):
+                del self._pending[key]
+                future = batch[key]
+                if future.done():
+                    continue
+                if results is None:
+                    future.cancel()
+                    continue
+                result = results[index]
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Batching statistics.
+
+        Returns:
+            dict: Requests, coalesced requests, batches, requests sent to the backend and mean batch size
+        """
+        stats: Dict[str, Any] = dict(self._stats)
+        stats["mean_batch_size"] = stats["backend_requests"] / stats["batches"] if stats["batches"] else 0.0
+        return stats
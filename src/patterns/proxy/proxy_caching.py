@@ -0,0 +1,323 @@
+"""Module realizing a caching Proxy with pluggable eviction, expiry and single-flight loading."""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Tuple
+
+from patterns.proxy.proxy import Subject
+
+
+class CacheEntry(NamedTuple):
+    """Cached outcome of a real request: its result, or the exception it raised."""
+
+    expires: float
+    result: Optional[str]
+    error: Optional[Exception]
+
+
+class EvictionPolicy(ABC):
+    """Abstract eviction policy deciding which cached results are kept."""
+
+    def __init__(self) -> None:
+        """
+        Number of entries removed by the policy so far.
+        """
+        self.evictions = 0
+
+    @abstractmethod
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Return the cached entry for a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CacheEntry: Cached entry, None if not cached
+        """
+
+    @abstractmethod
+    def put(self, key: Hashable, entry: CacheEntry) -> None:
+        """
+        Store an entry, evicting other entries if needed.
+
+        Args:
+            key: Cache key
+            entry: Entry to store
+
+        Returns:
+            None
+        """
+
+    @abstractmethod
+    def discard(self, key: Hashable) -> None:
+        """
+        Remove an entry if it is cached.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            None
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all entries.
+
+        Returns:
+            None
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """
+        Number of cached entries.
+
+        Returns:
+            int: Number of entries
+        """
+
+
+class FIFOEviction(EvictionPolicy):
+    """Keep at most `capacity` entries, evicting the oldest one. Hits do not reorder entries."""
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the policy with its capacity.
+
+        Args:
+            capacity: Maximum number of entries, at least 1
+
+        Raises:
+            ValueError: If the capacity is less than 1
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        super().__init__()
+        self.capacity = capacity
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Return the cached entry for a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CacheEntry: Cached entry, None if not cached
+        """
+        return self._entries.get(key)
+
+    def put(self, key: Hashable, entry: CacheEntry) -> None:
+        """
+        Store an entry, evicting the oldest entry when full.
+
+        Args:
+            key: Cache key
+            entry: Entry to store
+
+        Returns:
+            None
+        """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Remove an entry if it is cached.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            None
+        """
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+
+        Returns:
+            None
+        """
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """
+        Number of cached entries.
+
+        Returns:
+            int: Number of entries
+        """
+        return len(self._entries)
+
+
+class LRUEviction(FIFOEviction):
+    """Keep at most `capacity` entries, evicting the least recently used one."""
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Return the cached entry and mark it as most recently used.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CacheEntry: Cached entry, None if not cached
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+
+# pylint: disable=too-many-instance-attributes
+class CachingProxy(Subject):
+    """
+    The CachingProxy answers repeated requests from a cache instead of the real subject.
+
+    Results are keyed by the request arguments and expire after `ttl` seconds. With `negative_ttl`
+    set, exceptions of the real subject are cached too, and raised again until they expire.
+    Concurrent misses for the same key are coalesced: one caller does the real request while the
+    others wait for its outcome, so a cold or expired key never stampedes the real subject.
+    """
+
+    def __init__(
+        self,
+        real_object: Subject,
+        policy: Optional[EvictionPolicy] = None,
+        ttl: Optional[float] = None,
+        negative_ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        The CachingProxy maintains a reference to the real subject and its cache.
+
+        Args:
+            real_object: Subject answering cache misses
+            policy: Eviction policy, a LRU cache of 128 entries by default
+            ttl: Seconds a result stays valid, None for no expiry
+            negative_ttl: Seconds an exception stays cached, None to never cache exceptions
+            clock: Monotonic time source in seconds
+
+        Returns:
+            None
+        """
+        self._real_object = real_object
+        self.policy = policy if policy is not None else LRUEviction(128)
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, "Future[str]"] = {}
+        self._stats = {"hits": 0, "negative_hits": 0, "misses": 0, "coalesced": 0, "expirations": 0}
+
+    def do_action(self, *args: Hashable) -> str:
+        """
+        Work done via the Proxy: answer from the cache, or forward to the real subject once.
+
+        Args:
+            *args: Request arguments, passed on to the real subject and used as cache key
+
+        Returns:
+            String
+        """
+        with self._lock:
+            entry = self.policy.get(args)
+            if entry is not None:
+                if self._clock() < entry.expires:
+                    if entry.error is not None:
+                        self._stats["negative_hits"] += 1
+                        # The traceback is reset per hit, so it does not pile up on the shared exception
+                        raise entry.error.with_traceback(None)
+                    self._stats["hits"] += 1
+                    return entry.result  # type: ignore[return-value]
+                self.policy.discard(args)
+                self._stats["expirations"] += 1
+            future = self._in_flight.get(args)
+            leader = future is None
+            if future is None:
+                future = self._in_flight[args] = Future()
+                self._stats["misses"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if leader:
+            self._load(args, future)
+        return future.result()
+
+    def _load(self, key: Tuple[Any, ...], future: "Future[str]") -> None:
+        """
+        Forward a request to the real subject and publish its outcome to the cache and any waiters.
+
+        Args:
+            key: Request arguments
+            future: Future the other callers of this key wait on
+
+        Returns:
+            None
+        """
+        try:
+            try:
+                result = self._real_object.do_action(*key)
+            except BaseException as error:  # pylint: disable=broad-exception-caught
+                # Waiters are released for any exception, including KeyboardInterrupt and SystemExit
+                future.set_exception(error)
+                if self._negative_ttl is not None and isinstance(error, Exception):
+                    entry = CacheEntry(self._clock() + self._negative_ttl, None, error)
+                    with self._lock:
+                        self.policy.put(key, entry)
+            else:
+                future.set_result(result)
+                expires = float("inf") if self._ttl is None else self._clock() + self._ttl
+                with self._lock:
+                    self.policy.put(key, CacheEntry(expires, result, None))
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def invalidate(self, *args: Hashable) -> None:
+        """
+        Drop the cached outcome of a request.
+
+        Args:
+            *args: Request arguments
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self.policy.discard(args)
+
+    def clear(self) -> None:
+        """
+        Drop all cached outcomes.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self.policy.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics.
+
+        Returns:
+            dict: Hits, negative hits, misses, coalesced misses, expirations, evictions, size and hit rate
+        """
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats, evictions=self.policy.evictions, size=len(self.policy))
+        requests = stats["hits"] + stats["negative_hits"] + stats["misses"] + stats["coalesced"]
+        stats["hit_rate"] = (stats["hits"] + stats["negative_hits"]) / requests if requests else 0.0
+        return stats
@@ -0,0 +1,208 @@
+"""Module realizing a protection Proxy with cached access decisions and deferred access logging."""
+
+import logging
+import logging.handlers
+import queue
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from patterns.proxy.proxy import Subject
+
+ACCESS_LOGGER = logging.getLogger(__name__)
+
+
+class AccessPolicy:
+    """
+    Decides whether a principal may perform an operation.
+
+    The rules are only consulted once per principal and operation; the decision is kept in a table
+    until it is invalidated, so a repeated check is a single dict lookup.
+    """
+
+    def __init__(self, rules: Callable[[str, str], bool]) -> None:
+        """
+        Initialize the policy with its rules.
+
+        Args:
+            rules: Callable deciding whether a principal may perform an operation
+
+        Returns:
+            None
+        """
+        self._rules = rules
+        self._decisions: Dict[Tuple[str, str], bool] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def is_allowed(self, principal: str, operation: str) -> bool:
+        """
+        Check whether a principal may perform an operation.
+
+        Args:
+            principal: Who asks, e.g. a user or service name
+            operation: What they ask for
+
+        Returns:
+            bool
+        """
+        try:
+            return self._decisions[principal, operation]
+        except KeyError:
+            pass
+        generation = self._generation
+        allowed = self._rules(principal, operation)
+        with self._lock:
+            # A decision computed while the rules changed may be stale, so it is not remembered
+            if generation == self._generation:
+                self._decisions[principal, operation] = allowed
+        return allowed
+
+    def invalidate(self, principal: Optional[str] = None) -> None:
+        """
+        Forget cached decisions after the rules changed.
+
+        Args:
+            principal: Only forget the decisions of this principal, None to forget all
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._generation += 1
+            if principal is None:
+                self._decisions.clear()
+            else:
+                for key in [key for key in self._decisions if key[0] == principal]:
+                    del self._decisions[key]
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    The standard QueueHandler formats every message before queueing it, so the logging thread
+    still pays for it. This handler queues the record as is; message arguments must therefore not
+    be mutated after logging.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> Any:
+        """
+        Queue the record unformatted.
+
+        Args:
+            record: Log record
+
+        Returns:
+            logging.LogRecord: The same record
+        """
+        return record
+
+
+# pylint: disable=too-few-public-methods
+class DeferredLogging:
+    """
+    Handle of a logger whose records are deferred to a background thread.
+
+    While deferred, the logger does not propagate its records to its ancestors, whose handlers
+    would otherwise still run in the logging thread. `stop()` flushes the queue, detaches the
+    queue handler and restores propagation.
+    """
+
+    def __init__(self, logger: logging.Logger, *handlers: logging.Handler) -> None:
+        """
+        Attach a queue handler to the logger and start the listener thread.
+
+        Args:
+            logger: Logger whose records are deferred
+            *handlers: Handlers formatting and writing the records
+
+        Returns:
+            None
+        """
+        records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self.logger = logger
+        self.handler = DeferredQueueHandler(records)
+        self.listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+        self._propagate = logger.propagate
+        self.listener.start()
+        logger.addHandler(self.handler)
+        logger.propagate = False
+
+    def stop(self) -> None:
+        """
+        Detach the queue handler, restore propagation and write the records still queued.
+
+        Returns:
+            None
+        """
+        if self.handler not in self.logger.handlers:
+            return
+        self.logger.removeHandler(self.handler)
+        self.logger.propagate = self._propagate
+        self.listener.stop()
+
+
+def defer_logging(logger: logging.Logger, *handlers: logging.Handler) -> DeferredLogging:
+    """
+    Route a logger's records through a queue to handlers running in a background thread.
+
+    Until the deferral is stopped, `logger.propagate` is False for the whole process: handlers of its
+    ancestors, e.g. on the root logger or pytest's `caplog`, no longer see its records. Pass them
+    in `handlers` to keep them receiving the records, written in the background thread.
+
+    Args:
+        logger: Logger whose records are deferred
+        *handlers: Handlers formatting and writing the records
+
+    Returns:
+        DeferredLogging: The started deferral, stop it to flush the queue and detach it
+    """
+    return DeferredLogging(logger, *handlers)
+
+
+# pylint: disable=too-few-public-methods
+class ProtectionProxy(Subject):
+    """
+    The ProtectionProxy only forwards requests its principal is allowed to make.
+
+    Access is checked against the cached decisions of an AccessPolicy, and logged lazily to
+    ACCESS_LOGGER: messages are only built if the logger is enabled, and with `defer_logging`
+    they are formatted and written in a background thread.
+    """
+
+    def __init__(
+        self, real_object: Subject, policy: AccessPolicy, principal: str, operation: str = "do_action"
+    ) -> None:
+        """
+        The ProtectionProxy maintains a reference to the real subject and the policy protecting it.
+
+        Args:
+            real_object: Subject doing the work
+            policy: Policy deciding who may make requests
+            principal: Who makes the requests through this proxy
+            operation: Name of the operation checked against the policy
+
+        Returns:
+            None
+        """
+        self._real_object = real_object
+        self._policy = policy
+        self._principal = principal
+        self._operation = operation
+
+    def do_action(self) -> str:
+        """
+        Work done via the Proxy: check access, forward to the real subject and log the access.
+
+        Returns:
+            String
+
+        Raises:
+            PermissionError: If the principal may not perform the operation
+        """
+        if not self._policy.is_allowed(self._principal, self._operation):
+            ACCESS_LOGGER.warning("Proxy: Denied %s to %s.", self._operation, self._principal)
+            raise PermissionError(f"{self._principal} may not {self._operation}")
+        result = self._real_object.do_action()
+        ACCESS_LOGGER.info("Proxy: %s performed %s.", self._principal, self._operation)
+        return result
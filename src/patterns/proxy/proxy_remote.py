@@ -0,0 +1,311 @@
+"""Module realizing a remote Proxy forwarding requests to a subject served over a Unix domain socket."""
+
+import io
+import json
+import os
+import queue
+import socket
+import socketserver
+import struct
+import threading
+from typing import Any, List, Optional, Sequence, Tuple
+
+from patterns.proxy.proxy import Subject
+
+# Frame header: kind, request id and payload length, followed by the payload
+HEADER = struct.Struct("!BII")
+REQUEST, RESULT, ERROR = 0, 1, 2
+# Pipelined requests are sent in windows of this many bytes, then their responses are read. A window
+# fits into the socket buffers, so neither side blocks on a full buffer while the other one is writing
+PIPELINE_WINDOW = 64 * 1024
+
+
+class RemoteError(Exception):
+    """Exception raised by the remote subject while handling a request."""
+
+
+def _read_frame(stream: io.BufferedIOBase) -> Tuple[int, int, bytes]:
+    """
+    Read one frame.
+
+    Args:
+        stream: Buffered reader of a socket
+
+    Returns:
+        tuple: Kind, request id and payload
+
+    Raises:
+        ConnectionError: If the peer closed the connection
+    """
+    header = stream.read(HEADER.size)
+    if len(header) < HEADER.size:
+        raise ConnectionError("Connection closed by peer")
+    kind, request_id, length = HEADER.unpack(header)
+    payload = stream.read(length) if length else b""
+    if len(payload) < length:
+        raise ConnectionError("Connection closed by peer")
+    return kind, request_id, payload
+
+
+def _encode_request(request_id: int, args: Sequence[Any]) -> bytes:
+    """
+    Encode a request frame; the common call without arguments has an empty payload.
+
+    Args:
+        request_id: Id echoed in the response
+        args: JSON-serializable request arguments
+
+    Returns:
+        bytes: The frame
+    """
+    payload = json.dumps(list(args), separators=(",", ":")).encode() if args else b""
+    return HEADER.pack(REQUEST, request_id, len(payload)) + payload
+
+
+class _SubjectRequestHandler(socketserver.StreamRequestHandler):
+    """Answers the requests of one connection in order, so clients can pipeline them."""
+
+    server: "SubjectServer"
+
+    def handle(self) -> None:
+        """
+        Answer requests until the client disconnects.
+
+        Returns:
+            None
+        """
+        while True:
+            try:
+                _, request_id, payload = _read_frame(self.rfile)
+            except ConnectionError:
+                return
+            try:
+                args = json.loads(payload) if payload else []
+                kind, data = RESULT, self.server.subject.do_action(*args).encode()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                kind, data = ERROR, f"{type(error).__name__}: {error}".encode()
+            self.wfile.write(HEADER.pack(kind, request_id, len(data)) + data)
+            self.wfile.flush()
+
+
+class SubjectServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Serves a subject on a Unix domain socket, one thread per connection.
+
+    Run `serve_forever()` in another process (or a thread), and stop it with `shutdown()`.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, subject: Subject, path: str) -> None:
+        """
+        Bind the server to a socket path.
+
+        Args:
+            subject: Subject answering the requests
+            path: Path of the Unix domain socket
+
+        Returns:
+            None
+        """
+        super().__init__(path, _SubjectRequestHandler)
+        self.subject = subject
+
+    def server_close(self) -> None:
+        """
+        Close the listening socket and remove its path.
+
+        Returns:
+            None
+        """
+        super().server_close()
+        if os.path.exists(self.server_address):  # type: ignore[arg-type]
+            os.unlink(self.server_address)  # type: ignore[arg-type]
+
+
+class _Connection:
+    """Persistent client connection with a buffered reader."""
+
+    def __init__(self, path: str, timeout: Optional[float]) -> None:
+        """
+        Connect to the server.
+
+        Args:
+            path: Path of the Unix domain socket
+            timeout: Seconds to wait for the server, None to wait forever
+        """
+        self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.socket.settimeout(timeout)
+        try:
+            self.socket.connect(path)
+        except OSError:
+            self.socket.close()
+            raise
+        self.reader = self.socket.makefile("rb")
+        self.next_id = 0
+
+    def call_many(self, calls: Sequence[Sequence[Any]]) -> List[Tuple[int, bytes]]:
+        """
+        Send the requests in windows of up to PIPELINE_WINDOW bytes, reading each window's responses.
+
+        Args:
+            calls: Arguments of each request
+
+        Returns:
+            list: Kind and payload of each response, in request order
+
+        Raises:
+            ConnectionError: If a response does not match its request
+        """
+        first_id = self.next_id
+        self.next_id = (first_id + len(calls)) & 0xFFFFFFFF
+        frames = [_encode_request((first_id + index) & 0xFFFFFFFF, args) for index, args in enumerate(calls)]
+        responses: List[Tuple[int, bytes]] = []
+        start = 0
+        while start < len(frames):
+            end, size = start + 1, len(frames[start])
+            while end < len(frames) and size + len(frames[end]) <= PIPELINE_WINDOW:
+                size += len(frames[end])
+                end += 1
+            self.socket.sendall(b"".join(frames[start:end]))
+            for index in range(start, end):
+                kind, request_id, payload = _read_frame(self.reader)
+                if request_id != (first_id + index) & 0xFFFFFFFF:
+                    raise ConnectionError(f"Response {request_id} does not match request {first_id + index}")
+                responses.append((kind, payload))
+            start = end
+        return responses
+
+    def close(self) -> None:
+        """
+        Close the connection.
+
+        Returns:
+            None
+        """
+        self.reader.close()
+        self.socket.close()
+
+
+class RemoteProxy(Subject):
+    """
+    The RemoteProxy forwards requests to a subject served by a SubjectServer.
+
+    Connections are persistent and pooled: a request borrows an idle connection, opening a new one
+    while fewer than `pool_size` exist, and otherwise waits up to `timeout` seconds for one to be
+    returned. The most recently returned connection is reused first, so idle ones stay idle.
+    A connection that failed or timed out is closed instead of returned. `do_actions` pipelines
+    many requests over one connection, paying one round trip per PIPELINE_WINDOW bytes of requests.
+    """
+
+    def __init__(self, path: str, pool_size: int = 4, timeout: Optional[float] = 5.0) -> None:
+        """
+        The RemoteProxy maintains the address of the server and a pool of connections to it.
+
+        Args:
+            path: Path of the server's Unix domain socket
+            pool_size: Maximum number of connections
+            timeout: Seconds to wait for a connection or a response, None to wait forever
+
+        Returns:
+            None
+        """
+        self._path = path
+        self._timeout = timeout
+        self._idle: "queue.LifoQueue[_Connection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+
+    def _acquire(self) -> _Connection:
+        """
+        Borrow an idle connection or open a new one.
+
+        Returns:
+            _Connection
+
+        Raises:
+            TimeoutError: If all connections stayed busy for `timeout` seconds
+        """
+        if not self._slots.acquire(timeout=self._timeout):  # pylint: disable=consider-using-with
+            raise TimeoutError("No connection became available")
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return _Connection(self._path, self._timeout)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _release(self, connection: _Connection, healthy: bool) -> None:
+        """
+        Return a connection to the pool, or close it if it is no longer usable.
+
+        Args:
+            connection: The borrowed connection
+            healthy: Whether the connection can be reused
+
+        Returns:
+            None
+        """
+        if healthy:
+            self._idle.put(connection)
+        else:
+            connection.close()
+        self._slots.release()
+
+    def do_actions(self, calls: Sequence[Sequence[Any]]) -> List[str]:
+        """
+        Forward many requests at once over one connection.
+
+        All requests are answered, but if the remote subject raised for any of them, only the first
+        error is raised and the results of the other requests are discarded. Send requests one by one
+        to handle their errors individually.
+
+        Args:
+            calls: JSON-serializable arguments of each request
+
+        Returns:
+            list: Result of each request
+
+        Raises:
+            RemoteError: For the first request the remote subject raised for
+        """
+        if not calls:
+            return []
+        connection = self._acquire()
+        try:
+            responses = connection.call_many(calls)
+        except BaseException:
+            self._release(connection, healthy=False)
+            raise
+        self._release(connection, healthy=True)
+        for kind, payload in responses:
+            if kind == ERROR:
+                raise RemoteError(payload.decode())
+        return [payload.decode() for _, payload in responses]
+
+    def do_action(self, *args: Any) -> str:
+        """
+        Work done via the Proxy: forward the request to the remote subject.
+
+        Args:
+            *args: JSON-serializable request arguments
+
+        Returns:
+            String
+        """
+        return self.do_actions([args])[0]
+
+    def close(self) -> None:
+        """
+        Close the idle connections.
+
+        Returns:
+            None
+        """
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
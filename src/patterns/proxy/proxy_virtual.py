@@ -0,0 +1,91 @@
+"""Module realizing a virtual Proxy that constructs its real subject on first use."""
+
+import logging
+import threading
+from typing import Callable, Optional
+
+from patterns.proxy.proxy import Subject
+
+
+class VirtualProxy(Subject):
+    """
+    The VirtualProxy stands in for a subject that is expensive to construct.
+
+    It only keeps a factory, and builds the real subject on the first request. Construction is
+    guarded by a lock, so concurrent first requests build it exactly once; afterwards requests
+    go straight to the real subject without locking. A failed construction is not remembered,
+    the next request tries again.
+    """
+
+    def __init__(self, factory: Callable[[], Subject]) -> None:
+        """
+        The VirtualProxy maintains the factory of its real subject.
+
+        Args:
+            factory: Callable constructing the real subject
+
+        Returns:
+            None
+        """
+        self._factory = factory
+        self._real_object: Optional[Subject] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_initialized(self) -> bool:
+        """
+        Whether the real subject has been constructed.
+
+        Returns:
+            bool
+        """
+        return self._real_object is not None
+
+    @property
+    def real_subject(self) -> Subject:
+        """
+        The real subject, constructed on first access.
+
+        Returns:
+            Subject
+        """
+        real_object = self._real_object
+        if real_object is None:
+            with self._lock:
+                real_object = self._real_object
+                if real_object is None:
+                    logging.info("VirtualProxy: Constructing the real subject.")
+                    real_object = self._real_object = self._factory()
+        return real_object
+
+    def do_action(self, *args: object) -> str:
+        """
+        Work done via the Proxy: forward to the real subject, constructing it if needed.
+
+        Args:
+            *args: Request arguments, passed on to the real subject
+
+        Returns:
+            String
+        """
+        return self.real_subject.do_action(*args)
+
+    def prewarm(self) -> threading.Thread:
+        """
+        Construct the real subject in a background thread, so the first request does not wait for it.
+
+        Errors are logged; the first request then constructs the subject again and raises them.
+
+        Returns:
+            threading.Thread: The started daemon thread, join it to wait for the construction
+        """
+
+        def construct() -> None:
+            try:
+                _ = self.real_subject
+            except Exception:  # pylint: disable=broad-exception-caught
+                logging.exception("VirtualProxy: Pre-warming the real subject failed.")
+
+        thread = threading.Thread(target=construct, name="VirtualProxy-prewarm", daemon=True)
+        thread.start()
+        return thread
@@ -0,0 +1,193 @@
+"""Borg pattern with its shared state living in a `multiprocessing.shared_memory` segment."""
+
+from __future__ import annotations
+
+import struct
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Optional, Type
+
+
+class SharedField:
+    """
+    Descriptor for a fixed-size field stored in the shared memory segment.
+
+    Values are read and written in place with `struct`, no pickling involved.
+    """
+
+    def __init__(self, fmt: str) -> None:
+        """
+        Initialize the field with a `struct` format, e.g. "q" for int64, "d" for double or "32s" for bytes.
+
+        Args:
+            fmt: Format of a single value in the `struct` module syntax.
+        """
+        self.fmt = "=" + fmt
+        self.size = struct.calcsize(self.fmt)
+        self.offset = 0
+        self.name = ""
+        self._is_bytes = fmt.endswith("s")
+
+    def __set_name__(self, owner: Type[SharedBorg], name: str) -> None:
+        """
+        Remember the attribute name of the field.
+
+        Args:
+            owner: Class defining the field
+            name: Attribute name
+
+        Returns:
+            None
+        """
+        self.name = name
+
+    def __get__(self, obj: Optional[SharedBorg], objtype: Optional[type] = None) -> Any:
+        """
+        Read the value straight from the shared segment, bytes fields without their null padding.
+
+        Args:
+            obj: Borg instance, None if accessed on the class
+            objtype: Class of the instance
+
+        Returns:
+            Any: The stored value, or the field itself when accessed on the class
+        """
+        if obj is None:
+            return self
+        value = struct.unpack_from(self.fmt, obj.buffer, self.offset)[0]
+        if self._is_bytes:
+            return value.rstrip(b"\0")
+        return value
+
+    def __set__(self, obj: SharedBorg, value: Any) -> None:
+        """
+        Write the value straight into the shared segment.
+
+        Args:
+            obj: Borg instance
+            value: Value to store
+
+        Returns:
+            None
+        """
+        struct.pack_into(self.fmt, obj.buffer, self.offset, value)
+
+
+class SharedBorg:
+    """
+    Borg whose state is shared across processes, not just across instances.
+
+    Subclasses declare a fixed schema with `SharedField` class attributes. The first instance
+    creates the segment, later instances - in this or any other process - attach to it by name.
+    Single-field writes are not atomic across fields; guard multi-field updates with a
+    `multiprocessing.Lock`.
+    """
+
+    _fields: Dict[str, SharedField] = {}
+    _size: int = 0
+    _shm: Optional[SharedMemory] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Lay out the declared fields in the segment and give each subclass its own segment slot.
+
+        Args:
+            **kwargs: Keyword arguments passed on to `object.__init_subclass__`
+
+        Returns:
+            None
+        """
+        super().__init_subclass__(**kwargs)
+        offset = 0
+        fields: Dict[str, SharedField] = {}
+        for klass in reversed(cls.__mro__):
+            for name, value in vars(klass).items():
+                if isinstance(value, SharedField) and name not in fields:
+                    value.offset = offset
+                    offset += value.size
+                    fields[name] = value
+        cls._fields = fields
+        cls._size = max(offset, 1)
+        cls._shm = None
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        """
+        Attach to the shared segment, creating it on first use.
+
+        Args:
+            name: Name of an existing segment to attach to, e.g. in a worker process.
+
+        Raises:
+            RuntimeError: If the class is attached to another segment; `close()` it first
+        """
+        cls = type(self)
+        if cls._shm is None:
+            cls._shm = SharedMemory(name=name, create=name is None, size=cls._size)
+        elif name is not None and cls._shm.name != name:
+            # Existing instances keep views of the attached segment, so it is neither replaced nor closed here
+            raise RuntimeError(f"{cls.__name__} is attached to segment {cls._shm.name}, close() it first")
+        buffer = cls._shm.buf
+        if buffer is None:
+            raise RuntimeError("Shared segment has been closed")
+        self.buffer: memoryview = buffer
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        """
+        Reject attributes outside the fixed schema, as they would not be shared.
+
+        Args:
+            key: Attribute name
+            value: Attribute value
+
+        Returns:
+            None
+        """
+        if key != "buffer" and key not in self._fields:
+            raise AttributeError(f"{type(self).__name__} has no shared field '{key}'")
+        super().__setattr__(key, value)
+
+    @property
+    def name(self) -> str:
+        """
+        Name of the shared segment, to be passed to worker processes.
+
+        Returns:
+            str: Segment name
+        """
+        if self._shm is None:
+            raise RuntimeError("Shared segment has been closed")
+        return self._shm.name
+
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Read all fields at once.
+
+        Returns:
+            dict: Field names mapped to their current values
+        """
+        return {name: getattr(self, name) for name in self._fields}
+
+    @classmethod
+    def close(cls) -> None:
+        """
+        Detach this process from the segment.
+
+        Returns:
+            None
+        """
+        if cls._shm is not None:
+            cls._shm.close()
+            cls._shm = None
+
+    @classmethod
+    def unlink(cls) -> None:
+        """
+        Detach and destroy the segment; call once from the owning process.
+
+        Returns:
+            None
+        """
+        if cls._shm is not None:
+            shm = cls._shm
+            shm.close()
+            shm.unlink()
+            cls._shm = None
@@ -0,0 +1,169 @@
+"""Borg pattern publishing its shared state as versioned, immutable snapshots (copy-on-write)."""
+
+from __future__ import annotations
+
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+
+class Snapshot:
+    """
+    Immutable, versioned view of the shared state.
+
+    Values live in the instance `__dict__`, so reading them is a plain attribute lookup.
+    """
+
+    __slots__ = ("version", "__dict__")
+    version: int
+
+    def __init__(self, version: int, data: Dict[str, Any]) -> None:
+        """
+        Initialize the snapshot; `data` must not be modified afterwards.
+
+        Args:
+            version: Version number, increased with every write
+            data: State at this version
+        """
+        object.__setattr__(self, "version", version)
+        object.__setattr__(self, "__dict__", data)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        """
+        Snapshots are immutable.
+
+        Args:
+            key: Attribute name
+            value: Attribute value
+
+        Returns:
+            None
+        """
+        raise AttributeError("Snapshot is immutable")
+
+    def __delattr__(self, key: str) -> None:
+        """
+        Snapshots are immutable.
+
+        Args:
+            key: Attribute name
+
+        Returns:
+            None
+        """
+        raise AttributeError("Snapshot is immutable")
+
+    def as_dict(self) -> Mapping[str, Any]:
+        """
+        Read-only mapping of the whole state at this version.
+
+        Returns:
+            Mapping: Attribute names mapped to values
+        """
+        return MappingProxyType(self.__dict__)
+
+
+class SnapshotBorg:
+    """
+    Borg whose instances share state through copy-on-write snapshots.
+
+    Readers grab the current snapshot with a single attribute read and no locking; all values read
+    from one snapshot belong to the same version. Writers copy the state, apply their changes and
+    publish the new snapshot by rebinding one reference, so readers never see torn updates.
+
+    Names of attributes of the Borg or its snapshots, such as `version` or `update`, cannot be used
+    for state, since reading them would return the attribute instead.
+    """
+
+    _current: Snapshot = Snapshot(0, {})
+    _write_lock: threading.Lock = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Give every subclass its own state and writer lock.
+
+        Args:
+            **kwargs: Keyword arguments passed on to `object.__init_subclass__`
+
+        Returns:
+            None
+        """
+        super().__init_subclass__(**kwargs)
+        cls._current = Snapshot(0, {})
+        cls._write_lock = threading.Lock()
+
+    def __getattr__(self, key: str) -> Any:
+        """
+        Read a single value from the current snapshot.
+
+        Use `snapshot()` to read several values consistently.
+
+        Args:
+            key: Attribute name
+
+        Returns:
+            Any: Current value
+        """
+        return getattr(self._current, key)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        """
+        Publish a new version with a single changed value.
+
+        Args:
+            key: Attribute name
+            value: Attribute value
+
+        Returns:
+            None
+        """
+        self.update(**{key: value})
+
+    def snapshot(self) -> Snapshot:
+        """
+        Return the current snapshot without locking.
+
+        Returns:
+            Snapshot: Current, immutable version of the state
+        """
+        return self._current
+
+    def update(self, **changes: Any) -> Snapshot:
+        """
+        Apply all changes at once and publish them as a new version.
+
+        Args:
+            **changes: Attribute names and their new values
+
+        Returns:
+            Snapshot: The published version
+
+        Raises:
+            AttributeError: If a name is reserved by the Borg or its snapshots
+        """
+        return type(self).publish(changes)
+
+    @classmethod
+    def publish(cls, changes: Mapping[str, Any]) -> Snapshot:
+        """
+        Apply all changes at once and publish them as a new version of the class' state.
+
+        Args:
+            changes: Attribute names and their new values
+
+        Returns:
+            Snapshot: The published version
+
+        Raises:
+            AttributeError: If a name is reserved by the Borg or its snapshots
+        """
+        reserved = [key for key in changes if hasattr(cls, key) or hasattr(Snapshot, key)]
+        if reserved:
+            raise AttributeError(f"Reserved names cannot be used for state: {', '.join(reserved)}")
+        with cls._write_lock:
+            current = cls._current
+            data = dict(current.__dict__)
+            data.update(changes)
+            snapshot = Snapshot(current.version + 1, data)
+            cls._current = snapshot
+        return snapshot
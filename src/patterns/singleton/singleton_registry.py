@@ -0,0 +1,149 @@
+"""Singleton metaclass keeping one instance per concrete class, with lazy async initialization."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Any, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class SingletonMeta(type):
+    """
+    Metaclass holding a registry of singleton instances keyed by the concrete class.
+
+    Unlike a single class attribute, subclasses never share or clobber the instance of their parent.
+    Calling the class directly creates the instance synchronously without awaiting `initialize()`;
+    the first `get_instance()` still initializes that same instance.
+
+    Every class is constructed under its own reentrant lock, so a singleton may create other
+    singletons in its `__init__`.
+    """
+
+    _instances: Dict[type, Any] = {}
+    _initialized: Dict[type, Any] = {}
+    _pending: Dict[type, "asyncio.Task[Any]"] = {}
+    _locks: Dict[type, threading.RLock] = {}
+    # Only guards creating the per-class locks, never held while a constructor runs
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _class_lock(target: type) -> threading.RLock:
+        """
+        Return the lock guarding the construction of a class, creating it on first use.
+
+        Args:
+            target: Concrete singleton class
+
+        Returns:
+            threading.RLock: Lock of `target`
+        """
+        lock = SingletonMeta._locks.get(target)
+        if lock is None:
+            with SingletonMeta._lock:
+                lock = SingletonMeta._locks.setdefault(target, threading.RLock())
+        return lock
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        """
+        Create the instance on first call and return the registered one afterwards.
+
+        Args:
+            *args: Positional arguments for the first construction
+            **kwargs: Keyword arguments for the first construction
+
+        Returns:
+            Any: The singleton instance of `cls`
+        """
+        instance = SingletonMeta._instances.get(cls)
+        if instance is None:
+            with SingletonMeta._class_lock(cls):
+                instance = SingletonMeta._instances.get(cls)
+                if instance is None:
+                    instance = super().__call__(*args, **kwargs)
+                    SingletonMeta._instances[cls] = instance
+        return instance
+
+    async def get_instance(cls: type[T]) -> T:
+        """
+        Return the singleton instance, running its async `initialize()` on first access.
+
+        Concurrent awaiters during startup all wait on the same in-flight initialization.
+        If the initialization fails, the error is raised to every awaiter and the next call retries.
+
+        Returns:
+            T: The initialized singleton instance of `cls`
+        """
+        instance = SingletonMeta._initialized.get(cls)
+        if instance is not None:
+            return instance  # type: ignore[no-any-return]
+
+        task = SingletonMeta._pending.get(cls)
+        if task is None:
+            task = asyncio.ensure_future(SingletonMeta._create(cls))
+            SingletonMeta._pending[cls] = task
+            task.add_done_callback(lambda _: SingletonMeta._pending.pop(cls, None))
+
+        return await asyncio.shield(task)
+
+    @staticmethod
+    async def _create(target: type[T]) -> T:
+        """
+        Initialize the registered instance, constructing and registering it first if there is none.
+
+        Args:
+            target: Concrete class to instantiate
+
+        Returns:
+            T: The initialized instance
+        """
+        lock = SingletonMeta._class_lock(target)
+        with lock:
+            registered: Optional[T] = SingletonMeta._instances.get(target)
+            constructed = registered is None
+            instance: T = type.__call__(target) if registered is None else registered
+            SingletonMeta._instances[target] = instance
+        initialize = getattr(instance, "initialize", None)
+        try:
+            if initialize is not None:
+                await initialize()
+        except BaseException:
+            # A failed instance is dropped so the next call starts over, unless it was created synchronously
+            if constructed:
+                with lock:
+                    if SingletonMeta._instances.get(target) is instance:
+                        del SingletonMeta._instances[target]
+            raise
+        with lock:
+            if SingletonMeta._instances.get(target) is instance:
+                SingletonMeta._initialized[target] = instance
+        return instance
+
+    def reset(cls) -> None:
+        """
+        Drop the registered instance of this class (e.g. for tests).
+
+        Returns:
+            None
+        """
+        with SingletonMeta._class_lock(cls):
+            SingletonMeta._instances.pop(cls, None)
+            SingletonMeta._initialized.pop(cls, None)
+
+
+# pylint: disable=too-few-public-methods
+class AsyncSingleton(metaclass=SingletonMeta):
+    """
+    Base class for services that need expensive asynchronous setup.
+
+    Use `await MyService.get_instance()` to obtain the fully initialized instance.
+    """
+
+    async def initialize(self) -> None:
+        """
+        Asynchronous one-time initialization, e.g. opening connections.
+
+        Returns:
+            None
+        """
@@ -0,0 +1,69 @@
+"""Class realizing a thread-safe Singleton using double-checked locking."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Optional
+
+
+# pylint: disable=too-few-public-methods
+class SingletonThreadSafe:
+    """
+    Singleton that is safe under concurrent first access.
+
+    The instance is created at most once, even if many threads call `get_instance()` at the same time.
+    Once the instance exists, the lookup is a plain class attribute read without taking the lock.
+    """
+
+    _instance: Optional[SingletonThreadSafe] = None
+    _lock: threading.Lock = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Give every subclass its own instance slot and lock.
+
+        Args:
+            **kwargs: Keyword arguments passed on to `object.__init_subclass__`
+
+        Returns:
+            None
+        """
+        super().__init_subclass__(**kwargs)
+        cls._instance = None
+        cls._lock = threading.Lock()
+
+    def __init__(self) -> None:
+        """
+        Make sure that the constructor cannot be called from outside the class.
+        """
+        raise RuntimeError("Call get_instance() instead")
+
+    @classmethod
+    def get_instance(cls) -> SingletonThreadSafe:
+        """
+        Create and return the singleton instance.
+
+        The first check runs without the lock (fast path), the second one under the lock makes sure
+        only one thread creates the instance. The instance is published only after `_initialize()`
+        has finished, so other threads never see a half-initialized object.
+
+        Returns:
+            SingletonThreadSafe: Instance of the SingletonThreadSafe class
+        """
+        instance = cls._instance
+        if instance is None:
+            with cls._lock:
+                instance = cls._instance
+                if instance is None:
+                    instance = cls.__new__(cls)
+                    instance._initialize()
+                    cls._instance = instance
+        return instance
+
+    def _initialize(self) -> None:
+        """
+        Hook for (expensive) one-time initialization, runs exactly once per class.
+
+        Returns:
+            None
+        """
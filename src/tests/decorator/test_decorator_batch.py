@@ -0,0 +1,160 @@
+"""Test decorator module."""
+
+import math
+from typing import List
+
+import pytest
+
+from patterns.decorator.decorator import (
+    BasicCoffee,
+    Coffee,
+    CoffeeDecorator,
+    MilkDecorator,
+    SugarDecorator,
+)
+from patterns.decorator.decorator_batch import (
+    encode_orders,
+    price_encoded,
+    price_orders,
+)
+
+
+class TenthDecorator(CoffeeDecorator):
+    """Add-on whose price is not exactly representable."""
+
+    addon_cost = 0.1
+    addon_name = "Tenth"
+
+    def get_cost(self) -> float:
+        """
+        Adjust the cost of the coffee.
+
+        Returns:
+            float: Cost of the coffee
+        """
+        return self.coffee.get_cost() + self.addon_cost
+
+    def get_description(self) -> str:
+        """
+        Adjust the description of the coffee.
+
+        Returns:
+            str: Description of the coffee
+        """
+        return self.coffee.get_description() + ", " + self.addon_name
+
+
+class ThirdDecorator(TenthDecorator):
+    """Another add-on whose price is not exactly representable."""
+
+    addon_cost = 1 / 3
+    addon_name = "Third"
+
+
+@pytest.fixture(name="orders")
+def fixture_orders() -> List[Coffee]:
+    """
+    Orders with different numbers and kinds of add-ons.
+
+    Returns:
+        list: Decorated coffees
+    """
+    orders: List[Coffee] = [BasicCoffee(), MilkDecorator(BasicCoffee())]
+    for count in range(1, 20):
+        coffee: Coffee = BasicCoffee()
+        for index in range(count):
+            coffee = SugarDecorator(coffee) if index % 3 else MilkDecorator(coffee)
+        orders.append(coffee)
+    return orders
+
+
+@pytest.fixture(name="inexact_orders")
+def fixture_inexact_orders() -> List[Coffee]:
+    """
+    Orders with up to 29 add-ons whose prices are not exactly representable.
+
+    Returns:
+        list: Decorated coffees, the n-th one with n add-ons
+    """
+    orders: List[Coffee] = []
+    for count in range(1, 30):
+        coffee: Coffee = BasicCoffee()
+        for index in range(count):
+            coffee = TenthDecorator(coffee) if index % 2 else ThirdDecorator(coffee)
+        orders.append(coffee)
+    return orders
+
+
+class TestDecoratorBatch:
+    """Test decorator module."""
+
+    @staticmethod
+    def test_encode_orders() -> None:
+        """Test that orders are encoded as base costs and an add-on count matrix.
+
+        Returns:
+            None
+        """
+        base_costs, kinds, counts = encode_orders(
+            [MilkDecorator(SugarDecorator(MilkDecorator(BasicCoffee()))), SugarDecorator(BasicCoffee())]
+        )
+
+        assert list(base_costs) == [2.0, 2.0]
+        assert kinds == [MilkDecorator, SugarDecorator]
+        assert list(counts) == [2, 1, 0, 1]
+
+    @staticmethod
+    def test_reprice_encoded_orders() -> None:
+        """Test that encoded orders can be priced with another price table.
+
+        Returns:
+            None
+        """
+        base_costs, _, counts = encode_orders([MilkDecorator(MilkDecorator(BasicCoffee())), BasicCoffee()])
+
+        assert price_encoded(base_costs, [1.0], counts, use_numpy=False) == [4.0, 2.0]
+
+    @staticmethod
+    def test_price_orders_matches_get_cost(orders: List[Coffee]) -> None:
+        """Test that batch pricing returns exactly the costs of get_cost().
+
+        Returns:
+            None
+        """
+        assert price_orders(orders) == [order.get_cost() for order in orders]
+
+    @staticmethod
+    def test_price_orders_sums_in_chain_order(inexact_orders: List[Coffee]) -> None:
+        """Test that prices which are not exactly representable give the same results as get_cost().
+
+        Returns:
+            None
+        """
+        assert price_orders(inexact_orders) == [order.get_cost() for order in inexact_orders]
+
+    @staticmethod
+    @pytest.mark.parametrize("use_numpy", [False, True])
+    def test_price_encoded_within_tolerance(inexact_orders: List[Coffee], use_numpy: bool) -> None:
+        """Test that encoded pricing stays within the documented tolerance of get_cost().
+
+        Returns:
+            None
+        """
+        if use_numpy:
+            pytest.importorskip("numpy")
+        base_costs, kinds, counts = encode_orders(inexact_orders)
+        prices = [kind.addon_cost for kind in kinds]
+
+        costs = price_encoded(base_costs, prices, counts, use_numpy=use_numpy)
+
+        for count, (cost, order) in enumerate(zip(costs, inexact_orders), start=1):
+            assert math.isclose(cost, order.get_cost(), rel_tol=count * 2**-52)
+
+    @staticmethod
+    def test_empty_batch() -> None:
+        """Test that an empty batch is priced as an empty list.
+
+        Returns:
+            None
+        """
+        assert not price_orders([])
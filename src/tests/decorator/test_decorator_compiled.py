@@ -0,0 +1,100 @@
+"""Test decorator module."""
+
+import pytest
+
+from patterns.decorator.decorator import (
+    BasicCoffee,
+    Coffee,
+    CoffeeDecorator,
+    MilkDecorator,
+    SugarDecorator,
+)
+from patterns.decorator.decorator_compiled import CompiledCoffee, unwrap_coffee
+
+
+class TestDecoratorCompiled:
+    """Test decorator module."""
+
+    @staticmethod
+    def test_matches_decorator_chain() -> None:
+        """Test that a compiled coffee has the same cost and description as the chain.
+
+        Returns:
+            None
+        """
+        coffee = MilkDecorator(SugarDecorator(MilkDecorator(BasicCoffee())))
+        compiled = CompiledCoffee(coffee)
+
+        assert compiled.get_cost() == coffee.get_cost() == 3.25
+        assert compiled.get_description() == coffee.get_description() == "Basic Coffee, Milk, Sugar, Milk"
+
+    @staticmethod
+    def test_unwrap_coffee() -> None:
+        """Test that unwrapping returns the base and the decorators in application order.
+
+        Returns:
+            None
+        """
+        base = BasicCoffee()
+        sugar = SugarDecorator(base)
+        milk = MilkDecorator(sugar)
+
+        assert unwrap_coffee(milk) == (base, [sugar, milk])
+        assert unwrap_coffee(base) == (base, [])
+
+    @staticmethod
+    def test_deep_chain() -> None:
+        """Test that deep chains compile without hitting the recursion limit.
+
+        Returns:
+            None
+        """
+        coffee: Coffee = BasicCoffee()
+        for _ in range(5000):
+            coffee = SugarDecorator(coffee)
+        compiled = CompiledCoffee(coffee)
+
+        assert compiled.get_cost() == 2.0 + 5000 * 0.25
+        assert compiled.get_description().count("Sugar") == 5000
+
+    @staticmethod
+    def test_decorators_are_immutable() -> None:
+        """Test that neither a decorator nor its declared add-on can change under a compiled chain.
+
+        Returns:
+            None
+        """
+        sugar = SugarDecorator(BasicCoffee())
+        compiled = CompiledCoffee(MilkDecorator(sugar))
+
+        with pytest.raises(AttributeError):
+            sugar.coffee = MilkDecorator(BasicCoffee())  # type: ignore[misc]
+        with pytest.raises(AttributeError):
+            setattr(sugar, "_coffee", BasicCoffee())
+        with pytest.raises(AttributeError):
+            sugar.addon_cost = 1.0
+        with pytest.raises(AttributeError):
+            SugarDecorator.addon_cost = 1.0
+
+        assert compiled.get_cost() == 2.75
+        assert compiled.get_description() == "Basic Coffee, Sugar, Milk"
+
+    @staticmethod
+    def test_rejects_undeclared_decorators() -> None:
+        """Test that decorators without a declared add-on cannot be compiled.
+
+        Returns:
+            None
+        """
+
+        class DoubleDecorator(CoffeeDecorator):
+            """Decorator doubling the price."""
+
+            def get_cost(self) -> float:
+                return self.coffee.get_cost() * 2
+
+            def get_description(self) -> str:
+                return self.coffee.get_description() + ", Double"
+
+        with pytest.raises(TypeError):
+            CompiledCoffee(DoubleDecorator(BasicCoffee()))
@@ -0,0 +1,180 @@
+"""Test decorator module."""
+
+import asyncio
+import json
+from typing import Iterator
+
+import pytest
+
+from patterns.decorator import decorator_instrument
+from patterns.decorator.decorator_instrument import (
+    LatencyHistogram,
+    bucket_bounds,
+    bucket_index,
+    disable,
+    enable,
+    export,
+    export_json,
+    histogram,
+    instrument,
+)
+from patterns.decorator.decorator_texts import BoldDecorator
+
+
+@pytest.fixture(name="clean_registry")
+def fixture_clean_registry() -> Iterator[None]:
+    """
+    Run a test with an empty, enabled instrumentation registry.
+
+    Returns:
+        None
+    """
+    saved = dict(decorator_instrument._registry)  # pylint: disable=protected-access
+    decorator_instrument._registry.clear()  # pylint: disable=protected-access
+    enable()
+    yield
+    enable()
+    decorator_instrument._registry.clear()  # pylint: disable=protected-access
+    decorator_instrument._registry.update(saved)  # pylint: disable=protected-access
+
+
+class TestLatencyHistogram:
+    """Test the latency histogram."""
+
+    @staticmethod
+    def test_buckets_are_contiguous() -> None:
+        """
+        Test that every latency falls into the bucket whose bounds contain it.
+
+        Returns:
+            None
+        """
+        for value in list(range(5000)) + [10**6 + 7, 10**9 + 3, 2**63 - 1]:
+            low, high = bucket_bounds(bucket_index(value))
+            assert low <= value < high
+
+    @staticmethod
+    def test_percentiles() -> None:
+        """
+        Test that percentiles are estimated within the bucket resolution.
+
+        Returns:
+            None
+        """
+        latencies = LatencyHistogram()
+        for value in range(1, 1001):
+            latencies.record(value * 1000)
+
+        summary = latencies.as_dict()
+
+        assert summary["count"] == 1000
+        assert summary["total_ns"] == sum(range(1, 1001)) * 1000
+        assert summary["min_ns"] == 1000
+        assert summary["max_ns"] == 1_000_000
+        assert abs(summary["p50_ns"] - 500_000) <= 500_000 / 8
+        assert abs(summary["p99_ns"] - 990_000) <= 990_000 / 8
+
+    @staticmethod
+    def test_empty() -> None:
+        """
+        Test that an empty histogram reports zeros.
+
+        Returns:
+            None
+        """
+        assert LatencyHistogram().as_dict() == {
+            "count": 0,
+            "total_ns": 0,
+            "min_ns": 0,
+            "max_ns": 0,
+            "p50_ns": 0,
+            "p99_ns": 0,
+        }
+
+
+@pytest.mark.usefixtures("clean_registry")
+class TestInstrument:
+    """Test the instrumentation decorator."""
+
+    @staticmethod
+    def test_records_calls() -> None:
+        """
+        Test that calls, including failing ones, are counted per function.
+
+        Returns:
+            None
+        """
+
+        @instrument("add")
+        def add(value_a: int, value_b: int) -> int:
+            """Add two numbers."""
+            return value_a + value_b
+
+        assert add(1, 2) == 3
+        assert add(value_a=2, value_b=3) == 5
+        with pytest.raises(TypeError):
+            add(1, "a")
+
+        assert add.__name__ == "add"
+        assert add.__doc__ == "Add two numbers."
+        summary = export()["add"]
+        assert summary["count"] == 3
+        assert 0 < summary["min_ns"] <= summary["p50_ns"] <= summary["max_ns"] <= summary["total_ns"]
+        assert json.loads(export_json())["add"] == summary
+
+    @staticmethod
+    def test_disabled() -> None:
+        """
+        Test that nothing is recorded while instrumentation is disabled.
+
+        Returns:
+            None
+        """
+
+        @instrument()
+        def identity(value: int) -> int:
+            return value
+
+        disable()
+        assert identity(1) == 1
+        enable()
+        assert identity(2) == 2
+
+        (name,) = export()
+        assert name.endswith("identity")
+        assert histogram(name).as_dict()["count"] == 1
+
+    @staticmethod
+    def test_async() -> None:
+        """
+        Test that coroutine functions are measured until their result is available.
+
+        Returns:
+            None
+        """
+
+        @instrument("sleep")
+        async def sleep() -> str:
+            await asyncio.sleep(0.01)
+            return "done"
+
+        assert asyncio.run(sleep()) == "done"
+        assert export()["sleep"]["min_ns"] >= 10_000_000
+
+    @staticmethod
+    def test_async_tag_decorator() -> None:
+        """
+        Test that an async tag decorator is measured until its result is available.
+
+        Returns:
+            None
+        """
+
+        @instrument("bold_sleep")
+        @BoldDecorator
+        async def sleep() -> str:
+            await asyncio.sleep(0.01)
+            return "done"
+
+        assert asyncio.run(sleep()) == "<b>done</b>"
+        assert export()["bold_sleep"]["min_ns"] >= 10_000_000
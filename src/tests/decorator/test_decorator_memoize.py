@@ -0,0 +1,170 @@
+"""Test decorator module."""
+
+import asyncio
+from typing import List
+
+from patterns.decorator.decorator_memoize import Memoized, memoize
+
+
+class TestDecoratorMemoize:
+    """Test decorator module."""
+
+    @staticmethod
+    def test_caches_results() -> None:
+        """
+        Test that repeated calls with the same arguments are served from the cache.
+
+        Returns:
+            None
+        """
+        calls: List[int] = []
+
+        @memoize()
+        def square(value: int) -> int:
+            """Square a number."""
+            calls.append(value)
+            return value * value
+
+        assert square(3) == 9
+        assert square(3) == 9
+        assert square(4) == 16
+        assert calls == [3, 4]
+        assert square.cache_info() == {"hits": 1, "misses": 2, "evictions": 0, "expirations": 0, "size": 2}
+        assert square.__name__ == "square"
+        assert square.__doc__ == "Square a number."
+
+    @staticmethod
+    def test_keyword_arguments() -> None:
+        """
+        Test that keyword order does not matter, but keywords and positionals are kept apart.
+
+        Returns:
+            None
+        """
+        calls: List[int] = []
+
+        @memoize()
+        def add(value_a: int, value_b: int = 0) -> int:
+            calls.append(1)
+            return value_a + value_b
+
+        assert add(1, value_b=2) == 3
+        assert add(value_b=2, value_a=1) == 3
+        assert add(value_a=1, value_b=2) == 3
+        assert add(1, 2) == 3
+        assert len(calls) == 3
+
+    @staticmethod
+    def test_lru_eviction() -> None:
+        """
+        Test that the least recently used result is evicted when the cache is full.
+
+        Returns:
+            None
+        """
+        double = memoize(maxsize=2)(lambda value: value * 2)
+
+        double(1)
+        double(2)
+        double(1)
+        double(3)
+        double(1)
+        double(2)
+
+        assert double.cache_info() == {"hits": 2, "misses": 4, "evictions": 2, "expirations": 0, "size": 2}
+
+    @staticmethod
+    def test_ttl_expiry() -> None:
+        """
+        Test that results are recomputed once they expired.
+
+        Returns:
+            None
+        """
+        now = [0.0]
+        calls: List[int] = []
+
+        def compute(value: int) -> int:
+            calls.append(value)
+            return value
+
+        cached = Memoized(compute, ttl=10, clock=lambda: now[0])
+
+        cached(1)
+        now[0] = 5.0
+        cached(1)
+        now[0] = 10.0
+        cached(1)
+
+        assert calls == [1, 1]
+        assert cached.cache_info()["expirations"] == 1
+
+    @staticmethod
+    def test_cache_clear() -> None:
+        """
+        Test that clearing the cache removes results and statistics.
+
+        Returns:
+            None
+        """
+        identity = memoize()(lambda value: value)
+        identity(1)
+        identity(1)
+
+        identity.cache_clear()
+
+        assert identity.cache_info() == {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "size": 0}
+
+    @staticmethod
+    def test_method() -> None:
+        """
+        Test that a memoized method is bound to its instance and cached per instance.
+
+        Returns:
+            None
+        """
+        calls: List[int] = []
+
+        class Multiplier:  # pylint: disable=too-few-public-methods
+            """Multiplies by a fixed factor."""
+
+            def __init__(self, factor: int) -> None:
+                self.factor = factor
+
+            @memoize()
+            def multiply(self, value: int) -> int:
+                """Multiply a number."""
+                calls.append(value)
+                return value * self.factor
+
+        double, triple = Multiplier(2), Multiplier(3)
+
+        assert double.multiply(5) == 10
+        assert double.multiply(5) == 10
+        assert triple.multiply(5) == 15
+        assert calls == [5, 5]
+        assert Multiplier.multiply.cache_info()["hits"] == 1  # pylint: disable=no-member
+
+    @staticmethod
+    def test_async_function() -> None:
+        """
+        Test that the awaited result of a coroutine function is cached.
+
+        Returns:
+            None
+        """
+        calls: List[int] = []
+
+        @memoize()
+        async def fetch(value: int) -> int:
+            """Fetch a number."""
+            calls.append(value)
+            await asyncio.sleep(0)
+            return value + 1
+
+        async def main() -> List[int]:
+            return [await fetch(1), await fetch(1), await fetch(2)]
+
+        assert asyncio.run(main()) == [2, 2, 3]
+        assert calls == [1, 2]
+        assert fetch.cache_info()["hits"] == 1
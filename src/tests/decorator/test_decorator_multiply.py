@@ -1,6 +1,12 @@
 """Test decorator module."""
 
+import asyncio
+import inspect
+
+import pytest
+
 from patterns.decorator.decorator_multiply import multiply_decorator
+from patterns.decorator.decorator_texts import BoldDecorator
 
 
 # pylint: disable=too-few-public-methods
@@ -21,3 +27,101 @@ class TestDecoratorMultiply:
             return value_a + value_b
 
         assert to_be_decorated(2, 3) == 10
+
+    @staticmethod
+    def test_multiply_async() -> None:
+        """
+        Test that a coroutine function's awaited output is multiplied by a factor.
+
+        Returns:
+            None
+        """
+
+        @multiply_decorator(2)
+        async def to_be_decorated(value_a: int, value_b: int) -> int:
+            await asyncio.sleep(0)
+            return value_a + value_b
+
+        assert inspect.iscoroutinefunction(to_be_decorated)
+        assert asyncio.run(to_be_decorated(2, 3)) == 10
+
+    @staticmethod
+    def test_multiply_async_stack() -> None:
+        """
+        Test that stacking over an async tag decorator awaits its output before multiplying it.
+
+        Returns:
+            None
+        """
+
+        @multiply_decorator(2)
+        @BoldDecorator
+        async def to_be_decorated(name: str) -> str:
+            await asyncio.sleep(0)
+            return name
+
+        assert inspect.iscoroutinefunction(to_be_decorated)
+        assert asyncio.run(to_be_decorated("a")) == "<b>a</b><b>a</b>"
+
+    @staticmethod
+    def test_multiply_metadata() -> None:
+        """
+        Test that the wrapper keeps the decorated function's name, docstring and signature.
+
+        Returns:
+            None
+        """
+
+        @multiply_decorator(3)
+        def to_be_decorated(value_a: int, value_b: int) -> int:
+            """Add two numbers."""
+            return value_a + value_b
+
+        assert to_be_decorated.__name__ == "to_be_decorated"
+        assert to_be_decorated.__doc__ == "Add two numbers."
+        assert list(inspect.signature(to_be_decorated).parameters) == ["value_a", "value_b"]
+        assert to_be_decorated(value_b=1, value_a=2) == 9
+
+    @staticmethod
+    def test_multiply_variadic() -> None:
+        """
+        Test that functions with defaults, positional-only or variadic parameters are wrapped correctly.
+
+        Returns:
+            None
+        """
+
+        @multiply_decorator(2)
+        def total(*values: int, start: int = 0) -> int:
+            return start + sum(values)
+
+        @multiply_decorator(2)
+        def difference(value_a: int, value_b: int, /) -> int:
+            return value_a - value_b
+
+        assert total(1, 2, start=3) == 12
+        assert difference(5, 3) == 4
+        with pytest.raises(TypeError):
+            difference(value_a=5, value_b=3)  # type: ignore[call-arg]  # pylint: disable=positional-only-arguments-expected
+
+    @staticmethod
+    def test_multiply_method() -> None:
+        """
+        Test that decorated methods are bound to their instance.
+
+        Returns:
+            None
+        """
+
+        class Counter:
+            """Holds a number."""
+
+            def __init__(self, value: int) -> None:
+                self.value = value
+
+            @multiply_decorator(2)
+            def plus(self, value: int) -> int:
+                """Add to the number."""
+                return self.value + value
+
+        assert Counter(1).plus(2) == 6
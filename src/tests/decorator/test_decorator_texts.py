@@ -1,6 +1,22 @@
 """Test decorator module."""
 
-from patterns.decorator.decorator_texts import BoldDecorator, ItalicDecorator
+import asyncio
+import inspect
+from typing import Iterator
+
+import pytest
+
+from patterns.decorator._asyncutil import is_async
+from patterns.decorator.decorator_texts import (
+    AsyncTagDecorator,
+    BoldDecorator,
+    ItalicDecorator,
+    StreamingBoldDecorator,
+    StreamingItalicDecorator,
+    TagDecorator,
+    fuse,
+    fuse_tags,
+)
 
 
 class TextDecorator:
@@ -37,3 +53,213 @@ class TextDecorator:
 
         formatted_greeting = to_be_decorated("John")
         assert formatted_greeting == "<i>Hello, John!</i>"
+
+
+class TestTextDecoratorAsync:
+    """Test decorator module with coroutine functions."""
+
+    @staticmethod
+    def test_sync_stack() -> None:
+        """
+        Test that stacked decorators still wrap a plain function's output synchronously.
+
+        Returns:
+            None
+        """
+
+        @BoldDecorator
+        @ItalicDecorator
+        def to_be_decorated(name: str) -> str:
+            return f"Hello, {name}!"
+
+        assert not is_async(to_be_decorated)
+        assert to_be_decorated("John") == "<b><i>Hello, John!</i></b>"
+
+    @staticmethod
+    def test_async_stack() -> None:
+        """
+        Test that stacked decorators await a coroutine function's output.
+
+        Returns:
+            None
+        """
+
+        @BoldDecorator
+        @ItalicDecorator
+        async def to_be_decorated(name: str) -> str:
+            await asyncio.sleep(0)
+            return f"Hello, {name}!"
+
+        assert is_async(to_be_decorated)
+        assert isinstance(to_be_decorated, AsyncTagDecorator)
+        assert to_be_decorated.tags == ("b",)
+        assert asyncio.run(to_be_decorated("John")) == "<b><i>Hello, John!</i></b>"
+
+
+class TestFusedTagDecorator:
+    """Test fusing stacks of tag decorators."""
+
+    @staticmethod
+    def test_fuse_tags() -> None:
+        """
+        Test that fused decorators format like the equivalent stack.
+
+        Returns:
+            None
+        """
+
+        @fuse_tags(BoldDecorator, ItalicDecorator, BoldDecorator)
+        def to_be_decorated(name: str) -> str:
+            return f"Hello, {name}!"
+
+        assert to_be_decorated.tags == ("b", "i", "b")
+        assert to_be_decorated("John") == "<b><i><b>Hello, John!</b></i></b>"
+
+    @staticmethod
+    def test_fuse_stack() -> None:
+        """
+        Test that an existing stack, including fused parts, is flattened onto the innermost function.
+
+        Returns:
+            None
+        """
+
+        def greet(name: str) -> str:
+            return f"Hello, {name}!"
+
+        stack = BoldDecorator(fuse_tags(ItalicDecorator, BoldDecorator)(ItalicDecorator(greet)))
+        fused = fuse(stack)
+
+        assert fused.tags == ("b", "i", "b", "i")
+        assert fused.__wrapped__ is greet
+        assert fused("John") == stack("John") == "<b><i><b><i>Hello, John!</i></b></i></b>"
+        assert isinstance(fused, TagDecorator)
+
+    @staticmethod
+    def test_fuse_async() -> None:
+        """
+        Test that fusing a stack around a coroutine function stays awaitable.
+
+        Returns:
+            None
+        """
+
+        @BoldDecorator
+        @ItalicDecorator
+        async def to_be_decorated(name: str) -> str:
+            return f"Hello, {name}!"
+
+        fused = fuse(to_be_decorated)
+
+        assert is_async(fused)
+        assert asyncio.run(fused("John")) == "<b><i>Hello, John!</i></b>"
+
+
+class TestStreamingTagDecorator:
+    """Test streaming tag decorators."""
+
+    @staticmethod
+    def test_streaming_stack() -> None:
+        """
+        Test that stacked streaming decorators yield the tags around the chunks.
+
+        Returns:
+            None
+        """
+
+        @StreamingBoldDecorator
+        @StreamingItalicDecorator
+        def to_be_decorated(count: int) -> Iterator[str]:
+            for index in range(count):
+                yield f"{index},"
+
+        assert list(to_be_decorated(3)) == ["<b>", "<i>", "0,", "1,", "2,", "</i>", "</b>"]
+
+    @staticmethod
+    def test_streaming_is_lazy() -> None:
+        """
+        Test that chunks are only produced as the output is consumed.
+
+        Returns:
+            None
+        """
+        produced = []
+
+        def to_be_decorated() -> Iterator[str]:
+            for chunk in ("a", "b"):
+                produced.append(chunk)
+                yield chunk
+
+        stream = StreamingBoldDecorator(to_be_decorated)()
+
+        assert next(stream) == "<b>"
+        assert not produced
+        assert next(stream) == "a"
+        assert produced == ["a"]
+
+    @staticmethod
+    def test_fuse_streaming() -> None:
+        """
+        Test that streaming stacks fuse into a streaming wrapper and cannot be mixed with plain ones.
+
+        Returns:
+            None
+        """
+
+        def to_be_decorated() -> Iterator[str]:
+            yield from ("a", "b")
+
+        fused = fuse(StreamingBoldDecorator(StreamingItalicDecorator(to_be_decorated)))
+
+        assert list(fused()) == ["<b><i>", "a", "b", "</i></b>"]
+        with pytest.raises(TypeError):
+            fuse_tags(BoldDecorator, StreamingItalicDecorator)
+
+
+class TestTagDecoratorWrapping:
+    """Test that tag decorators behave like the functions they wrap."""
+
+    @staticmethod
+    def test_metadata() -> None:
+        """
+        Test that name, docstring, signature and the wrapped function are kept.
+
+        Returns:
+            None
+        """
+
+        def greet(name: str, punctuation: str = "!") -> str:
+            """Greet someone."""
+            return f"Hello, {name}{punctuation}"
+
+        decorated = BoldDecorator(ItalicDecorator(greet))
+
+        assert decorated.__name__ == "greet"
+        assert decorated.__doc__ == "Greet someone."
+        assert inspect.signature(decorated) == inspect.signature(greet)
+        assert inspect.unwrap(decorated) is greet
+        assert decorated("John", "?") == "<b><i>Hello, John?</i></b>"
+
+    @staticmethod
+    def test_method() -> None:
+        """
+        Test that decorated methods are bound to their instance.
+
+        Returns:
+            None
+        """
+
+        class Greeter:  # pylint: disable=too-few-public-methods
+            """Greets by name."""
+
+            def __init__(self, name: str) -> None:
+                self.name = name
+
+            @BoldDecorator
+            @ItalicDecorator
+            def greet(self) -> str:
+                """Greet."""
+                return f"Hello, {self.name}!"
+
+        assert Greeter("John").greet() == "<b><i>Hello, John!</i></b>"
+        assert Greeter.greet(Greeter("Jane")) == "<b><i>Hello, Jane!</i></b>"
@@ -1,9 +1,16 @@
 """Test flyweight module."""
 
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
+from typing import List
 
-from patterns.flyweight.flyweight import CharacterFactory, TextEditorClient
+from patterns.flyweight.flyweight import (
+    CharacterFactory,
+    CharacterFlyweight,
+    TextEditorClient,
+)
 
 
 class TestFlyweightPattern:
@@ -38,6 +45,35 @@ class TestFlyweightPattern:
         assert char_a.char == "A"
         assert char_b.char == "B"
 
+    def test_character_factory_is_thread_safe(self) -> None:
+        """
+        Test that concurrent threads always receive the same instance for a character.
+
+        Returns:
+            None
+        """
+        workers = 16
+        chars = [chr(code_point) for code_point in range(0x4E00, 0x4E00 + 2000)]
+        barrier = threading.Barrier(workers)
+        switch_interval = sys.getswitchinterval()
+
+        def lookup(offset: int) -> List[CharacterFlyweight]:
+            barrier.wait()
+            rotated = chars[offset:] + chars[:offset]
+            flyweights = [CharacterFactory.get_character(char) for char in rotated]
+            return flyweights[-offset:] + flyweights[:-offset] if offset else flyweights
+
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(lookup, range(workers)))
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        for flyweights in results:
+            assert all(flyweight is expected for flyweight, expected in zip(flyweights, results[0]))
+        assert [flyweight.char for flyweight in results[0]] == chars
+
     def test_add_character_to_text_editor(self) -> None:
         """
         Test adding characters to the text editor and using the correct flyweights.
@@ -56,6 +92,24 @@ class TestFlyweightPattern:
         assert editor.characters[2][1] == "Verdana"
         assert editor.characters[0][0] == editor.characters[2][0]
 
+    def test_add_text_matches_add_character(self) -> None:
+        """
+        Test that bulk ingestion stores the same characters as adding them one by one.
+
+        Returns:
+            None
+        """
+        editor = TextEditorClient()
+        bulk = TextEditorClient()
+        for char in "Hello":
+            editor.add_character(char, "Arial")
+        for char in "!":
+            editor.add_character(char, "Verdana")
+
+        bulk.extend([("Hello", "Arial"), ("", "Arial"), ("!", "Verdana")])
+
+        assert bulk.characters == editor.characters
+
     def test_exact_render_output(self) -> None:
         """
         Test the rendering of characters and ensure correct output.
@@ -84,3 +138,25 @@ class TestFlyweightPattern:
             "Character 'A' displayed in font: Verdana\n"
         )
         assert captured_output.getvalue() == expected_output
+
+    def test_render_to_matches_render(self) -> None:
+        """
+        Test that the buffered render mode writes the same output in chunks.
+
+        Returns:
+            None
+        """
+        editor = TextEditorClient()
+        editor.add_text("Hello", "Arial")
+        editor.add_text("World", "Verdana")
+        editor.add_text("!", "Arial")
+
+        captured_output = StringIO()
+        sys.stdout = captured_output
+        editor.render()
+        sys.stdout = sys.__stdout__
+
+        buffered = StringIO()
+        editor.render_to(buffered, chunk_size=2)
+
+        assert buffered.getvalue() == captured_output.getvalue()
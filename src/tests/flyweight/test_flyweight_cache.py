@@ -0,0 +1,114 @@
+"""Test flyweight module."""
+
+import gc
+
+import pytest
+
+from patterns.flyweight.flyweight import CharacterFactory, TextEditorClient
+from patterns.flyweight.flyweight_cache import (
+    BoundedCharacterFactory,
+    LFUPolicy,
+    LRUPolicy,
+    WeakValuePolicy,
+)
+
+
+class TestFlyweightCache:
+    """
+    Test cases for the bounded flyweight factory and its cache policies.
+    """
+
+    def test_factory_reuses_instances_and_counts(self) -> None:
+        """
+        Test that the factory reuses instances and counts hits and misses.
+
+        Returns:
+            None
+        """
+        factory = BoundedCharacterFactory()
+        char_a1 = factory.get_character("A")
+        char_a2 = factory.get_character("A")
+        factory.get_character("B")
+
+        assert char_a1 is char_a2
+        assert factory.stats() == {"hits": 1, "misses": 2, "evictions": 0, "size": 2}
+
+    def test_lru_policy_evicts_least_recently_used(self) -> None:
+        """
+        Test that the LRU policy keeps the capacity and evicts the least recently used entry.
+
+        Returns:
+            None
+        """
+        factory = BoundedCharacterFactory(LRUPolicy(2))
+        char_a = factory.get_character("A")
+        factory.get_character("B")
+        factory.get_character("A")
+        factory.get_character("C")
+
+        assert factory.get_character("A") is char_a
+        assert factory.stats() == {"hits": 2, "misses": 3, "evictions": 1, "size": 2}
+        assert factory.policy.get("B") is None
+
+    def test_lfu_policy_evicts_least_frequently_used(self) -> None:
+        """
+        Test that the LFU policy evicts the entry with the fewest uses.
+
+        Returns:
+            None
+        """
+        factory = BoundedCharacterFactory(LFUPolicy(2))
+        for char in "AAAB":
+            factory.get_character(char)
+        factory.get_character("C")
+
+        assert factory.policy.get("A") is not None
+        assert factory.policy.get("B") is None
+        assert factory.policy.get("C") is not None
+        assert factory.stats()["evictions"] == 1
+
+    def test_weak_value_policy_drops_unreferenced_flyweights(self) -> None:
+        """
+        Test that the weak value policy only keeps flyweights that are still referenced.
+
+        Returns:
+            None
+        """
+        factory = BoundedCharacterFactory(WeakValuePolicy())
+        char_a = factory.get_character("A")
+        factory.get_character("B")
+        gc.collect()
+
+        assert factory.get_character("A") is char_a
+        assert factory.stats() == {"hits": 1, "misses": 2, "evictions": 1, "size": 1}
+
+    def test_policies_reject_capacity_below_one(self) -> None:
+        """
+        Test that bounded policies need room for at least one flyweight.
+
+        Returns:
+            None
+        """
+        for policy in (LRUPolicy, LFUPolicy):
+            with pytest.raises(ValueError):
+                policy(0)
+
+    def test_editors_use_installed_bounded_factory(self) -> None:
+        """
+        Test that editors get their flyweights from the bounded factory installed on CharacterFactory.
+
+        Returns:
+            None
+        """
+        factory = BoundedCharacterFactory(LRUPolicy(2))
+        CharacterFactory.use_cache(factory)
+        try:
+            editor = TextEditorClient()
+            for char in "abca":
+                editor.add_character(char, "Arial")
+        finally:
+            CharacterFactory.use_cache(None)
+
+        assert not CharacterFactory.characters
+        assert factory.stats()["size"] == 2
+        assert factory.stats()["misses"] == 4
@@ -0,0 +1,134 @@
+"""Test flyweight module."""
+
+import sys
+from contextlib import redirect_stdout
+from io import StringIO
+
+import pytest
+
+from patterns.flyweight.flyweight import CharacterFactory, TextEditorClient
+from patterns.flyweight.flyweight_compact import (
+    CompactTextEditorClient,
+    FontRuns,
+    FontTable,
+)
+
+
+class TestFlyweightCompact:
+    """
+    Test cases for the compact text storage.
+    """
+
+    def test_font_table_interns_fonts(self) -> None:
+        """
+        Test that every font gets exactly one id.
+
+        Returns:
+            None
+        """
+        fonts = FontTable()
+
+        assert fonts.intern("Arial") == 0
+        assert fonts.intern("Verdana") == 1
+        assert fonts.intern("Arial") == 0
+        assert fonts[1] == "Verdana"
+        assert len(fonts) == 2
+
+    def test_font_runs_merge_consecutive_fonts(self) -> None:
+        """
+        Test that consecutive characters in one font share a run and lookups find the right run.
+
+        Returns:
+            None
+        """
+        runs = FontRuns()
+        runs.append(0, 3)
+        runs.append(0)
+        runs.append(1, 2)
+        runs.append(0)
+
+        assert len(runs) == 3
+        assert list(runs) == [(0, 4, 0), (4, 6, 1), (6, 7, 0)]
+        assert [runs.font_id_at(position) for position in range(7)] == [0, 0, 0, 0, 1, 1, 0]
+        with pytest.raises(IndexError):
+            runs.font_id_at(7)
+
+    def test_add_character_to_text_editor(self) -> None:
+        """
+        Test adding characters to the text editor and using the correct flyweights.
+
+        Returns:
+            None
+        """
+        editor = CompactTextEditorClient()
+        editor.add_character("A", "Arial")
+        editor.add_character("B", "Times New Roman")
+        editor.add_character("A", "Verdana")
+
+        assert len(editor) == 3
+        assert editor[0][1] == "Arial"
+        assert editor[-1][1] == "Verdana"
+        assert editor[0][0] is editor[2][0] is CharacterFactory.get_character("A")
+        assert len(editor.fonts) == 3
+
+    def test_add_text_matches_add_character(self) -> None:
+        """
+        Test that bulk ingestion stores the same text and runs as adding characters one by one.
+
+        Returns:
+            None
+        """
+        editor = CompactTextEditorClient()
+        bulk = CompactTextEditorClient()
+        for char in "Hello":
+            editor.add_character(char, "Arial")
+        for char in "€😀":
+            editor.add_character(char, "Verdana")
+
+        bulk.extend([("Hel", "Arial"), ("", "Verdana"), ("lo", "Arial"), ("€😀", "Verdana")])
+
+        assert bulk.code_points == editor.code_points
+        assert list(bulk.runs) == list(editor.runs) == [(0, 5, 0), (5, 7, 1)]
+        assert bulk[6][0] is CharacterFactory.get_character("😀")
+
+    def test_render_output_matches_text_editor_client(self) -> None:
+        """
+        Test that rendering produces the same output as the list-based editor.
+
+        Returns:
+            None
+        """
+        editor = TextEditorClient()
+        compact = CompactTextEditorClient()
+        for char, font in [("A", "Arial"), ("B", "Times New Roman"), ("A", "Verdana"), ("€", "Arial")]:
+            editor.add_character(char, font)
+            compact.add_character(char, font)
+
+        captured_output = StringIO()
+        sys.stdout = captured_output
+        editor.render()
+        expected_output = captured_output.getvalue()
+        captured_output.truncate(0)
+        captured_output.seek(0)
+        compact.render()
+        sys.stdout = sys.__stdout__
+
+        assert captured_output.getvalue() == expected_output
+
+    def test_render_to_matches_render(self) -> None:
+        """
+        Test that the buffered render mode writes the same output in chunks.
+
+        Returns:
+            None
+        """
+        editor = CompactTextEditorClient()
+        editor.extend([("Hello", "Arial"), ("Wörld", "Verdana"), ("!", "Arial")])
+
+        printed = StringIO()
+        with redirect_stdout(printed):
+            editor.render()
+        buffered = StringIO()
+        editor.render_to(buffered, chunk_size=2)
+
+        assert buffered.getvalue() == printed.getvalue()
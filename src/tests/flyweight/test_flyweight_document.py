@@ -0,0 +1,118 @@
+"""Test flyweight module."""
+
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+from patterns.flyweight.flyweight import CharacterFactory
+from patterns.flyweight.flyweight_compact import CompactTextEditorClient
+from patterns.flyweight.flyweight_document import MappedDocument, save_document
+
+
+@pytest.fixture(name="editor")
+def fixture_editor() -> CompactTextEditorClient:
+    """
+    Editor holding a small document in three runs.
+
+    Returns:
+        CompactTextEditorClient
+    """
+    editor = CompactTextEditorClient()
+    editor.extend([("Hello ", "Arial"), ("Wörld", "Times New Roman"), ("!😀", "Arial")])
+    return editor
+
+
+class TestFlyweightDocument:
+    """
+    Test cases for the memory-mapped document format.
+    """
+
+    def test_round_trip(self, editor: CompactTextEditorClient, tmp_path: Path) -> None:
+        """
+        Test that a saved document reads back the same text and fonts.
+
+        Returns:
+            None
+        """
+        path = str(tmp_path / "doc.flyw")
+        save_document(editor, path)
+
+        with MappedDocument(path) as document:
+            assert len(document) == len(editor) == 13
+            assert document.text() == "Hello Wörld!😀"
+            assert document.text(6, 11) == "Wörld"
+            assert document.fonts == ["Arial", "Times New Roman"]
+            assert [document.font_at(position) for position in range(len(document))] == [
+                editor.font_at(position) for position in range(len(editor))
+            ]
+            assert document[-1] == (CharacterFactory.get_character("😀"), "Arial")
+
+    def test_render_slice(self, editor: CompactTextEditorClient, tmp_path: Path) -> None:
+        """
+        Test that rendering a slice writes the matching part of the full output.
+
+        Returns:
+            None
+        """
+        path = str(tmp_path / "doc.flyw")
+        save_document(editor, path)
+        full = StringIO()
+        editor.render_to(full)
+        lines = full.getvalue().splitlines(keepends=True)
+
+        with MappedDocument(path) as document:
+            assert list(document.runs(4, 12)) == [(4, 6, "Arial"), (6, 11, "Times New Roman"), (11, 12, "Arial")]
+            rendered = StringIO()
+            document.render_to(rendered, 4, 12, chunk_size=3)
+
+        assert rendered.getvalue() == "".join(lines[4:12])
+
+    def test_empty_document(self, tmp_path: Path) -> None:
+        """
+        Test that an empty document can be saved and opened.
+
+        Returns:
+            None
+        """
+        path = str(tmp_path / "empty.flyw")
+        save_document(CompactTextEditorClient(), path)
+
+        with MappedDocument(path) as document:
+            assert len(document) == 0
+            assert document.text() == ""
+            assert not list(document.runs())
+
+    def test_rejects_other_files(self, tmp_path: Path) -> None:
+        """
+        Test that files in another format are rejected.
+
+        Returns:
+            None
+        """
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"\0" * 64)
+
+        with pytest.raises(ValueError):
+            MappedDocument(str(path))
+
+    def test_rejects_truncated_files(self, editor: CompactTextEditorClient, tmp_path: Path) -> None:
+        """
+        Test that truncated documents are rejected with a ValueError.
+
+        Returns:
+            None
+        """
+        path = tmp_path / "document.flyw"
+        save_document(editor, str(path))
+        data = path.read_bytes()
+
+        for cut in (1, 10, len(data) // 2):
+            path.write_bytes(data[:-cut])
+            with pytest.raises(ValueError, match="truncated"):
+                MappedDocument(str(path))
+
+        for length in (10, 23):
+            path.write_bytes(data[:length])
+            with pytest.raises(ValueError, match="truncated inside its header"):
+                MappedDocument(str(path))
@@ -0,0 +1,122 @@
+"""Test flyweight module."""
+
+import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from patterns.flyweight.flyweight_pool import FlyweightPool
+
+
+@dataclass(frozen=True)
+class Record:
+    """Immutable record supporting weak references."""
+
+    country: str
+    status: str
+
+
+class TestFlyweightPool:
+    """
+    Test cases for the generic flyweight pool.
+    """
+
+    def test_intern_returns_canonical_instance(self) -> None:
+        """
+        Test that equal values are replaced by the first instance.
+
+        Returns:
+            None
+        """
+        pool: FlyweightPool[Tuple[str, int]] = FlyweightPool()
+        first = ("".join(["D", "E"]), 1)
+        second = ("".join(["D", "E"]), 1)
+
+        assert first is not second
+        assert pool.intern(first) is first
+        assert pool.intern(second) is first
+        assert pool.stats() == {"hits": 1, "misses": 1, "strong": 1, "weak": 0}
+
+    def test_weak_values_are_released(self) -> None:
+        """
+        Test that weakly referenceable values leave the pool when they are no longer used.
+
+        Returns:
+            None
+        """
+        pool: FlyweightPool[Record] = FlyweightPool()
+        kept = pool.intern(Record("DE", "active"))
+        pool.intern(Record("FR", "inactive"))
+        gc.collect()
+
+        assert pool.intern(Record("DE", "active")) is kept
+        assert len(pool) == 1
+        assert pool.stats()["weak"] == 1
+
+    def test_strong_pool_keeps_values(self) -> None:
+        """
+        Test that a strong pool keeps values without other references.
+
+        Returns:
+            None
+        """
+        pool: FlyweightPool[Record] = FlyweightPool(weak=False)
+        pool.intern(Record("FR", "inactive"))
+        gc.collect()
+
+        assert len(pool) == 1
+
+    def test_intern_is_thread_safe(self) -> None:
+        """
+        Test that concurrent threads receive the same canonical instance.
+
+        Returns:
+            None
+        """
+        pool: FlyweightPool[Tuple[int, str]] = FlyweightPool(shards=4)
+        workers = 8
+        barrier = threading.Barrier(workers)
+
+        def intern_all(_: int) -> List[Tuple[int, str]]:
+            barrier.wait()
+            return [pool.intern((number, str(number))) for number in range(1000)]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(intern_all, range(workers)))
+
+        for values in results:
+            assert all(value is expected for value, expected in zip(values, results[0]))
+        assert pool.stats()["misses"] == 1000
+
+    def test_equal_values_of_different_types_stay_apart(self) -> None:
+        """
+        Test that equal values of different types, also inside tuples, get their own instances.
+
+        Returns:
+            None
+        """
+        pool: FlyweightPool[Tuple[float, str]] = FlyweightPool()
+        flag = (True, "a")
+        number = (1.0, "a")
+
+        assert pool.intern(flag) is flag
+        assert pool.intern(number) is number
+        assert pool.intern((1.0, "a")) is number
+
+        untyped: FlyweightPool[Tuple[float, str]] = FlyweightPool(typed=False)
+        assert untyped.intern(flag) is flag
+        assert untyped.intern(number) is flag
+
+    def test_intern_none(self) -> None:
+        """
+        Test that None is interned like any other value.
+
+        Returns:
+            None
+        """
+        pool: FlyweightPool[None] = FlyweightPool()
+
+        assert pool.intern(None) is None
+        assert pool.intern(None) is None
+        assert pool.stats() == {"hits": 1, "misses": 1, "strong": 1, "weak": 0}
@@ -0,0 +1,154 @@
+"""Test proxy module."""
+
+import asyncio
+from typing import Hashable, List, Sequence, Tuple, Union
+
+import pytest
+
+from patterns.proxy.proxy import Subject
+from patterns.proxy.proxy_async import AsyncBatchingProxy
+
+
+# pylint: disable=too-few-public-methods
+class RecordingBackend:
+    """Batch function recording every backend call."""
+
+    def __init__(self) -> None:
+        """
+        Initialize the backend without calls.
+        """
+        self.batches: List[List[Tuple[Hashable, ...]]] = []
+
+    async def __call__(self, keys: List[Tuple[Hashable, ...]]) -> Sequence[Union[str, Exception]]:
+        """
+        Answer a batch, failing requests for negative numbers.
+
+        Args:
+            keys: Request arguments
+
+        Returns:
+            list: One result per request
+        """
+        self.batches.append(keys)
+        await asyncio.sleep(0)
+        return [ValueError(key) if key[0] < 0 else f"result {key[0]}" for key in keys]
+
+
+class TestAsyncBatchingProxy:
+    """Test asyncio batching proxy module."""
+
+    @staticmethod
+    def test_coalesces_and_batches() -> None:
+        """
+        Test that identical requests are coalesced and distinct ones share one backend call.
+
+        Returns:
+            None
+        """
+        backend = RecordingBackend()
+        proxy = AsyncBatchingProxy(backend)
+
+        async def main() -> List[str]:
+            return await asyncio.gather(*(proxy.do_action(index % 5) for index in range(50)))
+
+        results = asyncio.run(main())
+
+        assert results == [f"result {index % 5}" for index in range(50)]
+        assert backend.batches == [[(0,), (1,), (2,), (3,), (4,)]]
+        assert proxy.stats() == {
+            "requests": 50,
+            "coalesced": 45,
+            "batches": 1,
+            "backend_requests": 5,
+            "mean_batch_size": 5.0,
+        }
+
+    @staticmethod
+    def test_max_batch_size() -> None:
+        """
+        Test that batches are split at the maximum batch size.
+
+        Returns:
+            None
+        """
+        backend = RecordingBackend()
+        proxy = AsyncBatchingProxy(backend, max_batch_size=4)
+
+        async def main() -> List[str]:
+            return await asyncio.gather(*(proxy.do_action(index) for index in range(10)))
+
+        asyncio.run(main())
+
+        assert [len(batch) for batch in backend.batches] == [4, 4, 2]
+
+    @staticmethod
+    def test_errors() -> None:
+        """
+        Test that a per-request error fails only that request and a backend error fails the batch.
+
+        Returns:
+            None
+        """
+        backend = RecordingBackend()
+        proxy = AsyncBatchingProxy(backend)
+
+        async def partial() -> List[Union[str, BaseException]]:
+            return await asyncio.gather(proxy.do_action(1), proxy.do_action(-1), return_exceptions=True)
+
+        first, second = asyncio.run(partial())
+        assert first == "result 1"
+        assert isinstance(second, ValueError)
+
+        async def broken_backend(_keys: List[Tuple[Hashable, ...]]) -> Sequence[str]:
+            return []
+
+        broken = AsyncBatchingProxy(broken_backend)
+        with pytest.raises(ValueError):
+            asyncio.run(broken.do_action(1))
+
+    @staticmethod
+    def test_from_subject(real_subject: Subject) -> None:
+        """
+        Test that a synchronous subject can serve as backend.
+
+        Args:
+            real_subject: RealSubject
+
+        Returns:
+            None
+        """
+        proxy = AsyncBatchingProxy.from_subject(real_subject)
+
+        async def main() -> List[str]:
+            return await asyncio.gather(*(proxy.do_action() for _ in range(3)))
+
+        assert asyncio.run(main()) == ["RealSubject: Handling request."] * 3
+        assert proxy.stats()["backend_requests"] == 1
+
+    @staticmethod
+    def test_cancelled_dispatch_releases_requests() -> None:
+        """
+        Test that cancelling a batch in flight cancels its requests and forgets them.
+
+        Returns:
+            None
+        """
+        started = asyncio.Event()
+
+        async def slow_backend(keys: List[Tuple[Hashable, ...]]) -> Sequence[str]:
+            started.set()
+            await asyncio.sleep(10)
+            return [str(key) for key in keys]
+
+        proxy = AsyncBatchingProxy(slow_backend, max_delay=0)
+
+        async def main() -> None:
+            request = asyncio.ensure_future(proxy.do_action(1))
+            await started.wait()
+            for task in list(proxy._tasks):  # pylint: disable=protected-access
+                task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await request
+            assert not proxy._pending  # pylint: disable=protected-access
+
+        asyncio.run(main())
@@ -0,0 +1,271 @@
+"""Test proxy module."""
+
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+from patterns.proxy.proxy import Subject
+from patterns.proxy.proxy_caching import CachingProxy, FIFOEviction, LRUEviction
+
+
+# pylint: disable=too-few-public-methods
+class CountingSubject(Subject):
+    """Subject echoing its arguments and recording every real request."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        """
+        Initialize the subject.
+
+        Args:
+            delay: Seconds each request takes
+            fail: Raise ValueError instead of answering
+        """
+        self.calls: List[tuple] = []
+        self._delay = delay
+        self._fail = fail
+        self._lock = threading.Lock()
+
+    def do_action(self, *args: object) -> str:
+        """
+        Record the request and answer it.
+
+        Args:
+            *args: Request arguments
+
+        Returns:
+            String
+        """
+        with self._lock:
+            self.calls.append(args)
+        time.sleep(self._delay)
+        if self._fail:
+            raise ValueError(f"cannot handle {args}")
+        return f"RealSubject: Handling {args}."
+
+
+class HttpError(Exception):
+    """Exception whose constructor takes more than one argument."""
+
+    def __init__(self, status: int, message: str) -> None:
+        """
+        Initialize the error.
+
+        Args:
+            status: HTTP status code
+            message: Error message
+        """
+        super().__init__(f"{status} {message}")
+        self.status = status
+
+
+class TestCachingProxy:
+    """Test caching proxy module."""
+
+    @staticmethod
+    def test_real_subject(real_subject: Subject) -> None:
+        """
+        Test that the proxy answers like the real subject and caches the answer.
+
+        Args:
+            real_subject: RealSubject
+
+        Returns:
+            None
+        """
+        proxy = CachingProxy(real_subject)
+
+        assert proxy.do_action() == proxy.do_action() == "RealSubject: Handling request."
+        assert proxy.stats() == {
+            "hits": 1,
+            "negative_hits": 0,
+            "misses": 1,
+            "coalesced": 0,
+            "expirations": 0,
+            "evictions": 0,
+            "size": 1,
+            "hit_rate": 0.5,
+        }
+
+    @staticmethod
+    def test_keyed_by_arguments() -> None:
+        """
+        Test that each distinct set of arguments is requested once and can be invalidated.
+
+        Returns:
+            None
+        """
+        subject = CountingSubject()
+        proxy = CachingProxy(subject)
+
+        for _ in range(3):
+            assert proxy.do_action(1) == "RealSubject: Handling (1,)."
+            assert proxy.do_action(2) == "RealSubject: Handling (2,)."
+        proxy.invalidate(1)
+        proxy.do_action(1)
+
+        assert subject.calls == [(1,), (2,), (1,)]
+
+    @staticmethod
+    def test_eviction_policies() -> None:
+        """
+        Test that LRU keeps recently used entries while FIFO evicts the oldest one.
+
+        Returns:
+            None
+        """
+        lru_subject, fifo_subject = CountingSubject(), CountingSubject()
+        lru = CachingProxy(lru_subject, policy=LRUEviction(2))
+        fifo = CachingProxy(fifo_subject, policy=FIFOEviction(2))
+        for key in (1, 2, 1, 3, 1):
+            lru.do_action(key)
+            fifo.do_action(key)
+
+        assert lru_subject.calls == [(1,), (2,), (3,)]
+        assert lru.stats()["evictions"] == 1
+        assert fifo_subject.calls == [(1,), (2,), (3,), (1,)]
+        assert fifo.stats()["evictions"] == 2
+
+    @staticmethod
+    def test_ttl() -> None:
+        """
+        Test that results are requested again once they expired.
+
+        Returns:
+            None
+        """
+        now = [0.0]
+        subject = CountingSubject()
+        proxy = CachingProxy(subject, ttl=10, clock=lambda: now[0])
+
+        proxy.do_action()
+        now[0] = 9.0
+        proxy.do_action()
+        now[0] = 10.0
+        proxy.do_action()
+
+        assert len(subject.calls) == 2
+        assert proxy.stats()["expirations"] == 1
+
+    @staticmethod
+    def test_negative_caching() -> None:
+        """
+        Test that exceptions are cached only when a negative TTL is set.
+
+        Returns:
+            None
+        """
+        now = [0.0]
+        subject = CountingSubject(fail=True)
+        proxy = CachingProxy(subject, negative_ttl=5, clock=lambda: now[0])
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                proxy.do_action()
+        now[0] = 5.0
+        with pytest.raises(ValueError):
+            proxy.do_action()
+
+        assert len(subject.calls) == 2
+        assert proxy.stats()["negative_hits"] == 2
+
+        with pytest.raises(ValueError) as first:
+            proxy.do_action()
+        first_depth = len(traceback.extract_tb(first.value.__traceback__))
+        with pytest.raises(ValueError) as second:
+            proxy.do_action()
+        assert len(traceback.extract_tb(second.value.__traceback__)) == first_depth
+        assert len(subject.calls) == 2
+
+        uncached = CachingProxy(subject)
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                uncached.do_action()
+        assert len(subject.calls) == 4
+
+    @staticmethod
+    def test_negative_caching_of_multi_argument_exceptions() -> None:
+        """
+        Test that exceptions with several constructor arguments are cached and raised again as they are.
+
+        Returns:
+            None
+        """
+        calls: List[int] = []
+
+        class FailingSubject(Subject):
+            """Subject failing with an HttpError."""
+
+            def do_action(self) -> str:
+                calls.append(1)
+                raise HttpError(503, "unavailable")
+
+        proxy = CachingProxy(FailingSubject(), negative_ttl=5)
+        for _ in range(3):
+            with pytest.raises(HttpError) as error:
+                proxy.do_action()
+            assert error.value.status == 503
+
+        assert len(calls) == 1
+        assert proxy.stats()["negative_hits"] == 2
+
+    @staticmethod
+    def test_policies_reject_capacity_below_one() -> None:
+        """
+        Test that eviction policies need room for at least one entry.
+
+        Returns:
+            None
+        """
+        for policy in (FIFOEviction, LRUEviction):
+            with pytest.raises(ValueError):
+                policy(0)
+
+    @staticmethod
+    def test_base_exception_releases_key() -> None:
+        """
+        Test that a KeyboardInterrupt in the real subject does not leave the key blocked.
+
+        Returns:
+            None
+        """
+
+        # pylint: disable=too-few-public-methods
+        class InterruptedSubject(CountingSubject):
+            """Subject interrupted on its first request."""
+
+            def do_action(self, *args: object) -> str:
+                if not self.calls:
+                    self.calls.append(args)
+                    raise KeyboardInterrupt
+                return super().do_action(*args)
+
+        subject = InterruptedSubject()
+        proxy = CachingProxy(subject, negative_ttl=60)
+
+        with pytest.raises(KeyboardInterrupt):
+            proxy.do_action(1)
+        assert proxy.do_action(1) == "RealSubject: Handling (1,)."
+
+    @staticmethod
+    def test_single_flight() -> None:
+        """
+        Test that concurrent misses for one key make a single real request.
+
+        Returns:
+            None
+        """
+        subject = CountingSubject(delay=0.1)
+        proxy = CachingProxy(subject)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: proxy.do_action("key"), range(8)))
+
+        assert results == ["RealSubject: Handling ('key',)."] * 8
+        assert subject.calls == [("key",)]
+        stats = proxy.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] + stats["coalesced"] == 7
@@ -0,0 +1,141 @@
+"""Test proxy module."""
+
+import logging
+from typing import List, Set, Tuple
+
+import pytest
+
+from patterns.proxy.proxy import Subject
+from patterns.proxy.proxy_protection import (
+    ACCESS_LOGGER,
+    AccessPolicy,
+    ProtectionProxy,
+    defer_logging,
+)
+
+
+class RecordingHandler(logging.Handler):
+    """Handler keeping the formatted messages."""
+
+    def __init__(self) -> None:
+        """
+        Initialize the handler without messages.
+        """
+        super().__init__()
+        self.messages: List[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Keep the formatted message.
+
+        Args:
+            record: Log record
+
+        Returns:
+            None
+        """
+        self.messages.append(self.format(record))
+
+
+class TestProtectionProxy:
+    """Test protection proxy module."""
+
+    @staticmethod
+    def test_access(real_subject: Subject) -> None:
+        """
+        Test that allowed principals are forwarded and others get a PermissionError.
+
+        Args:
+            real_subject: RealSubject
+
+        Returns:
+            None
+        """
+        policy = AccessPolicy(lambda principal, operation: principal == "admin")
+
+        assert ProtectionProxy(real_subject, policy, "admin").do_action() == "RealSubject: Handling request."
+        with pytest.raises(PermissionError):
+            ProtectionProxy(real_subject, policy, "guest").do_action()
+
+    @staticmethod
+    def test_decisions_are_cached() -> None:
+        """
+        Test that rules are consulted once per principal and operation until invalidated.
+
+        Returns:
+            None
+        """
+        granted: Set[Tuple[str, str]] = {("alice", "read")}
+        consulted: List[Tuple[str, str]] = []
+
+        def rules(principal: str, operation: str) -> bool:
+            consulted.append((principal, operation))
+            return (principal, operation) in granted
+
+        policy = AccessPolicy(rules)
+        for _ in range(3):
+            assert policy.is_allowed("alice", "read")
+            assert not policy.is_allowed("bob", "read")
+        assert consulted == [("alice", "read"), ("bob", "read")]
+
+        granted.add(("bob", "read"))
+        policy.invalidate("bob")
+
+        assert policy.is_allowed("bob", "read")
+        assert policy.is_allowed("alice", "read")
+        assert consulted == [("alice", "read"), ("bob", "read"), ("bob", "read")]
+
+        policy.invalidate()
+        policy.is_allowed("alice", "read")
+        assert len(consulted) == 4
+
+    @staticmethod
+    def test_deferred_logging(real_subject: Subject) -> None:
+        """
+        Test that access is logged through the queue listener, formatted in the background.
+
+        Args:
+            real_subject: RealSubject
+
+        Returns:
+            None
+        """
+        handler = RecordingHandler()
+        level = ACCESS_LOGGER.level
+        ACCESS_LOGGER.setLevel(logging.INFO)
+        deferred = defer_logging(ACCESS_LOGGER, handler)
+        try:
+            assert not ACCESS_LOGGER.propagate
+            policy = AccessPolicy(lambda principal, operation: principal == "admin")
+            ProtectionProxy(real_subject, policy, "admin").do_action()
+            with pytest.raises(PermissionError):
+                ProtectionProxy(real_subject, policy, "guest").do_action()
+        finally:
+            deferred.stop()
+        try:
+            ProtectionProxy(real_subject, policy, "admin").do_action()
+        finally:
+            ACCESS_LOGGER.setLevel(level)
+
+        assert handler.messages == ["Proxy: admin performed do_action.", "Proxy: Denied do_action to guest."]
+        assert ACCESS_LOGGER.propagate
+        assert not ACCESS_LOGGER.handlers
+
+    @staticmethod
+    def test_stop_deferred_logging_twice() -> None:
+        """
+        Test that stopping a deferral again leaves the logger alone.
+
+        Returns:
+            None
+        """
+        deferred = defer_logging(ACCESS_LOGGER, RecordingHandler())
+        deferred.stop()
+        ACCESS_LOGGER.propagate = False
+        try:
+            deferred.stop()
+
+            assert not ACCESS_LOGGER.propagate
+            assert not ACCESS_LOGGER.handlers
+        finally:
+            ACCESS_LOGGER.propagate = True
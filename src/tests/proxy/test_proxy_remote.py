@@ -0,0 +1,240 @@
+"""Test proxy module."""
+
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
+import pytest
+
+from patterns.proxy.proxy import RealSubject, Subject
+from patterns.proxy.proxy_remote import RemoteError, RemoteProxy, SubjectServer
+
+
+# pylint: disable=too-few-public-methods
+class EchoSubject(Subject):
+    """Subject echoing its arguments, failing for "fail" and sleeping on "sleep"."""
+
+    def do_action(self, *args: object) -> str:
+        """
+        Answer a request.
+
+        Args:
+            *args: Request arguments
+
+        Returns:
+            String
+        """
+        if args == ("fail",):
+            raise ValueError("cannot handle this")
+        if args == ("sleep",):
+            time.sleep(0.5)
+        if args == ("bytes",):
+            return b"not a string"  # type: ignore[return-value]
+        return f"echo {list(args)}"
+
+
+@pytest.fixture(name="socket_path")
+def fixture_socket_path() -> Iterator[str]:
+    """
+    Short socket path in a temporary directory, Unix socket paths are limited to about 100 bytes.
+
+    Returns:
+        str
+    """
+    with tempfile.TemporaryDirectory() as directory:
+        yield os.path.join(directory, "subject.sock")
+
+
+@pytest.fixture(name="server")
+def fixture_server(socket_path: str) -> Iterator[SubjectServer]:
+    """
+    EchoSubject served from a background thread.
+
+    Args:
+        socket_path: Path of the socket
+
+    Returns:
+        SubjectServer
+    """
+    server = SubjectServer(EchoSubject(), socket_path)
+    thread = threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    assert not os.path.exists(socket_path)
+
+
+def serve_real_subject(path: str, ready: "multiprocessing.synchronize.Event") -> None:
+    """
+    Serve a RealSubject until the process is terminated.
+
+    Args:
+        path: Path of the socket
+        ready: Set once the server listens
+
+    Returns:
+        None
+    """
+    with SubjectServer(RealSubject(), path) as server:
+        ready.set()
+        server.serve_forever()
+
+
+class TestRemoteProxy:
+    """Test remote proxy module."""
+
+    @staticmethod
+    def test_other_process(socket_path: str) -> None:
+        """
+        Test that the proxy answers like the real subject served by another process.
+
+        Args:
+            socket_path: Path of the socket
+
+        Returns:
+            None
+        """
+        context = multiprocessing.get_context("fork")
+        ready = context.Event()
+        process = context.Process(target=serve_real_subject, args=(socket_path, ready))
+        process.start()
+        try:
+            assert ready.wait(5)
+            proxy = RemoteProxy(socket_path)
+            assert proxy.do_action() == proxy.do_action() == "RealSubject: Handling request."
+            proxy.close()
+        finally:
+            process.terminate()
+            process.join()
+
+    @staticmethod
+    @pytest.mark.usefixtures("server")
+    def test_arguments_and_pipelining(socket_path: str) -> None:
+        """
+        Test that arguments are forwarded and pipelined responses come back in order.
+
+        Args:
+            socket_path: Path of the socket
+
+        Returns:
+            None
+        """
+        proxy = RemoteProxy(socket_path)
+
+        assert proxy.do_action("a", 1) == "echo ['a', 1]"
+        assert proxy.do_actions([(index,) for index in range(100)]) == [f"echo [{index}]" for index in range(100)]
+        proxy.close()
+
+    @staticmethod
+    @pytest.mark.usefixtures("server")
+    def test_large_batch(socket_path: str) -> None:
+        """
+        Test that a batch much larger than the socket buffers is answered without blocking.
+
+        Args:
+            socket_path: Path of the socket
+
+        Returns:
+            None
+        """
+        proxy = RemoteProxy(socket_path, timeout=10)
+
+        assert proxy.do_actions([()] * 100_000) == ["echo []"] * 100_000
+        proxy.close()
+
+    @staticmethod
+    @pytest.mark.usefixtures("server")
+    def test_invalid_result(socket_path: str) -> None:
+        """
+        Test that a result which is not a string is reported as an error and the connection stays usable.
+
+        Args:
+            socket_path: Path of the socket
+
+        Returns:
+            None
+        """
+        proxy = RemoteProxy(socket_path, pool_size=1)
+
+        with pytest.raises(RemoteError, match="AttributeError"):
+            proxy.do_action("bytes")
+        assert proxy.do_action("a") == "echo ['a']"
+        proxy.close()
+
+    @staticmethod
+    @pytest.mark.usefixtures("server")
+    def test_remote_error(socket_path: str) -> None:
+        """
+        Test that exceptions of the remote subject are raised as RemoteError and the connection stays usable.
+
+        Args:
+            socket_path: Path of the socket
+
+        Returns:
+            None
+        """
+        proxy = RemoteProxy(socket_path, pool_size=1)
+
+        with pytest.raises(RemoteError, match="ValueError: cannot handle this"):
+            proxy.do_action("fail")
+        assert proxy.do_action() == "echo []"
+        proxy.close()
+
+    @staticmethod
+    @pytest.mark.usefixtures("server")
+    def test_pool(socket_path: str) -> None:
+        """
+        Test that concurrent requests share the pooled connections.
+
+        Args:
+            socket_path: Path of the socket
+
+        Returns:
+            None
+        """
+        proxy = RemoteProxy(socket_path, pool_size=2)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(proxy.do_action, range(200)))
+
+        assert results == [f"echo [{index}]" for index in range(200)]
+        assert proxy._idle.qsize() <= 2  # pylint: disable=protected-access
+        proxy.close()
+
+    @staticmethod
+    @pytest.mark.usefixtures("server")
+    def test_timeout(socket_path: str) -> None:
+        """
+        Test that a slow response times out and the broken connection is replaced.
+
+        Args:
+            socket_path: Path of the socket
+
+        Returns:
+            None
+        """
+        proxy = RemoteProxy(socket_path, pool_size=1, timeout=0.1)
+
+        with pytest.raises(TimeoutError):
+            proxy.do_action("sleep")
+        assert proxy.do_action() == "echo []"
+        proxy.close()
+
+    @staticmethod
+    def test_no_server(socket_path: str) -> None:
+        """
+        Test that connecting without a server fails.
+
+        Args:
+            socket_path: Path of the socket
+
+        Returns:
+            None
+        """
+        with pytest.raises(OSError):
+            RemoteProxy(socket_path).do_action()
@@ -0,0 +1,108 @@
+"""Test proxy module."""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+from patterns.proxy.proxy import RealSubject, Subject
+from patterns.proxy.proxy_virtual import VirtualProxy
+
+
+class TestVirtualProxy:
+    """Test virtual proxy module."""
+
+    @staticmethod
+    def test_lazy_construction(real_subject: Subject) -> None:
+        """
+        Test that the real subject is only constructed on the first request.
+
+        Args:
+            real_subject: RealSubject
+
+        Returns:
+            None
+        """
+        built: List[Subject] = []
+
+        def factory() -> Subject:
+            built.append(real_subject)
+            return real_subject
+
+        proxy = VirtualProxy(factory)
+        assert not proxy.is_initialized
+        assert not built
+
+        assert proxy.do_action() == proxy.do_action() == "RealSubject: Handling request."
+        assert proxy.is_initialized
+        assert proxy.real_subject is real_subject
+        assert len(built) == 1
+
+    @staticmethod
+    def test_constructed_once_concurrently() -> None:
+        """
+        Test that concurrent first requests construct the real subject exactly once.
+
+        Returns:
+            None
+        """
+        built: List[Subject] = []
+        barrier = threading.Barrier(8)
+
+        def factory() -> Subject:
+            built.append(RealSubject())
+            return built[-1]
+
+        proxy = VirtualProxy(factory)
+
+        def first_request(_: int) -> str:
+            barrier.wait()
+            return proxy.do_action()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(first_request, range(8)))
+
+        assert results == ["RealSubject: Handling request."] * 8
+        assert len(built) == 1
+
+    @staticmethod
+    def test_failed_construction_is_retried() -> None:
+        """
+        Test that a failing factory is called again by the next request.
+
+        Returns:
+            None
+        """
+        attempts: List[int] = []
+
+        def factory() -> Subject:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise ConnectionError("backend unavailable")
+            return RealSubject()
+
+        proxy = VirtualProxy(factory)
+
+        with pytest.raises(ConnectionError):
+            proxy.do_action()
+        assert proxy.do_action() == "RealSubject: Handling request."
+        assert len(attempts) == 2
+
+    @staticmethod
+    def test_prewarm(real_subject: Subject) -> None:
+        """
+        Test that pre-warming constructs the real subject in the background.
+
+        Args:
+            real_subject: RealSubject
+
+        Returns:
+            None
+        """
+        proxy = VirtualProxy(lambda: real_subject)
+
+        proxy.prewarm().join()
+
+        assert proxy.is_initialized
+        assert proxy.real_subject is real_subject
@@ -0,0 +1,109 @@
+"""Test singleton module."""
+import multiprocessing
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.synchronize import Lock
+from typing import Iterator
+
+import pytest
+
+from patterns.singleton.singleton_borg_shared import SharedBorg, SharedField
+
+
+# pylint: disable=too-few-public-methods
+class Counters(SharedBorg):
+    """Shared state used by the tests."""
+
+    counter = SharedField("q")
+    ratio = SharedField("d")
+    label = SharedField("16s")
+
+
+def increment(name: str, lock: Lock, times: int) -> None:
+    """
+    Worker incrementing the shared counter.
+
+    Args:
+        name: Name of the shared segment
+        lock: Lock guarding the read-modify-write
+        times: Number of increments
+
+    Returns:
+        None
+    """
+    state = Counters(name)
+    for _ in range(times):
+        with lock:
+            state.counter += 1
+
+
+@pytest.fixture(name="counters")
+def fixture_counters() -> Iterator[Counters]:
+    """
+    Fresh shared segment for every test.
+
+    Returns:
+        Counters
+    """
+    yield Counters()
+    Counters.unlink()
+
+
+class TestSingletonBorgShared:
+    """Test singleton module."""
+
+    def test_instances_share_state(self, counters: Counters) -> None:
+        """Test that all instances in a process see the same state.
+
+        Returns:
+            None
+        """
+        other = Counters()
+        counters.counter = 42
+        counters.ratio = 0.5
+        counters.label = b"config"
+
+        assert counters is not other
+        assert other.counter == 42
+        assert other.ratio == 0.5
+        assert other.label == b"config"
+        assert other.as_dict() == {"counter": 42, "ratio": 0.5, "label": b"config"}
+
+    def test_rejects_fields_outside_schema(self, counters: Counters) -> None:
+        """Test that attributes which would not be shared are rejected.
+
+        Returns:
+            None
+        """
+        with pytest.raises(AttributeError):
+            counters.unknown = 1
+
+    def test_rejects_second_segment(self, counters: Counters) -> None:
+        """Test that attaching to another segment is refused while one is attached.
+
+        Returns:
+            None
+        """
+        other = SharedMemory(create=True, size=64)
+        try:
+            assert Counters(counters.name).buffer is counters.buffer
+            with pytest.raises(RuntimeError):
+                Counters(other.name)
+        finally:
+            other.close()
+            other.unlink()
+
+    def test_processes_share_state(self, counters: Counters) -> None:
+        """Test that worker processes update one shared state.
+
+        Returns:
+            None
+        """
+        context = multiprocessing.get_context("fork")
+        lock = context.Lock()
+        workers = [context.Process(target=increment, args=(counters.name, lock, 500)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert counters.counter == 2000
@@ -0,0 +1,111 @@
+"""Test singleton module."""
+import threading
+
+import pytest
+
+from patterns.singleton.singleton_borg_snapshot import SnapshotBorg
+
+
+# pylint: disable=attribute-defined-outside-init,no-member
+class TestSingletonBorgSnapshot:
+    """Test singleton module."""
+
+    def test_instances_share_state(self) -> None:
+        """Test that all instances see the same state.
+
+        Returns:
+            None
+        """
+
+        class Config(SnapshotBorg):
+            """Shared configuration."""
+
+        config1 = Config()
+        config2 = Config()
+
+        config1.x_value = 42
+
+        assert config1 is not config2
+        assert config2.x_value == 42
+
+    def test_snapshots_are_versioned_and_immutable(self) -> None:
+        """Test that a grabbed snapshot is not affected by later writes.
+
+        Returns:
+            None
+        """
+
+        class Config(SnapshotBorg):
+            """Shared configuration."""
+
+        config = Config()
+        config.update(host="a", port=1)
+        before = config.snapshot()
+        config.update(host="b", port=2)
+        after = config.snapshot()
+
+        assert (before.version, before.host, before.port) == (1, "a", 1)
+        assert (after.version, after.host, after.port) == (2, "b", 2)
+        with pytest.raises(AttributeError):
+            before.host = "c"
+        with pytest.raises(AttributeError):
+            _ = after.missing
+
+    def test_no_torn_reads_under_concurrent_writes(self) -> None:
+        """Test that readers always see both values of one update together.
+
+        Returns:
+            None
+        """
+
+        class Pair(SnapshotBorg):
+            """Two values always updated together."""
+
+        pair = Pair()
+        pair.update(left=0, right=0)
+        stop = threading.Event()
+        torn = []
+
+        def writer() -> None:
+            value = 0
+            while not stop.is_set():
+                value += 1
+                pair.update(left=value, right=value)
+
+        def reader() -> None:
+            for _ in range(20_000):
+                snapshot = pair.snapshot()
+                if snapshot.left != snapshot.right:
+                    torn.append(snapshot.version)
+
+        writers = [threading.Thread(target=writer) for _ in range(2)]
+        readers = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in writers + readers:
+            thread.start()
+        for thread in readers:
+            thread.join()
+        stop.set()
+        for thread in writers:
+            thread.join()
+
+        assert not torn
+
+    def test_reserved_names_are_rejected(self) -> None:
+        """Test that state cannot shadow attributes of the Borg or its snapshots.
+
+        Returns:
+            None
+        """
+
+        class Config(SnapshotBorg):
+            """Shared configuration."""
+
+        config = Config()
+
+        for name in ("version", "as_dict", "snapshot", "update"):
+            with pytest.raises(AttributeError):
+                config.update(**{name: 1})
+        with pytest.raises(AttributeError):
+            config.version = 2
+
+        assert config.snapshot().version == 0
@@ -0,0 +1,135 @@
+"""Test singleton module."""
+import asyncio
+from typing import List
+
+import pytest
+
+from patterns.singleton.singleton_registry import AsyncSingleton, SingletonMeta
+
+
+# pylint: disable=too-few-public-methods
+class Service(metaclass=SingletonMeta):
+    """Plain singleton service."""
+
+
+class SubService(Service):
+    """Subclass of the singleton service."""
+
+
+class TestSingletonRegistry:
+    """Test singleton module."""
+
+    def test_uniqueness(self) -> None:
+        """Test that only one instance of the singleton class is created.
+
+        Returns:
+            None
+        """
+        assert Service() is Service()
+
+    def test_subclasses_have_own_instance(self) -> None:
+        """Test that parent and subclass are registered separately.
+
+        Returns:
+            None
+        """
+        sub = SubService()
+        parent = Service()
+
+        assert sub is not parent
+        assert isinstance(sub, SubService)
+        assert not isinstance(parent, SubService)
+        assert SubService() is sub
+
+    def test_concurrent_async_initialization(self) -> None:
+        """Test that concurrent awaiters share one in-flight initialization.
+
+        Returns:
+            None
+        """
+        calls: List[int] = []
+
+        class Connection(AsyncSingleton):
+            """Service with an expensive async setup."""
+
+            async def initialize(self) -> None:
+                await asyncio.sleep(0.01)
+                calls.append(1)
+
+        async def main() -> List[Connection]:
+            return await asyncio.gather(*(Connection.get_instance() for _ in range(50)))
+
+        instances = asyncio.run(main())
+
+        assert len(calls) == 1
+        assert all(instance is instances[0] for instance in instances)
+        assert Connection() is instances[0]
+
+    def test_failed_initialization_is_retried(self) -> None:
+        """Test that a failed initialization is reported and retried on the next access.
+
+        Returns:
+            None
+        """
+        attempts: List[int] = []
+
+        class Flaky(AsyncSingleton):
+            """Service failing on its first initialization."""
+
+            async def initialize(self) -> None:
+                attempts.append(1)
+                if len(attempts) == 1:
+                    raise ConnectionError("backend unavailable")
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(Flaky.get_instance())
+
+        instance = asyncio.run(Flaky.get_instance())
+
+        assert len(attempts) == 2
+        assert instance is Flaky()
+
+    def test_sync_instance_is_initialized_on_first_await(self) -> None:
+        """Test that an instance created by a direct call is still initialized by get_instance.
+
+        Returns:
+            None
+        """
+        calls: List[int] = []
+
+        class Cache(AsyncSingleton):
+            """Service created synchronously before it is awaited."""
+
+            async def initialize(self) -> None:
+                calls.append(1)
+
+        created = Cache()
+        assert not calls
+
+        instance = asyncio.run(Cache.get_instance())
+        again = asyncio.run(Cache.get_instance())
+
+        assert instance is created
+        assert again is created
+        assert len(calls) == 1
+
+    def test_singleton_creating_singleton(self) -> None:
+        """Test that a singleton may create another singleton in its constructor.
+
+        Returns:
+            None
+        """
+
+        class Database(metaclass=SingletonMeta):
+            """Singleton used by another one."""
+
+        class Repository(metaclass=SingletonMeta):
+            """Singleton creating a dependency while it is constructed."""
+
+            def __init__(self) -> None:
+                self.database = Database()
+
+        repository = Repository()
+
+        assert repository.database is Database()
+        assert Repository() is repository
@@ -0,0 +1,78 @@
+"""Test singleton module."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import pytest
+
+from patterns.singleton.singleton_thread_safe import SingletonThreadSafe
+
+
+# pylint: disable=too-few-public-methods
+class TestSingletonThreadSafe:
+    """Test singleton module."""
+
+    def test_raises_runtime_error(self) -> None:
+        """Test that a Runtime Error is raised when trying to instantiate the class.
+
+        Returns:
+            None
+        """
+        with pytest.raises(RuntimeError):
+            SingletonThreadSafe()
+
+    def test_uniqueness(self) -> None:
+        """Test that only one instance of the singleton class is created.
+
+        Returns:
+            None
+        """
+        singleton1 = SingletonThreadSafe.get_instance()
+        singleton2 = SingletonThreadSafe.get_instance()
+
+        assert singleton1 is singleton2
+
+    def test_subclasses_have_own_instance(self) -> None:
+        """Test that a subclass does not reuse the instance of its parent.
+
+        Returns:
+            None
+        """
+
+        class Child(SingletonThreadSafe):
+            """Subclass of the singleton."""
+
+        parent = SingletonThreadSafe.get_instance()
+        child = Child.get_instance()
+
+        assert parent is not child
+        assert isinstance(child, Child)
+        assert child is Child.get_instance()
+
+    def test_concurrent_first_access(self) -> None:
+        """Test that concurrent first access creates and initializes exactly one instance.
+
+        Returns:
+            None
+        """
+        calls: List[int] = []
+        workers = 32
+        barrier = threading.Barrier(workers)
+
+        class Slow(SingletonThreadSafe):
+            """Singleton with an expensive initialization."""
+
+            def _initialize(self) -> None:
+                time.sleep(0.01)
+                calls.append(1)
+
+        def access() -> SingletonThreadSafe:
+            barrier.wait()
+            return Slow.get_instance()
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            instances = list(pool.map(lambda _: access(), range(workers)))
+
+        assert len(calls) == 1
+        assert all(instance is instances[0] for instance in instances)